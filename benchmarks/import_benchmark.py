@@ -0,0 +1,91 @@
+"""
+Client import throughput, compared with one insert per transaction.
+
+Writes a CSV file of generated clients, then imports it into a throwaway SQLite database:
+  - add: one ORM insert, commit and refresh per row, as the `add` command does (on --add-rows rows)
+  - import: crm.helpers.import_helper.ImportHelper with each chunk size
+
+Usage:
+    python benchmarks/import_benchmark.py [--rows 200000] [--add-rows 2000] [--chunk-sizes 100,1000,5000]
+"""
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from crm.models import Base, Role, Collaborator, Client
+from crm.enums.model_type_enum import ModelTypeEnum
+from crm.helpers.import_helper import ImportHelper
+
+FIELDS = ["first_name", "last_name", "email", "phone", "company_name", "commercial_id"]
+
+
+def write_file(path, rows):
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(FIELDS)
+        writer.writerows(
+            ["Client", f"Number {i}", f"client{i}@bench.test", "0102030405", f"Company {i}", 1]
+            for i in range(rows)
+        )
+
+
+def fresh_session(tmp_dir, name):
+    engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, name)}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(Role(id=1, name="Sales"))
+    db.add(Collaborator(id=1, first_name="Bench", last_name="Sales", email="sales@bench.test", password_hash="x", role_id=1))
+    db.commit()
+    return engine, db
+
+
+def bench_add(tmp_dir, rows):
+    engine, db = fresh_session(tmp_dir, "add.db")
+    start = time.perf_counter()
+    for i in range(rows):
+        client = Client(first_name="Client", last_name=f"Number {i}", email=f"client{i}@bench.test",
+                        phone="0102030405", company_name=f"Company {i}", commercial_id=1)
+        db.add(client)
+        db.commit()
+        db.refresh(client)
+    elapsed = time.perf_counter() - start
+    db.close()
+    engine.dispose()
+    return rows / elapsed
+
+
+def bench_import(tmp_dir, file_path, chunk_size):
+    engine, db = fresh_session(tmp_dir, f"import_{chunk_size}.db")
+    imported, rejected, elapsed = ImportHelper(db, ModelTypeEnum.CLIENT, chunk_size).import_file(file_path)
+    db.close()
+    engine.dispose()
+    return imported, rejected, (imported + rejected) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200000, help="Clients in the imported file")
+    parser.add_argument("--add-rows", type=int, default=2000, help="Clients inserted one at a time")
+    parser.add_argument("--chunk-sizes", default="100,1000,5000", help="Comma separated chunk sizes")
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, "clients.csv")
+        write_file(file_path, options.rows)
+
+        print(f"{'method':<20}{'rows':>10}{'rejected':>10}{'rows/s':>12}")
+        print(f"{'add':<20}{options.add_rows:>10}{0:>10}{bench_add(tmp_dir, options.add_rows):>12.0f}")
+        for chunk_size in (int(size) for size in options.chunk_sizes.split(",")):
+            imported, rejected, rate = bench_import(tmp_dir, file_path, chunk_size)
+            print(f"{f'import {chunk_size}':<20}{imported:>10}{rejected:>10}{rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Before/after benchmark of the foreign key and filter column indexes.
+
+Builds a throwaway SQLite database with the legacy schema (no secondary indexes), fills it,
+times the lookups done by the relationship checks and the filters, then applies the
+index migration and times them again.
+
+Usage:
+    python benchmarks/index_benchmark.py [--rows 100000] [--repeat 20]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, text, inspect
+from crm.models import Base, Role, Collaborator, Client, Contract, Event
+from crm.helpers.migration_helper import create_missing_indexes
+
+INDEXED_COLUMNS = {
+    "clients": ["commercial_id"],
+    "contracts": ["client_id", "commercial_id", "is_signed"],
+    "events": ["contract_id", "support_id", "start_date"],
+}
+
+QUERIES = {
+    "clients by commercial_id": "SELECT id FROM clients WHERE commercial_id = :collaborator_id",
+    "client relationship check": "SELECT id FROM clients WHERE id = :client_id AND commercial_id = :collaborator_id",
+    "contracts by client_id": "SELECT id FROM contracts WHERE client_id = :client_id",
+    "contracts by commercial_id": "SELECT id FROM contracts WHERE commercial_id = :collaborator_id",
+    "unsigned contracts": "SELECT COUNT(*) FROM contracts WHERE is_signed = 0",
+    "events by contract_id": "SELECT id FROM events WHERE contract_id = :contract_id",
+    "events by support_id": "SELECT id FROM events WHERE support_id = :collaborator_id",
+    "events by start_date": "SELECT id FROM events WHERE start_date = :start_date",
+}
+
+BATCH_SIZE = 10000
+
+
+def drop_secondary_indexes(engine):
+    """Remove the indexes the migration adds, as in a database created before them."""
+    with engine.begin() as conn:
+        for table_name, columns in INDEXED_COLUMNS.items():
+            for index in inspect(conn).get_indexes(table_name):
+                if index["column_names"][0] in columns:
+                    conn.execute(text(f"DROP INDEX {index['name']}"))
+
+
+def populate(engine, rows):
+    collaborators = max(rows // 500, 10)
+    start = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(Role.__table__.insert(), [
+            {"id": 1, "name": "Sales"}, {"id": 2, "name": "Support"}, {"id": 3, "name": "Management"}
+        ])
+        conn.execute(Collaborator.__table__.insert(), [
+            {"id": i, "first_name": "Bench", "last_name": f"User {i}", "email": f"user{i}@bench.test",
+             "password_hash": "x", "role_id": i % 3 + 1}
+            for i in range(1, collaborators + 1)
+        ])
+        for offset in range(0, rows, BATCH_SIZE):
+            ids = range(offset + 1, min(offset + BATCH_SIZE, rows) + 1)
+            conn.execute(Client.__table__.insert(), [
+                {"id": i, "first_name": "Client", "last_name": str(i), "email": f"client{i}@bench.test",
+                 "phone": "0102030405", "company_name": f"Company {i}", "commercial_id": i % collaborators + 1}
+                for i in ids
+            ])
+            conn.execute(Contract.__table__.insert(), [
+                {"id": i, "client_id": i, "commercial_id": i % collaborators + 1, "costing": 1000.0,
+                 "remaining_due_payment": 500.0, "is_signed": i % 10 != 0}
+                for i in ids
+            ])
+            conn.execute(Event.__table__.insert(), [
+                {"id": i, "name": f"Event {i}", "start_date": start + timedelta(hours=i),
+                 "end_date": start + timedelta(hours=i + 4), "location": "1 Main street, 75000 Paris, France",
+                 "attendees": 50, "notes": "n" * 200, "contract_id": i, "support_id": i % collaborators + 1}
+                for i in ids
+            ])
+    return collaborators
+
+
+def time_queries(engine, rows, collaborators, repeat):
+    """Returns the median duration in milliseconds of each query, with random parameters."""
+    rng = random.Random(12)
+    results = {}
+    with engine.connect() as conn:
+        for name, sql in QUERIES.items():
+            durations = []
+            for _ in range(repeat):
+                item_id = rng.randint(1, rows)
+                params = {
+                    "collaborator_id": rng.randint(1, collaborators),
+                    "client_id": item_id,
+                    "contract_id": item_id,
+                    "start_date": datetime(2025, 1, 1) + timedelta(hours=item_id),
+                }
+                start = time.perf_counter()
+                conn.execute(text(sql), params).fetchall()
+                durations.append((time.perf_counter() - start) * 1000)
+            results[name] = statistics.median(durations)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000, help="Clients, contracts and events to create")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query")
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        drop_secondary_indexes(engine)
+
+        print(f"📌 Inserting {options.rows} clients, contracts and events...")
+        collaborators = populate(engine, options.rows)
+
+        before = time_queries(engine, options.rows, collaborators, options.repeat)
+        start = time.perf_counter()
+        created = create_missing_indexes(engine)
+        migration_ms = (time.perf_counter() - start) * 1000
+        after = time_queries(engine, options.rows, collaborators, options.repeat)
+        engine.dispose()
+
+    print(f"✅ Migration created {len(created)} indexes in {migration_ms:.0f} ms: {', '.join(created)}")
+    print(f"{'query':<30}{'before ms':>12}{'after ms':>12}{'speedup':>10}")
+    for name in QUERIES:
+        speedup = before[name] / after[name] if after[name] else float("inf")
+        print(f"{name:<30}{before[name]:>12.3f}{after[name]:>12.3f}{speedup:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
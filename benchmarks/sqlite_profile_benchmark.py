@@ -0,0 +1,125 @@
+"""
+Read and write throughput of each SQLite tuning profile.
+
+For every profile of crm.database.SQLITE_PROFILES, a throwaway database file is created and:
+  - writes: clients inserted one per transaction, like the `add` commands do
+  - lookups: random clients fetched by id
+  - scan: every client read back
+  - concurrent: reader threads and a writer thread working for a few seconds, counting
+    the operations that failed with "database is locked"
+
+Usage:
+    python benchmarks/sqlite_profile_benchmark.py [--rows 5000] [--lookups 20000] [--seconds 3]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from crm.models import Base, Client
+from crm.database import SQLITE_PROFILES, apply_sqlite_profile
+
+READER_THREADS = 4
+
+
+def client_row(i):
+    return {"first_name": "Client", "last_name": str(i), "email": f"client{i}@bench.test",
+            "phone": "0102030405", "company_name": f"Company {i}"}
+
+
+def bench_writes(engine, rows):
+    start = time.perf_counter()
+    for i in range(rows):
+        with engine.begin() as conn:
+            conn.execute(Client.__table__.insert(), client_row(i))
+    return rows / (time.perf_counter() - start)
+
+
+def bench_lookups(engine, rows, lookups):
+    rng = random.Random(12)
+    start = time.perf_counter()
+    with engine.connect() as conn:
+        for _ in range(lookups):
+            conn.execute(text("SELECT * FROM clients WHERE id = :id"), {"id": rng.randint(1, rows)}).fetchone()
+    return lookups / (time.perf_counter() - start)
+
+
+def bench_scan(engine, rows):
+    start = time.perf_counter()
+    with engine.connect() as conn:
+        count = len(conn.execute(text("SELECT * FROM clients")).fetchall())
+    return count / (time.perf_counter() - start)
+
+
+def bench_concurrency(engine, rows, seconds):
+    """Returns (reads, writes, locked errors) done by the threads during the given time."""
+    stop_at = time.perf_counter() + seconds
+    counters = {"reads": 0, "writes": 0, "locked": 0}
+    lock = threading.Lock()
+
+    def count(key):
+        with lock:
+            counters[key] += 1
+
+    def reader():
+        rng = random.Random()
+        while time.perf_counter() < stop_at:
+            try:
+                with engine.connect() as conn:
+                    conn.execute(text("SELECT * FROM clients WHERE id = :id"), {"id": rng.randint(1, rows)}).fetchone()
+                count("reads")
+            except OperationalError:
+                count("locked")
+
+    def writer():
+        i = rows
+        while time.perf_counter() < stop_at:
+            i += 1
+            try:
+                with engine.begin() as conn:
+                    conn.execute(Client.__table__.insert(), client_row(i))
+                count("writes")
+            except OperationalError:
+                count("locked")
+
+    threads = [threading.Thread(target=reader) for _ in range(READER_THREADS)] + [threading.Thread(target=writer)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return counters["reads"], counters["writes"], counters["locked"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000, help="Clients inserted one transaction at a time")
+    parser.add_argument("--lookups", type=int, default=20000, help="Random lookups by id")
+    parser.add_argument("--seconds", type=float, default=3, help="Duration of the concurrent phase")
+    options = parser.parse_args()
+
+    print(f"{'profile':<14}{'writes/s':>10}{'lookups/s':>12}{'scan rows/s':>14}{'conc. reads':>13}{'conc. writes':>14}{'locked':>8}")
+    for profile_name in SQLITE_PROFILES:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Python's driver retries locks for 5 s by default, disable it so only the profile decides
+            engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}", connect_args={"timeout": 0})
+            apply_sqlite_profile(engine, profile_name)
+            Base.metadata.create_all(engine)
+
+            writes = bench_writes(engine, options.rows)
+            lookups = bench_lookups(engine, options.rows, options.lookups)
+            scan = bench_scan(engine, options.rows)
+            reads, concurrent_writes, locked = bench_concurrency(engine, options.rows, options.seconds)
+            engine.dispose()
+
+        print(f"{profile_name:<14}{writes:>10.0f}{lookups:>12.0f}{scan:>14.0f}{reads:>13}{concurrent_writes:>14}{locked:>8}")
+
+
+if __name__ == "__main__":
+    main()
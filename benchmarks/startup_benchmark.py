@@ -0,0 +1,66 @@
+"""
+Cold-start benchmark of the CLI.
+
+Spawns a fresh interpreter for every run of each command and reports the wall-clock
+time until it exits. Runs against a throwaway SQLite database and keyring service so
+that no real session or data is touched.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--repeat 10] [--command "clients list"]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+MAIN = os.path.join(ROOT, "crm", "cli", "main.py")
+
+DEFAULT_COMMANDS = [
+    "--help",
+    "auth --help",
+    "auth logout",
+    "clients --help",
+    "clients list",
+    "collaborators list",
+    "contracts list",
+    "events list",
+]
+
+
+def time_command(args, env, repeat):
+    """Returns the wall-clock durations in milliseconds of `repeat` cold runs of a command."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, MAIN, *args], env=env, cwd=ROOT,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="Cold runs per command")
+    parser.add_argument("--command", action="append", help="Command to time, may be repeated")
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        env = dict(os.environ)
+        env["DATABASE_URL"] = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+        env["KEYRING_SERVICE"] = "epicevents-startup-benchmark"
+        env["SENTRY_URL"] = ""
+        # Cold starts are measured, a running daemon must not answer the commands
+        env["DAEMON_SOCKET"] = os.path.join(tmp_dir, "no-daemon.sock")
+
+        print(f"{'command':<24}{'min ms':>10}{'median ms':>12}{'max ms':>10}")
+        for command in options.command or DEFAULT_COMMANDS:
+            durations = time_command(command.split(), env, options.repeat)
+            print(f"{command:<24}{min(durations):>10.1f}{statistics.median(durations):>12.1f}{max(durations):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
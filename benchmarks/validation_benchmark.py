@@ -0,0 +1,88 @@
+"""
+Records validated per second by ValidatorHelper.
+
+Validates generated event records against a throwaway SQLite database:
+  - single valid: one validator per record, each looking up its contract and support
+  - single invalid: records failing a field check, whose database checks are skipped
+  - batch valid: ValidatorHelper.validate_batch, one query per referenced model
+
+Usage:
+    python benchmarks/validation_benchmark.py [--records 20000] [--batch-size 1000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from crm.models import Base, Role, Collaborator, Client, Contract
+from crm.enums.model_type_enum import ModelTypeEnum
+from crm.helpers.validator_helper import ValidatorHelper
+
+
+def populate(db):
+    db.add_all([Role(id=1, name="Sales"), Role(id=2, name="Support"), Role(id=3, name="Management")])
+    db.add_all([
+        Collaborator(id=1, first_name="Bench", last_name="Sales", email="sales@bench.test", password_hash="x", role_id=1),
+        Collaborator(id=2, first_name="Bench", last_name="Support", email="support@bench.test", password_hash="x", role_id=2),
+    ])
+    db.add(Client(id=1, first_name="Client", last_name="Bench", email="client@bench.test", phone="0102030405",
+                  company_name="Bench", commercial_id=1))
+    db.add(Contract(id=1, client_id=1, commercial_id=1, costing=100, remaining_due_payment=0,
+                    creation_date=datetime(2025, 1, 1), is_signed=True))
+    db.commit()
+
+
+def event_record(i, location="1 Main street, 75000 Paris, France"):
+    return {"name": f"Event {i}", "start_date": "01/06/2025-09h00", "end_date": "01/06/2025-18h00",
+            "location": location, "attendees": 10, "notes": "Notes", "contract_id": 1, "support_id": 2}
+
+
+def bench_single(db, records):
+    start = time.perf_counter()
+    for data in records:
+        ValidatorHelper(db, ModelTypeEnum.EVENT, data).validate_data()
+    return len(records) / (time.perf_counter() - start)
+
+
+def bench_batch(db, records, batch_size):
+    start = time.perf_counter()
+    for offset in range(0, len(records), batch_size):
+        ValidatorHelper.validate_batch(db, ModelTypeEnum.EVENT, records[offset:offset + batch_size])
+    return len(records) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=20000, help="Records validated by each method")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Records per validate_batch call")
+    options = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}")
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        populate(db)
+
+        valid = [event_record(i) for i in range(options.records)]
+        invalid = [event_record(i, location="nowhere") for i in range(options.records)]
+        results = {
+            "single valid": bench_single(db, valid),
+            "single invalid": bench_single(db, invalid),
+            "batch valid": bench_batch(db, valid, options.batch_size),
+        }
+        db.close()
+        engine.dispose()
+
+    print(f"{'method':<18}{'records/s':>12}")
+    for name, rate in results.items():
+        print(f"{name:<18}{rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
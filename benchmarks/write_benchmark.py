@@ -0,0 +1,102 @@
+"""
+Round trips and time per `add` and `edit` command on the client services.
+
+Runs each command against a throwaway SQLite database, counting the statements sent to it:
+  - refresh: commit then refresh, entities expiring on commit (the previous write path)
+  - services: crm.services.clients as used by the CLI, entities kept on commit
+
+Usage:
+    python benchmarks/write_benchmark.py [--commands 2000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from crm.models import Base, Role, Collaborator, Client
+from crm.helpers.authorize_helper import current_auth
+from crm.services.clients import create_client, update_client
+
+
+def fresh_session(tmp_dir, name, expire_on_commit):
+    engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, name)}")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine, autoflush=False, expire_on_commit=expire_on_commit)()
+    db.add(Role(id=1, name="Sales"))
+    db.add(Collaborator(id=1, first_name="Bench", last_name="Sales", email="sales@bench.test", password_hash="x", role_id=1))
+    db.commit()
+    return engine, db
+
+
+def refresh_add(db, i):
+    client = Client(first_name="Client", last_name=f"Number {i}", email=f"client{i}@bench.test",
+                    phone="0102030405", company_name=f"Company {i}", commercial_id=1)
+    db.add(client)
+    db.commit()
+    db.refresh(client)
+    return client.full_name
+
+
+def refresh_edit(db, i):
+    client = db.query(Client).filter(Client.id == i + 1).first()
+    client.company_name = f"Renamed {i}"
+    db.commit()
+    db.refresh(client)
+    return client.company_name
+
+
+def services_add(db, i):
+    return create_client(db, "Client", f"Number {i}", f"client{i}@bench.test", "0102030405", f"Company {i}").full_name
+
+
+def services_edit(db, i):
+    return update_client(db, i + 1, company_name=f"Renamed {i}")
+
+
+def bench(tmp_dir, name, expire_on_commit, add, edit, commands):
+    engine, db = fresh_session(tmp_dir, f"{name}.db", expire_on_commit)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+
+    results = {}
+    for command, run in (("add", add), ("edit", edit)):
+        statements.clear()
+        start = time.perf_counter()
+        for i in range(commands):
+            run(db, i)
+            # Each command ends with its own session
+            db.expunge_all()
+        results[command] = (len(statements) / commands, (time.perf_counter() - start) / commands * 1000)
+
+    db.close()
+    engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--commands", type=int, default=2000, help="add then edit commands run by each method")
+    options = parser.parse_args()
+
+    collaborator = type("Collaborator", (object,), {"id": 1, "role_id": 1})
+    current_auth.set((collaborator, None))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = {
+            "refresh": bench(tmp_dir, "refresh", True, refresh_add, refresh_edit, options.commands),
+            "services": bench(tmp_dir, "services", False, services_add, services_edit, options.commands),
+        }
+
+    print(f"{'method':<10}{'command':<9}{'statements':>12}{'ms':>9}")
+    for name, commands in results.items():
+        for command, (statements, milliseconds) in commands.items():
+            print(f"{name:<10}{command:<9}{statements:>12.1f}{milliseconds:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,5 @@
 import os
 from dotenv import load_dotenv
-import sentry_sdk
 
 
 load_dotenv()
@@ -8,19 +7,43 @@ load_dotenv()
 SECRET_KEY = os.getenv("APP_SECRET_KEY", "supersecretkey")
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///crm.db")
 KEYRING_SERVICE = os.getenv("KEYRING_SERVICE", "keyringservice")
+# bcrypt work factor of new password hashes (4 to 31, each step doubles the cost),
+# hashes of another cost are upgraded on the next successful login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+if not 4 <= BCRYPT_ROUNDS <= 31:
+    # bcrypt would only refuse it when hashing, blocking every login
+    raise ValueError(f"BCRYPT_ROUNDS must be between 4 and 31, got {BCRYPT_ROUNDS}")
 
-sentry_sdk.init(
-    dsn=os.getenv('SENTRY_URL'),
-    # Add data like request headers and IP for users,
-    # see https://docs.sentry.io/platforms/python/data-management/data-collected/ for more info
-    send_default_pii=True,
-    # Set traces_sample_rate to 1.0 to capture 100%
-    # of transactions for tracing.
-    traces_sample_rate=1.0,
-    _experiments={
-        # Set continuous_profiling_auto_start to True
-        # to automatically start the profiler on when
-        # possible.
-        "continuous_profiling_auto_start": True,
-    },
-)
\ No newline at end of file
+# Pragmas applied to every SQLite connection, one of "default", "concurrent" or "performance"
+# (see SQLITE_PROFILES in crm/database.py)
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "performance")
+
+# Engine profile of server databases such as MySQL, SQLite ignores it
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# Seconds to wait for a pooled connection before giving up
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Seconds after which a pooled connection is replaced, keep it below the server's wait_timeout
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Check connections with a lightweight ping before use, so stale ones are replaced transparently
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").strip().lower() in ("1", "true", "yes", "on")
+# Seconds allowed to establish a new connection
+DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "10"))
+
+# Unix socket of the optional resident daemon (see `crm daemon start`), commands are forwarded to it when it runs
+DAEMON_SOCKET = os.getenv("DAEMON_SOCKET", os.path.join(os.path.expanduser("~"), ".epicevents-crm.sock"))
+
+# History of the interactive shell (see `crm shell`)
+SHELL_HISTORY_FILE = os.getenv("SHELL_HISTORY_FILE", os.path.join(os.path.expanduser("~"), ".epicevents-crm-history"))
+
+# Seconds roles, the collaborator directory and the search index lookups are cached in memory by long-running processes (shell, daemon), 0 disables it
+REFERENCE_CACHE_TTL = float(os.getenv("REFERENCE_CACHE_TTL", "60"))
+
+# Telemetry is initialised lazily by crm.helpers.telemetry_helper, never at import.
+# TELEMETRY_MODE is one of "off", "errors" (exceptions only) or "traces" (exceptions and sampled traces)
+SENTRY_URL = os.getenv("SENTRY_URL")
+TELEMETRY_MODE = os.getenv("TELEMETRY_MODE", "errors")
+TELEMETRY_TRACES_SAMPLE_RATE = float(os.getenv("TELEMETRY_TRACES_SAMPLE_RATE", "0.1"))
+TELEMETRY_PROFILES_SAMPLE_RATE = float(os.getenv("TELEMETRY_PROFILES_SAMPLE_RATE", "0"))
+# Upper bound in seconds spent flushing events, on error and at exit
+TELEMETRY_FLUSH_TIMEOUT = float(os.getenv("TELEMETRY_FLUSH_TIMEOUT", "1"))
@@ -1,9 +1,13 @@
 import click
 from crm.database import DB
-from crm.services.clients import create_client, get_client, get_all_clients, update_client, delete_client
+from crm.services.clients import create_client, get_client, get_all_clients, update_client, delete_client, import_clients
 from crm.helpers.validator_helper import ValidatorHelper
+from crm.helpers.output_helper import OutputHelper
+from crm.helpers.format_helper import FormatHelper
+from crm.helpers.import_helper import ImportHelper
 from crm.helpers.authorize_helper import role_restricted, authentication_required, self_user_restricted, get_current_user
 from crm.enums.model_type_enum import ModelTypeEnum
+from crm.models.clients import Client
 from crm.models.roles import RoleEnum
 from crm.enums.relationships_enum import RelationshipEnum
 
@@ -37,7 +41,6 @@ def add(first_name, last_name, email, phone, company_name):
         click.echo("❌ Validation failed:")
         for error in validator.error_messages:
             click.echo(f"   - {error}")
-        DB.close()
         return
     
     try:
@@ -45,47 +48,42 @@ def add(first_name, last_name, email, phone, company_name):
         click.echo(f"✅ Client {client.full_name} created!")
     except ValueError as e:
         click.echo(f"❌ Error: {e}")
-    finally:
-        DB.close()
 
 @click.command()
 @click.argument('client_id', type=int)
+@click.option('--format', 'output_format', type=click.Choice(OutputHelper.FORMATS), default="text", show_default=True, help="Output format.")
 @role_restricted([RoleEnum.SALES], relationType=RelationshipEnum.COLLABORATOR_CLIENT)
-def view(client_id):
+def view(client_id, output_format):
     """Get a client by ID."""
     client = get_client(DB, client_id)
-    DB.close()
-    if client:
-        click.echo(f"👤 {client.infos}")
-    else:
-        click.echo("❌ Client not found!")
+    OutputHelper(lambda c: f"👤 {c.infos}", "❌ Client not found!", output_format=output_format, fields=Client.INFOS_LABELS).echo_rows([client] if client else [])
 
 @click.command()
 @click.option('--filter-field', type=str, help="Field to filter by (available choices are: id, first_name, last_name, email, phone, company_name, first_contact_date, last_contact_date, commercial_id).")
 @click.option('--filter-value', type=str, help="Value to filter by.")
+@click.option('--limit', type=click.IntRange(min=1), help="Maximum number of clients to list.")
+@click.option('--after', 'after_id', type=int, help="Only list clients with a greater ID, i.e. the cursor printed at the end of the previous page.")
+@click.option('--stream', is_flag=True, help="Fetch clients in batches while printing them instead of loading them all first.")
+@click.option('--format', 'output_format', type=click.Choice(OutputHelper.FORMATS), default="text", show_default=True, help="Output format.")
 @authentication_required()
-def list(filter_field, filter_value):
+def list(filter_field, filter_value, limit, after_id, stream, output_format):
     """List all clients."""
     try:
-        clients = get_all_clients(DB, filter_field, filter_value)
+        clients = get_all_clients(DB, filter_field, filter_value, limit, after_id, stream, tuple(Client.MINIMAL_INFOS_LABELS))
     except ValueError as e:
         click.echo(f"🚨 {str(e)}")
         raise SystemExit(1)
-    DB.close()
 
-    if not clients:
-        click.echo("🚨 No clients found!")
-    else:
-        for c in clients:
-            click.echo(f"👤 {c.minimal_infos}")
+    output = OutputHelper(lambda c: f"👤 {FormatHelper.format_infos(c, Client.MINIMAL_INFOS_LABELS)}", "🚨 No clients found!", limit, output_format, Client.MINIMAL_INFOS_LABELS)
+    output.echo_rows(clients)
 
 @click.command()
 @click.argument('client_id', type=int)
-@click.option('--first-name', prompt="First Name", help="New client's first name")
-@click.option('--last-name', prompt="Last Name", help="New client's last name")
-@click.option('--email', prompt="Email", help="New client's email")
-@click.option('--phone', prompt="Phone", help="New client's phone number")
-@click.option('--company-name', prompt="Company Name", help="New client's company name")
+@click.option('--first-name', help="New client's first name")
+@click.option('--last-name', help="New client's last name")
+@click.option('--email', help="New client's email")
+@click.option('--phone', help="New client's phone number")
+@click.option('--company-name', help="New client's company name")
 @role_restricted([RoleEnum.SALES], relationType=RelationshipEnum.COLLABORATOR_CLIENT)
 def edit(client_id, first_name, last_name, email, phone, company_name):
     """Edit a client."""
@@ -96,6 +94,11 @@ def edit(client_id, first_name, last_name, email, phone, company_name):
         "phone": phone,
         "company_name": company_name
     }
+    # Only the given options are validated and written
+    data = {field: value for field, value in data.items() if value is not None}
+    if not data:
+        click.echo("⚠️ Nothing to update, pass the options of the fields to change (see --help).")
+        return
 
     validator = ValidatorHelper(DB, ModelTypeEnum.CLIENT, data)
     validator.validate_data()
@@ -104,12 +107,10 @@ def edit(client_id, first_name, last_name, email, phone, company_name):
         click.echo("❌ Validation failed:")
         for error in validator.error_messages:
             click.echo(f"   - {error}")
-        DB.close()
         return
     
-    client = update_client(DB, client_id, **data)
-    DB.close()
-    if client:
+    success = update_client(DB, client_id, **data)
+    if success:
         click.echo(f"✅ Client {client_id} updated successfully!")
     else:
         click.echo("❌ Client not found!")
@@ -121,14 +122,47 @@ def edit(client_id, first_name, last_name, email, phone, company_name):
 def delete(client_id):
     """Remove a client."""
     success = delete_client(DB, client_id)
-    DB.close()
     if success:
         click.echo(f"✅ Client {client_id} deleted successfully!")
     else:
         click.echo("❌ Client not found!")
 
+@click.command(name="import")
+@click.argument('file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'file_format', type=click.Choice(ImportHelper.FORMATS), help="File format, guessed from the extension by default.")
+@click.option('--chunk-size', type=click.IntRange(min=1), default=ImportHelper.CHUNK_SIZE, show_default=True, help="Rows validated and inserted per transaction.")
+@click.option('--errors', 'report_path', type=click.Path(dir_okay=False), help="CSV report of the rejected rows, defaults to FILE.errors.csv.")
+@role_restricted([RoleEnum.SALES])
+def import_file(file, file_format, chunk_size, report_path):
+    """Import clients from a CSV or JSON lines file."""
+    import_helper = import_clients(DB, file, file_format, chunk_size, report_path or f"{file}.errors.csv")
+    import_helper.echo_summary("clients")
+
+@click.command()
+@click.option('--filter-field', type=str, help="Field to filter by (available choices are: id, first_name, last_name, email, phone, company_name, first_contact_date, last_contact_date, commercial_id).")
+@click.option('--filter-value', type=str, help="Value to filter by.")
+@click.option('--format', 'output_format', type=click.Choice(OutputHelper.EXPORT_FORMATS), default="csv", show_default=True, help="Export format.")
+@click.option('--gzip', 'compress', is_flag=True, help="Compress the export with gzip.")
+@click.option('--output', 'output_path', type=click.Path(dir_okay=False, allow_dash=True), default="-", help="File to write to, stdout by default.")
+@authentication_required()
+def export(filter_field, filter_value, output_format, compress, output_path):
+    """Export clients to CSV or JSON lines, streaming them from the database."""
+    try:
+        clients = get_all_clients(DB, filter_field, filter_value, stream=True, columns=tuple(Client.INFOS_LABELS))
+    except ValueError as e:
+        click.echo(f"🚨 {str(e)}", err=True)
+        raise SystemExit(1)
+
+    with OutputHelper.open_stream(output_path, compress) as stream:
+        output = OutputHelper(None, "🚨 No clients found!", output_format=output_format, fields=Client.INFOS_LABELS, stream=stream)
+        count = output.echo_rows(clients)
+    if count:
+        click.echo(f"✅ {count} clients exported.", err=True)
+
 clients.add_command(add)
 clients.add_command(view)
 clients.add_command(list)
 clients.add_command(edit)
 clients.add_command(delete)
+clients.add_command(import_file)
+clients.add_command(export)
@@ -1,9 +1,13 @@
 import click
 from crm.database import DB
-from crm.services.collaborators import create_collaborator, get_collaborator, get_all_collaborators, update_collaborator, update_password, delete_collaborator
+from crm.services.collaborators import create_collaborator, get_collaborator, get_all_collaborators, update_collaborator, update_password, delete_collaborator, import_collaborators, update_passwords
 from crm.helpers.validator_helper import ValidatorHelper
+from crm.helpers.output_helper import OutputHelper
+from crm.helpers.format_helper import FormatHelper
+from crm.helpers.import_helper import ImportHelper
 from crm.helpers.authorize_helper import role_restricted, authentication_required, self_user_restricted, get_current_user
 from crm.enums.model_type_enum import ModelTypeEnum
+from crm.models.collaborators import Collaborator
 from crm.models.roles import RoleEnum
 
 
@@ -36,7 +40,6 @@ def add(first_name, last_name, email, password, role_id):
         click.echo("❌ Validation failed:")
         for error in validator.error_messages:
             click.echo(f"   - {error}")
-        DB.close()
         return
     
     try:
@@ -44,39 +47,34 @@ def add(first_name, last_name, email, password, role_id):
         click.echo(f"✅ Collaborator {collaborator.full_name} created!")
     except ValueError as e:
         click.echo(f"❌ Error: {e}")
-    finally:
-        DB.close()
 
 @click.command()
 @click.argument('collaborator_id', type=int)
+@click.option('--format', 'output_format', type=click.Choice(OutputHelper.FORMATS), default="text", show_default=True, help="Output format.")
 @authentication_required()
-def view(collaborator_id):
+def view(collaborator_id, output_format):
     """Get a collaborator by ID."""
     collaborator = get_collaborator(DB, collaborator_id)
-    DB.close()
-    if collaborator:
-        click.echo(f"👤 {collaborator.infos}")
-    else:
-        click.echo("❌ Collaborator not found!")
+    OutputHelper(lambda c: f"👤 {c.infos}", "❌ Collaborator not found!", output_format=output_format, fields=Collaborator.INFOS_LABELS).echo_rows([collaborator] if collaborator else [])
 
 @click.command()
 @click.option('--filter-field', type=str, help="Field to filter by (available choices are: id, id, first_name, last_name, email, role_id).")
 @click.option('--filter-value', type=str, help="Value to filter by.")
+@click.option('--limit', type=click.IntRange(min=1), help="Maximum number of collaborators to list.")
+@click.option('--after', 'after_id', type=int, help="Only list collaborators with a greater ID, i.e. the cursor printed at the end of the previous page.")
+@click.option('--stream', is_flag=True, help="Fetch collaborators in batches while printing them instead of loading them all first.")
+@click.option('--format', 'output_format', type=click.Choice(OutputHelper.FORMATS), default="text", show_default=True, help="Output format.")
 @authentication_required()
-def list(filter_field, filter_value):
+def list(filter_field, filter_value, limit, after_id, stream, output_format):
     """List all collaborators."""
     try:
-        collaborators = get_all_collaborators(DB, filter_field, filter_value)
+        collaborators = get_all_collaborators(DB, filter_field, filter_value, limit, after_id, stream, tuple(Collaborator.MINIMAL_INFOS_LABELS))
     except ValueError as e:
         click.echo(f"🚨 {str(e)}")
         raise SystemExit(1)
-    DB.close()
 
-    if not collaborators:
-        click.echo("🚨 No collaborators found!")
-    else:
-        for c in collaborators:
-            click.echo(f"👤 {c.minimal_infos}")
+    output = OutputHelper(lambda c: f"👤 {FormatHelper.format_infos(c, Collaborator.MINIMAL_INFOS_LABELS)}", "🚨 No collaborators found!", limit, output_format, Collaborator.MINIMAL_INFOS_LABELS)
+    output.echo_rows(collaborators)
 
 @click.command()
 @click.argument('collaborator_id', type=int)
@@ -93,6 +91,11 @@ def edit(collaborator_id, first_name, last_name, email, role_id):
         "email": email,
         "role_id": role_id
     }
+    # Only the given options are validated and written
+    data = {field: value for field, value in data.items() if value is not None}
+    if not data:
+        click.echo("⚠️ Nothing to update, pass the options of the fields to change (see --help).")
+        return
 
     validator = ValidatorHelper(DB, ModelTypeEnum.COLLABORATOR, data)
     validator.validate_data()
@@ -101,14 +104,10 @@ def edit(collaborator_id, first_name, last_name, email, role_id):
         click.echo("❌ Validation failed:")
         for error in validator.error_messages:
             click.echo(f"   - {error}")
-        DB.close()
         return
 
-    updates = {"first_name": first_name, "last_name": last_name, "email": email, "role_id": role_id}
-    
-    collaborator = update_collaborator(DB, collaborator_id, **updates)
-    DB.close()
-    if collaborator:
+    success = update_collaborator(DB, collaborator_id, **data)
+    if success:
         click.echo(f"✅ Collaborator {collaborator_id} updated successfully!")
     else:
         click.echo("❌ Collaborator not found!")
@@ -129,13 +128,11 @@ def edit_password(password):
         click.echo("❌ Validation failed:")
         for error in validator.error_messages:
             click.echo(f"   - {error}")
-        DB.close()
         return
     
-    current_collaborator = get_current_user(DB)
-    collaborator = update_password(DB, current_collaborator.id, password)
-    DB.close()
-    if collaborator:
+    current_collaborator, error = get_current_user()
+    success = update_password(DB, current_collaborator.id, password)
+    if success:
         click.echo(f"✅ Password updated successfully!")
     else:
         click.echo("❌ Collaborator not found!")
@@ -147,15 +144,76 @@ def edit_password(password):
 def delete(collaborator_id):
     """Remove a collaborator."""
     success = delete_collaborator(DB, collaborator_id)
-    DB.close()
     if success:
         click.echo(f"✅ Collaborator {collaborator_id} deleted successfully!")
     else:
         click.echo("❌ Collaborator not found!")
 
+@click.command(name="import")
+@click.argument('file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'file_format', type=click.Choice(ImportHelper.FORMATS), help="File format, guessed from the extension by default.")
+@click.option('--chunk-size', type=click.IntRange(min=1), default=ImportHelper.CHUNK_SIZE, show_default=True, help="Rows validated, hashed and inserted per transaction.")
+@click.option('--errors', 'report_path', type=click.Path(dir_okay=False), help="CSV report of the rejected rows, defaults to FILE.errors.csv.")
+@role_restricted([RoleEnum.MANAGEMENT])
+def import_file(file, file_format, chunk_size, report_path):
+    """Import collaborators from a CSV or JSON lines file with their password."""
+    import_helper = import_collaborators(DB, file, file_format, chunk_size, report_path or f"{file}.errors.csv")
+    import_helper.echo_summary("collaborators")
+
+@click.command(name="reset-passwords")
+@click.argument('file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'file_format', type=click.Choice(ImportHelper.FORMATS), help="File format, guessed from the extension by default.")
+@role_restricted([RoleEnum.MANAGEMENT])
+def reset_passwords(file, file_format):
+    """Reset passwords from a CSV or JSON lines file of id and password columns."""
+    passwords = {}
+    for line, data, error in ImportHelper.read_file(file, file_format):
+        password = data.get("password")
+        validator = ValidatorHelper(DB, ModelTypeEnum.COLLABORATOR, {"password": password})
+        validator.validate_data()
+        if not password:
+            validator.add_error("password", "This field is required.")
+        if not str(data.get("id", "")).strip().isdigit():
+            validator.add_error("id", "Expected an integer value.")
+
+        errors = [error] if error else validator.error_messages
+        if errors:
+            click.echo(f"❌ Line {line} skipped: {'; '.join(errors)}")
+            continue
+        passwords[int(data["id"])] = password
+
+    missing_ids = update_passwords(DB, passwords)
+    for collaborator_id in missing_ids:
+        click.echo(f"❌ Collaborator {collaborator_id} not found!")
+    click.echo(f"✅ {len(passwords) - len(missing_ids)} passwords updated successfully!")
+
+@click.command()
+@click.option('--filter-field', type=str, help="Field to filter by (available choices are: id, id, first_name, last_name, email, role_id).")
+@click.option('--filter-value', type=str, help="Value to filter by.")
+@click.option('--format', 'output_format', type=click.Choice(OutputHelper.EXPORT_FORMATS), default="csv", show_default=True, help="Export format.")
+@click.option('--gzip', 'compress', is_flag=True, help="Compress the export with gzip.")
+@click.option('--output', 'output_path', type=click.Path(dir_okay=False, allow_dash=True), default="-", help="File to write to, stdout by default.")
+@authentication_required()
+def export(filter_field, filter_value, output_format, compress, output_path):
+    """Export collaborators to CSV or JSON lines, streaming them from the database."""
+    try:
+        collaborators = get_all_collaborators(DB, filter_field, filter_value, stream=True, columns=tuple(Collaborator.INFOS_LABELS))
+    except ValueError as e:
+        click.echo(f"🚨 {str(e)}", err=True)
+        raise SystemExit(1)
+
+    with OutputHelper.open_stream(output_path, compress) as stream:
+        output = OutputHelper(None, "🚨 No collaborators found!", output_format=output_format, fields=Collaborator.INFOS_LABELS, stream=stream)
+        count = output.echo_rows(collaborators)
+    if count:
+        click.echo(f"✅ {count} collaborators exported.", err=True)
+
 collaborators.add_command(add)
 collaborators.add_command(view)
 collaborators.add_command(list)
 collaborators.add_command(edit)
 collaborators.add_command(edit_password)
 collaborators.add_command(delete)
+collaborators.add_command(export)
+collaborators.add_command(import_file)
+collaborators.add_command(reset_passwords)
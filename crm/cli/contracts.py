@@ -1,9 +1,13 @@
 import click
 from crm.database import DB
-from crm.services.contracts import create_contract, get_contract, get_all_contracts, update_contract, delete_contract
+from crm.services.contracts import create_contract, get_contract, get_all_contracts, update_contract, delete_contract, import_contracts
 from crm.helpers.validator_helper import ValidatorHelper
+from crm.helpers.output_helper import OutputHelper
+from crm.helpers.format_helper import FormatHelper
+from crm.helpers.import_helper import ImportHelper
 from crm.helpers.authorize_helper import role_restricted, authentication_required, self_user_restricted, get_current_user
 from crm.enums.model_type_enum import ModelTypeEnum
+from crm.models.contracts import Contract
 from crm.models.roles import RoleEnum
 from crm.enums.relationships_enum import RelationshipEnum
 
@@ -37,7 +41,6 @@ def add(costing, remaining_due_payment, is_signed, client_id, commercial_id):
         click.echo("❌ Validation failed:")
         for error in validator.error_messages:
             click.echo(f"   - {error}")
-        DB.close()
         return
     
     try:
@@ -45,48 +48,42 @@ def add(costing, remaining_due_payment, is_signed, client_id, commercial_id):
         click.echo(f"✅ Contract {contract.id} created!")
     except ValueError as e:
         click.echo(f"❌ Error: {e}")
-    finally:
-        DB.close()
 
 @click.command()
 @click.argument('contract_id', type=int)
+@click.option('--format', 'output_format', type=click.Choice(OutputHelper.FORMATS), default="text", show_default=True, help="Output format.")
 @role_restricted([RoleEnum.MANAGEMENT, RoleEnum.SALES], relationType=RelationshipEnum.COLLABORATOR_CLIENT)
-def view(contract_id):
+def view(contract_id, output_format):
     """Get a contract by ID."""
     contract = get_contract(DB, contract_id)
-    DB.close()
-    if contract:
-        click.echo(f"👤 {contract.infos}")
-    else:
-        click.echo("❌ Contract not found!")
+    OutputHelper(lambda c: f"👤 {c.infos}", "❌ Contract not found!", output_format=output_format, fields=Contract.INFOS_LABELS).echo_rows([contract] if contract else [])
 
 @click.command()
 @click.option('--filter-field', type=str, help="Field to filter by (available choices are: id, costing, remaining_due_payment, creation_date, is_signed, client_id, commercial_id).")
 @click.option('--filter-value', type=str, help="Value to filter by.")
+@click.option('--limit', type=click.IntRange(min=1), help="Maximum number of contracts to list.")
+@click.option('--after', 'after_id', type=int, help="Only list contracts with a greater ID, i.e. the cursor printed at the end of the previous page.")
+@click.option('--stream', is_flag=True, help="Fetch contracts in batches while printing them instead of loading them all first.")
+@click.option('--format', 'output_format', type=click.Choice(OutputHelper.FORMATS), default="text", show_default=True, help="Output format.")
 @authentication_required()
-def list(filter_field, filter_value):
+def list(filter_field, filter_value, limit, after_id, stream, output_format):
     """List all contracts."""
     try:
-        contracts = get_all_contracts(DB, filter_field, filter_value)
+        contracts = get_all_contracts(DB, filter_field, filter_value, limit, after_id, stream, tuple(Contract.INFOS_LABELS))
     except ValueError as e:
         click.echo(f"🚨 {str(e)}")
         raise SystemExit(1)
-    DB.close()
 
-    if not contracts:
-        click.echo("🚨 No contracts found!")
-    else:
-        for c in contracts:
-            # click.echo(f"👤 {c.minimal_infos}")
-            click.echo(f"👤 {c.infos}")
+    output = OutputHelper(lambda c: f"👤 {FormatHelper.format_infos(c, Contract.INFOS_LABELS)}", "🚨 No contracts found!", limit, output_format, Contract.INFOS_LABELS)
+    output.echo_rows(contracts)
 
 @click.command()
 @click.argument('contract_id', type=int)
-@click.option('--costing', prompt="Costing", help="Costing of the contract", type=float)
-@click.option('--remaining-due-payment', prompt="Remaining due payment", help="Remaining due payment of the contract", type=float)
-@click.option('--is-signed', prompt="Is signed?", help="Weither the contract is signed or not", type=bool)
-@click.option('--client-id', prompt="Client ID", help="Client ID of the contract related client", type=int)
-@click.option('--commercial-id', prompt="Commercial ID", help="Collaborator ID of the contract related collaborator", type=int)
+@click.option('--costing', help="Costing of the contract", type=float)
+@click.option('--remaining-due-payment', help="Remaining due payment of the contract", type=float)
+@click.option('--is-signed', help="Weither the contract is signed or not", type=bool)
+@click.option('--client-id', help="Client ID of the contract related client", type=int)
+@click.option('--commercial-id', help="Collaborator ID of the contract related collaborator", type=int)
 @role_restricted([RoleEnum.MANAGEMENT, RoleEnum.SALES], relationType=RelationshipEnum.COLLABORATOR_CLIENT)
 def edit(contract_id, costing, remaining_due_payment, is_signed, client_id, commercial_id):
     """Edit a contract."""
@@ -97,6 +94,11 @@ def edit(contract_id, costing, remaining_due_payment, is_signed, client_id, comm
         "client_id": client_id,
         "commercial_id": commercial_id
     }
+    # Only the given options are validated and written
+    data = {field: value for field, value in data.items() if value is not None}
+    if not data:
+        click.echo("⚠️ Nothing to update, pass the options of the fields to change (see --help).")
+        return
 
     validator = ValidatorHelper(DB, ModelTypeEnum.CONTRACT, data)
     validator.validate_data()
@@ -105,12 +107,10 @@ def edit(contract_id, costing, remaining_due_payment, is_signed, client_id, comm
         click.echo("❌ Validation failed:")
         for error in validator.error_messages:
             click.echo(f"   - {error}")
-        DB.close()
         return
     
-    contract = update_contract(DB, contract_id, **data)
-    DB.close()
-    if contract:
+    success = update_contract(DB, contract_id, **data)
+    if success:
         click.echo(f"✅ Contract {contract_id} updated successfully!")
     else:
         click.echo("❌ Contract not found!")
@@ -122,14 +122,47 @@ def edit(contract_id, costing, remaining_due_payment, is_signed, client_id, comm
 def delete(contract_id):
     """Remove a contract."""
     success = delete_contract(DB, contract_id)
-    DB.close()
     if success:
         click.echo(f"✅ Contract {contract_id} deleted successfully!")
     else:
         click.echo("❌ Contract not found!")
 
+@click.command(name="import")
+@click.argument('file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'file_format', type=click.Choice(ImportHelper.FORMATS), help="File format, guessed from the extension by default.")
+@click.option('--chunk-size', type=click.IntRange(min=1), default=ImportHelper.CHUNK_SIZE, show_default=True, help="Rows validated and inserted per transaction.")
+@click.option('--errors', 'report_path', type=click.Path(dir_okay=False), help="CSV report of the rejected rows, defaults to FILE.errors.csv.")
+@role_restricted([RoleEnum.MANAGEMENT])
+def import_file(file, file_format, chunk_size, report_path):
+    """Import contracts from a CSV or JSON lines file."""
+    import_helper = import_contracts(DB, file, file_format, chunk_size, report_path or f"{file}.errors.csv")
+    import_helper.echo_summary("contracts")
+
+@click.command()
+@click.option('--filter-field', type=str, help="Field to filter by (available choices are: id, costing, remaining_due_payment, creation_date, is_signed, client_id, commercial_id).")
+@click.option('--filter-value', type=str, help="Value to filter by.")
+@click.option('--format', 'output_format', type=click.Choice(OutputHelper.EXPORT_FORMATS), default="csv", show_default=True, help="Export format.")
+@click.option('--gzip', 'compress', is_flag=True, help="Compress the export with gzip.")
+@click.option('--output', 'output_path', type=click.Path(dir_okay=False, allow_dash=True), default="-", help="File to write to, stdout by default.")
+@authentication_required()
+def export(filter_field, filter_value, output_format, compress, output_path):
+    """Export contracts to CSV or JSON lines, streaming them from the database."""
+    try:
+        contracts = get_all_contracts(DB, filter_field, filter_value, stream=True, columns=tuple(Contract.INFOS_LABELS))
+    except ValueError as e:
+        click.echo(f"🚨 {str(e)}", err=True)
+        raise SystemExit(1)
+
+    with OutputHelper.open_stream(output_path, compress) as stream:
+        output = OutputHelper(None, "🚨 No contracts found!", output_format=output_format, fields=Contract.INFOS_LABELS, stream=stream)
+        count = output.echo_rows(contracts)
+    if count:
+        click.echo(f"✅ {count} contracts exported.", err=True)
+
 contracts.add_command(add)
 contracts.add_command(view)
 contracts.add_command(list)
 contracts.add_command(edit)
 contracts.add_command(delete)
+contracts.add_command(import_file)
+contracts.add_command(export)
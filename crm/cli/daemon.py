@@ -0,0 +1,72 @@
+import os
+import time
+import click
+from config import DAEMON_SOCKET
+from crm.helpers.daemon_helper import DaemonServer, is_daemon_running, stop_daemon
+
+
+@click.group()
+def daemon():
+    """Manage the resident daemon"""
+    pass
+
+@click.command()
+@click.option('--foreground', is_flag=True, help="Serve in this terminal instead of in the background.")
+@click.option('--socket', 'socket_path', default=DAEMON_SOCKET, show_default=True, help="Unix socket to listen on.")
+def start(foreground, socket_path):
+    """Start a daemon keeping the CRM loaded, the next commands are run by it."""
+    if not hasattr(os, "fork"):
+        click.echo("❌ The daemon needs Unix sockets, which this system does not provide.")
+        raise SystemExit(1)
+    if is_daemon_running(socket_path):
+        click.echo(f"⚠️ A daemon is already listening on {socket_path}.")
+        return
+
+    if foreground:
+        click.echo(f"✅ Daemon listening on {socket_path}, stop it with Ctrl+C.")
+        try:
+            DaemonServer(socket_path).serve_forever()
+        except KeyboardInterrupt:
+            click.echo("\n✅ Daemon stopped.")
+        return
+
+    if os.fork() == 0:
+        # Detached child: own session, no terminal
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        try:
+            DaemonServer(socket_path).serve_forever()
+        finally:
+            os._exit(0)
+
+    for _ in range(100):
+        if is_daemon_running(socket_path):
+            click.echo(f"✅ Daemon listening on {socket_path}.")
+            return
+        time.sleep(0.1)
+    click.echo("❌ The daemon did not start.")
+    raise SystemExit(1)
+
+@click.command()
+@click.option('--socket', 'socket_path', default=DAEMON_SOCKET, show_default=True, help="Unix socket of the daemon.")
+def stop(socket_path):
+    """Stop the daemon, commands run in-process again."""
+    if stop_daemon(socket_path):
+        click.echo("✅ Daemon stopped.")
+    else:
+        click.echo("⚠️ No daemon is running.")
+
+@click.command()
+@click.option('--socket', 'socket_path', default=DAEMON_SOCKET, show_default=True, help="Unix socket of the daemon.")
+def status(socket_path):
+    """Tell whether a daemon is running."""
+    if is_daemon_running(socket_path):
+        click.echo(f"✅ Daemon listening on {socket_path}.")
+    else:
+        click.echo("⚠️ No daemon is running.")
+
+daemon.add_command(start)
+daemon.add_command(stop)
+daemon.add_command(status)
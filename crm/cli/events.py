@@ -1,9 +1,13 @@
 import click
 from crm.database import DB
-from crm.services.events import create_event, get_event, get_all_events, update_event, delete_event
+from crm.services.events import create_event, get_event, get_all_events, update_event, delete_event, import_events
 from crm.helpers.validator_helper import ValidatorHelper
+from crm.helpers.output_helper import OutputHelper
+from crm.helpers.format_helper import FormatHelper
+from crm.helpers.import_helper import ImportHelper
 from crm.helpers.authorize_helper import role_restricted, authentication_required, self_user_restricted, get_current_user
 from crm.enums.model_type_enum import ModelTypeEnum
+from crm.models.events import Event
 from crm.models.roles import RoleEnum
 from crm.enums.relationships_enum import RelationshipEnum
 
@@ -43,7 +47,6 @@ def add(name, location, attendees, notes, contract_id, start_date, end_date, sup
         click.echo("❌ Validation failed:")
         for error in validator.error_messages:
             click.echo(f"   - {error}")
-        DB.close()
         return
     
     try:
@@ -51,50 +54,45 @@ def add(name, location, attendees, notes, contract_id, start_date, end_date, sup
         click.echo(f"✅ Event {event.name} created!")
     except ValueError as e:
         click.echo(f"❌ Error: {e}")
-    finally:
-        DB.close()
 
 @click.command()
 @click.argument('event_id', type=int)
+@click.option('--format', 'output_format', type=click.Choice(OutputHelper.FORMATS), default="text", show_default=True, help="Output format.")
 @role_restricted([RoleEnum.SUPPORT])
-def view(event_id):
+def view(event_id, output_format):
     """Get a event by ID."""
     event = get_event(DB, event_id)
-    DB.close()
-    if event:
-        click.echo(f"👤 {event.infos}")
-    else:
-        click.echo("❌ Event not found!")
+    OutputHelper(lambda c: f"👤 {c.infos}", "❌ Event not found!", output_format=output_format, fields=Event.INFOS_LABELS).echo_rows([event] if event else [])
 
 @click.command()
 @click.option('--filter-field', type=str, help="Field to filter by (available choices are: id, name, location, attendees, notes, contract_id, start_date, end_date, support_id).")
 @click.option('--filter-value', type=str, help="Value to filter by.")
+@click.option('--limit', type=click.IntRange(min=1), help="Maximum number of events to list.")
+@click.option('--after', 'after_id', type=int, help="Only list events with a greater ID, i.e. the cursor printed at the end of the previous page.")
+@click.option('--stream', is_flag=True, help="Fetch events in batches while printing them instead of loading them all first.")
+@click.option('--format', 'output_format', type=click.Choice(OutputHelper.FORMATS), default="text", show_default=True, help="Output format.")
 @authentication_required()
-def list(filter_field, filter_value):
+def list(filter_field, filter_value, limit, after_id, stream, output_format):
     """List all events."""
     try:
-        events = get_all_events(DB, filter_field, filter_value)
+        events = get_all_events(DB, filter_field, filter_value, limit, after_id, stream, tuple(Event.MINIMAL_INFOS_LABELS))
     except ValueError as e:
         click.echo(f"🚨 {str(e)}")
         raise SystemExit(1)
-    DB.close()
 
-    if not events:
-        click.echo("🚨 No events found!")
-    else:
-        for c in events:
-            click.echo(f"👤 {c.minimal_infos}")
+    output = OutputHelper(lambda c: f"👤 {FormatHelper.format_infos(c, Event.MINIMAL_INFOS_LABELS)}", "🚨 No events found!", limit, output_format, Event.MINIMAL_INFOS_LABELS)
+    output.echo_rows(events)
 
 @click.command()
 @click.argument('event_id', type=int)
-@click.option('--name', prompt="Name", help="Name of the event")
-@click.option('--location', prompt="Location", help="Location of the event")
-@click.option('--attendees', prompt="Number of attendees", help="Number of attendees of the event", type=int)
-@click.option('--notes', prompt="Additional notes", help="Notes of the event")
-@click.option('--contract-id', prompt="Contract ID", help="Contract ID of the event related contract", type=int)
-@click.option('--start-date', prompt="Start date (⚠️Should follow this strict format: \"DD/MM/YYYY-HHhMM\")", help="Start date of the event")
-@click.option('--end-date', prompt="End date (⚠️Should follow this strict format: \"DD/MM/YYYY-HHhMM\")", help="End date of the event")
-@click.option('--support-id', prompt="Support ID", help="Collaborator ID of the event related support collaborator", type=int)
+@click.option('--name', help="Name of the event")
+@click.option('--location', help="Location of the event")
+@click.option('--attendees', help="Number of attendees of the event", type=int)
+@click.option('--notes', help="Notes of the event")
+@click.option('--contract-id', help="Contract ID of the event related contract", type=int)
+@click.option('--start-date', help="Start date of the event, formatted as \"DD/MM/YYYY-HHhMM\"")
+@click.option('--end-date', help="End date of the event, formatted as \"DD/MM/YYYY-HHhMM\"")
+@click.option('--support-id', help="Collaborator ID of the event related support collaborator", type=int)
 @role_restricted([RoleEnum.MANAGEMENT, RoleEnum.SUPPORT], True)
 def edit(event_id, name, location, attendees, notes, contract_id, start_date, end_date, support_id):
     """Edit a event."""
@@ -108,6 +106,11 @@ def edit(event_id, name, location, attendees, notes, contract_id, start_date, en
         "end_date": end_date,
         "support_id": support_id
     }
+    # Only the given options are validated and written
+    data = {field: value for field, value in data.items() if value is not None}
+    if not data:
+        click.echo("⚠️ Nothing to update, pass the options of the fields to change (see --help).")
+        return
 
     validator = ValidatorHelper(DB, ModelTypeEnum.EVENT, data)
     validator.validate_data()
@@ -116,12 +119,10 @@ def edit(event_id, name, location, attendees, notes, contract_id, start_date, en
         click.echo("❌ Validation failed:")
         for error in validator.error_messages:
             click.echo(f"   - {error}")
-        DB.close()
         return
     
-    event = update_event(DB, event_id, **data)
-    DB.close()
-    if event:
+    success = update_event(DB, event_id, **data)
+    if success:
         click.echo(f"✅ Event {event_id} updated successfully!")
     else:
         click.echo("❌ Event not found!")
@@ -133,14 +134,47 @@ def edit(event_id, name, location, attendees, notes, contract_id, start_date, en
 def delete(event_id):
     """Remove a event."""
     success = delete_event(DB, event_id)
-    DB.close()
     if success:
         click.echo(f"✅ Event {event_id} deleted successfully!")
     else:
         click.echo("❌ Event not found!")
 
+@click.command(name="import")
+@click.argument('file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'file_format', type=click.Choice(ImportHelper.FORMATS), help="File format, guessed from the extension by default.")
+@click.option('--chunk-size', type=click.IntRange(min=1), default=ImportHelper.CHUNK_SIZE, show_default=True, help="Rows validated and inserted per transaction.")
+@click.option('--errors', 'report_path', type=click.Path(dir_okay=False), help="CSV report of the rejected rows, defaults to FILE.errors.csv.")
+@role_restricted([RoleEnum.SALES])
+def import_file(file, file_format, chunk_size, report_path):
+    """Import events from a CSV or JSON lines file."""
+    import_helper = import_events(DB, file, file_format, chunk_size, report_path or f"{file}.errors.csv")
+    import_helper.echo_summary("events")
+
+@click.command()
+@click.option('--filter-field', type=str, help="Field to filter by (available choices are: id, name, location, attendees, notes, contract_id, start_date, end_date, support_id).")
+@click.option('--filter-value', type=str, help="Value to filter by.")
+@click.option('--format', 'output_format', type=click.Choice(OutputHelper.EXPORT_FORMATS), default="csv", show_default=True, help="Export format.")
+@click.option('--gzip', 'compress', is_flag=True, help="Compress the export with gzip.")
+@click.option('--output', 'output_path', type=click.Path(dir_okay=False, allow_dash=True), default="-", help="File to write to, stdout by default.")
+@authentication_required()
+def export(filter_field, filter_value, output_format, compress, output_path):
+    """Export events to CSV or JSON lines, streaming them from the database."""
+    try:
+        events = get_all_events(DB, filter_field, filter_value, stream=True, columns=tuple(Event.INFOS_LABELS))
+    except ValueError as e:
+        click.echo(f"🚨 {str(e)}", err=True)
+        raise SystemExit(1)
+
+    with OutputHelper.open_stream(output_path, compress) as stream:
+        output = OutputHelper(None, "🚨 No events found!", output_format=output_format, fields=Event.INFOS_LABELS, stream=stream)
+        count = output.echo_rows(events)
+    if count:
+        click.echo(f"✅ {count} events exported.", err=True)
+
 events.add_command(add)
 events.add_command(view)
 events.add_command(list)
 events.add_command(edit)
 events.add_command(delete)
+events.add_command(import_file)
+events.add_command(export)
@@ -1,29 +1,84 @@
 import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+import importlib
+from contextlib import nullcontext
 import click
-from crm.cli.collaborators import collaborators
-from crm.cli.clients import clients
-from crm.cli.contracts import contracts
-from crm.cli.events import events
-from crm.cli.auth import auth
-from config import sentry_sdk
+from crm.helpers.telemetry_helper import capture_exception, command_transaction
+from crm.helpers.daemon_helper import forward_command
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group importing a subcommand's module only when that subcommand is invoked."""
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Maps a subcommand name to its ("module.path:attribute", short help) pair
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self.load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def load_command(self, cmd_name):
+        import_path, _ = self.lazy_subcommands[cmd_name]
+        module_name, attribute = import_path.split(":")
+        return getattr(importlib.import_module(module_name), attribute)
+
+    def format_commands(self, ctx, formatter):
+        """Lists subcommands from their declared help so that --help imports nothing."""
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_subcommands:
+                rows.append((name, self.lazy_subcommands[name][1]))
+            else:
+                command = super().get_command(ctx, name)
+                if command is not None and not command.hidden:
+                    rows.append((name, command.get_short_help_str()))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup, lazy_subcommands={
+    "auth": ("crm.cli.auth:auth", "Manage authentication"),
+    "collaborators": ("crm.cli.collaborators:collaborators", "Manage Collaborators"),
+    "clients": ("crm.cli.clients:clients", "Manage Clients"),
+    "contracts": ("crm.cli.contracts:contracts", "Manage Contracts"),
+    "events": ("crm.cli.events:events", "Manage Events"),
+    "daemon": ("crm.cli.daemon:daemon", "Manage the resident daemon"),
+    "shell": ("crm.cli.shell:shell", "Run commands in an interactive shell"),
+})
 def cli():
     """Epic Events CLI"""
     pass
 
-cli.add_command(auth)
-cli.add_command(collaborators)
-cli.add_command(clients)
-cli.add_command(contracts)
-cli.add_command(events)
+# Subcommands working on the database, the shell and the daemon opening a unit of work per command themselves
+SESSION_SUBCOMMANDS = {"auth", "collaborators", "clients", "contracts", "events"}
+
+
+def command_session(args):
+    """Unit of work of a database-backed command, crm.database being imported for those only."""
+    if not args or args[0] not in SESSION_SUBCOMMANDS:
+        return nullcontext()
+    from crm.database import unit_of_work
+
+    return unit_of_work()
 
 if __name__ == "__main__":
+    # A running daemon executes the command with everything already loaded
+    exit_code = forward_command(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
     try:
-        cli()
+        with command_transaction(sys.argv[1:]), command_session(sys.argv[1:]):
+            cli()
     except Exception as e:
-        sentry_sdk.capture_exception(e)
+        capture_exception(e)
         raise
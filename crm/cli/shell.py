@@ -0,0 +1,171 @@
+import os
+import shlex
+import click
+from config import SHELL_HISTORY_FILE
+from crm.database import unit_of_work
+from crm.helpers.authorize_helper import current_auth, resolve_current_user
+from crm.helpers.telemetry_helper import capture_exception
+from crm.helpers.cache_helper import CacheHelper
+
+try:
+    import readline
+except ImportError:
+    # No line editing on this platform, the shell still works without completion and history
+    readline = None
+
+EXIT_COMMANDS = ["exit", "quit"]
+# Reports the hits and misses of the reference data caches
+CACHE_COMMAND = "cache"
+HISTORY_LENGTH = 1000
+
+
+class ShellCompleter:
+    def __init__(self, root, ctx):
+        """
+        Initialize the ShellCompleter class.
+
+        :param root: Root click group of the shell's commands
+        :param ctx: Click context of the shell command
+        """
+        self.root = root
+        self.ctx = ctx
+        self.matches = []
+
+    def complete(self, text, state):
+        """readline completer, called with increasing states until it returns None."""
+        if state == 0:
+            line = readline.get_line_buffer()[:readline.get_begidx()]
+            self.matches = self.completions(line, text)
+        return self.matches[state] if state < len(self.matches) else None
+
+    def completions(self, line, text):
+        """
+        List the subcommands or options that may follow a line.
+
+        :param line: Words typed before the one being completed
+        :param text: Beginning of the word being completed
+        :return: Sorted candidates starting with text
+        """
+        command = self.root
+        for word in line.split():
+            if not isinstance(command, click.Group):
+                break
+            subcommand = command.get_command(self.ctx, word)
+            if subcommand is None:
+                break
+            command = subcommand
+
+        if isinstance(command, click.Group):
+            candidates = command.list_commands(self.ctx)
+            if command is self.root:
+                candidates = candidates + ["help", CACHE_COMMAND] + EXIT_COMMANDS
+        else:
+            candidates = [opt for param in command.params if isinstance(param, click.Option) for opt in param.opts]
+            candidates.append("--help")
+        return sorted(candidate for candidate in set(candidates) if candidate.startswith(text))
+
+
+def setup_readline(completer):
+    if readline is None:
+        return
+    if os.path.exists(SHELL_HISTORY_FILE):
+        try:
+            readline.read_history_file(SHELL_HISTORY_FILE)
+        except OSError:
+            pass
+    readline.set_history_length(HISTORY_LENGTH)
+    readline.set_completer_delims(" \t\n")
+    readline.set_completer(completer.complete)
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+
+def save_history():
+    if readline is None:
+        return
+    try:
+        readline.write_history_file(SHELL_HISTORY_FILE)
+    except OSError:
+        pass
+
+def resolve_session_user():
+    """
+    Resolve the logged-in collaborator for the next shell command.
+
+    :return: (collaborator, None) pair, or None if nobody is logged in
+    """
+    with unit_of_work():
+        collaborator, error = resolve_current_user()
+    if error:
+        return None
+    return collaborator, None
+
+def echo_cache_stats():
+    for name, stats in CacheHelper.all_stats().items():
+        click.echo(f"📊 {name}: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} cached")
+
+def run_command(root, args):
+    """Run a command like the CLI does in its own unit of work, without ever leaving the shell."""
+    try:
+        with unit_of_work():
+            root.main(args=args, prog_name="crm", standalone_mode=False)
+    except click.ClickException as e:
+        e.show()
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+    except SystemExit:
+        pass
+    except Exception as e:
+        capture_exception(e)
+        click.echo(f"❌ Error: {e}", err=True)
+
+
+@click.command()
+@click.pass_context
+def shell(ctx):
+    """Run commands in an interactive shell, keeping the CRM loaded between them."""
+    root = ctx.find_root().command
+    setup_readline(ShellCompleter(root, ctx))
+    click.echo("✅ Epic Events shell, type 'help' for the commands, 'cache' for the cache counters, Tab to complete and 'exit' to quit.")
+
+    try:
+        while True:
+            try:
+                line = input("crm> ")
+            except EOFError:
+                click.echo()
+                break
+            except KeyboardInterrupt:
+                click.echo()
+                continue
+
+            try:
+                args = shlex.split(line)
+            except ValueError as e:
+                click.echo(f"❌ {e}")
+                continue
+            if not args:
+                continue
+            if args[0] in EXIT_COMMANDS:
+                break
+            if args[0] == "shell":
+                click.echo("⚠️ Already in the shell.")
+                continue
+            if args[0] == CACHE_COMMAND:
+                echo_cache_stats()
+                continue
+            if args[0] == "help":
+                args = args[1:] + ["--help"]
+
+            # The collaborator is resolved again before each command, so that an expired or revoked
+            # token stops the next one, and shared by that command's auth checks
+            session_user = resolve_session_user()
+            auth_token = current_auth.set(session_user) if session_user is not None else None
+            try:
+                run_command(root, args)
+            finally:
+                if auth_token is not None:
+                    current_auth.reset(auth_token)
+    finally:
+        save_history()
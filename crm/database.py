@@ -1,6 +1,18 @@
-from sqlalchemy import create_engine, inspect
-from sqlalchemy.orm import sessionmaker
-from config import DATABASE_URL
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import create_engine, inspect, make_url, event
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from config import (
+    DATABASE_URL,
+    SQLITE_PROFILE,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_POOL_RECYCLE,
+    DB_POOL_PRE_PING,
+    DB_CONNECT_TIMEOUT
+)
 from crm.models import Base
 
 from crm.models.roles import Role
@@ -9,7 +21,164 @@ from crm.models.clients import Client
 from crm.models.contracts import Contract
 from crm.models.events import Event
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+_engine = None
+_async_engine = None
 
-DB = SessionLocal()
+# asyncio driver used by the async engine for each backend
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+}
+
+SQLITE_PROFILES = {
+    # SQLite defaults: rollback journal, full sync, writers block readers
+    "default": {},
+    # WAL lets readers work while one connection writes, and lock waits are retried instead of failing
+    "concurrent": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+    },
+    # Also reads through a memory map and keeps more pages and temporary tables in memory
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+
+
+def engine_options(database_url):
+    """Returns the create_engine keyword arguments of the configured profile for a database URL."""
+    if make_url(database_url).get_backend_name() == "sqlite":
+        return {}
+
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+        "connect_args": {"connect_timeout": DB_CONNECT_TIMEOUT},
+    }
+
+def apply_sqlite_profile(engine, profile_name):
+    """Set the pragmas of a SQLITE_PROFILES profile on every new connection of a SQLite engine."""
+    if profile_name not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLite profile '{profile_name}', expected one of: {', '.join(SQLITE_PROFILES)}")
+    pragmas = SQLITE_PROFILES[profile_name]
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+def get_engine():
+    """Create the engine on first use so importing this module stays cheap."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+        if _engine.dialect.name == "sqlite":
+            apply_sqlite_profile(_engine, SQLITE_PROFILE)
+    return _engine
+
+
+def async_database_url(database_url):
+    """Returns a database URL using the asyncio driver of its backend, e.g. sqlite+aiosqlite for sqlite."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver configured for '{backend}' databases, expected one of: {', '.join(ASYNC_DRIVERS)}")
+    return url.set(drivername=ASYNC_DRIVERS[backend])
+
+def get_async_engine():
+    """Create the async engine on first use, with the same pool options and SQLite profile as the sync one."""
+    global _async_engine
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        _async_engine = create_async_engine(async_database_url(DATABASE_URL), **engine_options(DATABASE_URL))
+        if _async_engine.dialect.name == "sqlite":
+            apply_sqlite_profile(_async_engine.sync_engine, SQLITE_PROFILE)
+    return _async_engine
+
+def get_async_session(engine=None):
+    """
+    New AsyncSession for the async services, to be used as `async with get_async_session() as db:`.
+
+    Loaded attributes are kept on commit, reloading them would need an await on attribute access.
+
+    :param engine: AsyncEngine to use, defaults to get_async_engine()
+    """
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    return AsyncSession(engine or get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+class LazyBindSession(Session):
+    """Session binding itself to the engine only when it first talks to the database."""
+
+    def get_bind(self, *args, **kwargs):
+        if self.bind is None:
+            self.bind = get_engine()
+        return super().get_bind(*args, **kwargs)
+
+
+def __getattr__(name):
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Key of the running unit of work, each one getting its own session from the DB registry
+_unit_of_work_scope = ContextVar("unit_of_work_scope", default=None)
+
+
+def session_scope():
+    """Scope of the DB registry: the running unit of work, else the current thread."""
+    scope = _unit_of_work_scope.get()
+    return scope if scope is not None else threading.get_ident()
+
+@contextmanager
+def unit_of_work():
+    """
+    Run a block, typically one command or request, on its own session: committed when the block ends
+    normally, rolled back if it raises, then closed and dropped from the registry.
+
+    DB resolves to this session anywhere in the block, including in tasks and threads started with
+    a copy of its context, so concurrent units of work never share an identity map or connection.
+    """
+    token = _unit_of_work_scope.set(object())
+    try:
+        session = DB()
+        try:
+            yield session
+            session.commit()
+        except SystemExit as e:
+            # click ends every command with SystemExit, only a non-zero code is a failure
+            if e.code in (None, 0):
+                session.commit()
+            else:
+                session.rollback()
+            raise
+        except BaseException:
+            session.rollback()
+            raise
+        finally:
+            DB.remove()
+    finally:
+        _unit_of_work_scope.reset(token)
+
+
+# Committed entities keep their state, each command's unit of work being too short-lived to go stale
+SessionLocal = sessionmaker(class_=LazyBindSession, autocommit=False, autoflush=False, expire_on_commit=False)
+
+# Session registry, DB.<method> acting on the session of the running unit of work
+DB = scoped_session(SessionLocal, scopefunc=session_scope)
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class TelemetryModeEnum(Enum):
+    OFF = "off"
+    ERRORS = "errors"
+    TRACES = "traces"
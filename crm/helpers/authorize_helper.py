@@ -1,8 +1,8 @@
 import jwt
 import click
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
 from functools import wraps
-from crm.models.collaborators import Collaborator
 from crm.models.clients import Client
 from crm.models.contracts import Contract
 from crm.models.roles import RoleEnum
@@ -11,9 +11,21 @@ from crm.models.blacklist_tokens import BlacklistToken
 import keyring
 from config import SECRET_KEY, KEYRING_SERVICE
 from crm.database import DB
+from crm.helpers.cache_helper import get_collaborator_entry
+
+# (collaborator, error) pair resolved once by the auth decorators for the running command
+current_auth = ContextVar("current_auth", default=None)
 
 
 def get_current_user():
+    """Retrieve the currently logged-in user, reusing the one resolved for the running command."""
+    resolved = current_auth.get()
+    if resolved is not None:
+        return resolved
+
+    return resolve_current_user()
+
+def resolve_current_user():
     """Retrieve the currently logged-in user using stored token."""
     token = keyring.get_password(KEYRING_SERVICE, "auth_token")
     if not token:
@@ -30,11 +42,18 @@ def authentication_required():
     def decorator(f):
         @wraps(f)
         def decorated(*args, **kwargs):
-            current_user, error = get_current_user()
-            if error:
-                click.echo(error)
-                return
-            return f(*args, **kwargs)
+            if current_auth.get() is not None:
+                return f(*args, **kwargs)
+
+            context_token = current_auth.set(get_current_user())
+            try:
+                current_user, error = current_auth.get()
+                if error:
+                    click.echo(error)
+                    return
+                return f(*args, **kwargs)
+            finally:
+                current_auth.reset(context_token)
         return decorated
     return decorator
 
@@ -49,7 +68,7 @@ def get_authenticated_collaborator(token):
         if not isinstance(collaborator_id, str) or not collaborator_id.isdigit():
             return None, "❌ Token is invalid or expired."
 
-        current_collaborator = DB.get(Collaborator, int(collaborator_id))
+        current_collaborator = get_collaborator_entry(DB, int(collaborator_id))
 
         if not current_collaborator:
             return None, "❌ Unauthorized token for this action."
@@ -120,7 +139,7 @@ def decode_auth_token(auth_token):
     try:
         payload = jwt.decode(auth_token, SECRET_KEY, algorithms=["HS256"])
         
-        blacklisted = DB.query(BlacklistToken).filter_by(token=auth_token).first()
+        blacklisted = DB.query(BlacklistToken.id).filter_by(token_digest=BlacklistToken.digest(auth_token)).first()
         if blacklisted:
             return "Token has been revoked. Please log in again."
 
@@ -143,6 +162,10 @@ def relationship_check_switch(current_collaborator, relationship_enum=Relationsh
 def collaborator_client_relationship_check(current_collaborator, *args, **kwargs):
     """Ensure a collaborator can only interact with assigned clients."""
     client_id = kwargs.get("client_id")
+    if client_id is None and kwargs.get("contract_id") is not None:
+        # Contract edits without --client-id are checked against the contract's current client
+        contract = DB.get(Contract, kwargs["contract_id"])
+        client_id = contract.client_id if contract else None
 
     client = DB.query(Client).filter(
         Client.id == client_id,
@@ -0,0 +1,108 @@
+import threading
+import time
+from collections import namedtuple
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from config import REFERENCE_CACHE_TTL
+from crm.models.roles import Role
+from crm.models.collaborators import Collaborator
+
+# Cached rows, detached from any session so that they can be shared by every command of the process
+RoleEntry = namedtuple("RoleEntry", ["id", "name"])
+CollaboratorEntry = namedtuple("CollaboratorEntry", ["id", "role_id", "first_name", "last_name"])
+
+
+class CacheHelper:
+    # Every cache of the process, by name
+    caches = {}
+
+    def __init__(self, name: str, ttl: float = REFERENCE_CACHE_TTL):
+        """
+        Initialize the CacheHelper class, a process-local cache whose entries expire after a TTL.
+
+        :param name: Name under which the cache is registered and its counters reported
+        :param ttl: Seconds an entry is kept, 0 disabling the cache
+        """
+        self.name = name
+        self.ttl = ttl
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        CacheHelper.caches[name] = self
+
+    def get(self, key, load):
+        """
+        Returns the cached value of a key, loading it on a miss or once expired.
+
+        :param key: Cache key
+        :param load: Function returning the value of the key, None values not being cached
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = load()
+        if value is not None:
+            self.set(key, value)
+        return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key=None):
+        """Drop the entry of a key, or every entry if no key is given."""
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
+
+    def reset(self):
+        """Drop every entry and zero the counters."""
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries)}
+
+    @classmethod
+    def all_stats(cls):
+        """Counters of every cache, by name."""
+        return {name: cache.stats() for name, cache in cls.caches.items()}
+
+    @classmethod
+    def reset_all(cls):
+        for cache in cls.caches.values():
+            cache.reset()
+
+
+role_cache = CacheHelper("roles")
+collaborator_cache = CacheHelper("collaborators")
+
+
+def get_role(db: Session, role_id: int):
+    """Returns the RoleEntry of an ID, or None if it does not exist. Every role is loaded on the first miss."""
+    def load():
+        roles = {row.id: RoleEntry(*row) for row in db.execute(select(Role.id, Role.name))}
+        for entry in roles.values():
+            role_cache.set(entry.id, entry)
+        return roles.get(role_id)
+
+    return role_cache.get(role_id, load)
+
+def get_collaborator_entry(db: Session, collaborator_id: int):
+    """Returns the CollaboratorEntry of an ID, or None if it does not exist."""
+    def load():
+        row = db.execute(
+            select(Collaborator.id, Collaborator.role_id, Collaborator.first_name, Collaborator.last_name)
+            .where(Collaborator.id == collaborator_id)
+        ).first()
+        return CollaboratorEntry(*row) if row else None
+
+    return collaborator_cache.get(collaborator_id, load)
@@ -0,0 +1,263 @@
+import io
+import json
+import os
+import socket
+import struct
+import sys
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+from config import DAEMON_SOCKET, DATABASE_URL, KEYRING_SERVICE
+
+# Frames sent by the daemon: a channel byte, the payload length and the payload
+STDOUT = b"o"
+STDERR = b"e"
+EXIT = b"x"
+FALLBACK = b"f"
+FRAME_HEADER = struct.Struct("!cI")
+
+# Commands always run in-process: managing the daemon itself and the interactive ones
+LOCAL_COMMANDS = {"daemon", "shell"}
+
+
+def command_settings():
+    """Settings choosing the data a command acts on, the daemon only runs the commands of clients sharing its own."""
+    return {
+        "DATABASE_URL": DATABASE_URL,
+        "KEYRING_SERVICE": KEYRING_SERVICE,
+        "PYTHON_KEYRING_BACKEND": os.environ.get("PYTHON_KEYRING_BACKEND"),
+    }
+
+
+def forward_command(argv, socket_path: str = DAEMON_SOCKET, stdout=None, stderr=None, settings: dict = None):
+    """
+    Run a command in the daemon if one is listening, streaming its output back.
+
+    :param argv: Command line arguments, without the program name
+    :param socket_path: Unix socket of the daemon
+    :param stdout: Binary stream receiving the command's output, defaults to sys.stdout
+    :param stderr: Binary stream receiving the command's errors, defaults to sys.stderr
+    :param settings: Settings of the caller, defaults to command_settings()
+    :return: Exit code of the command, or None if it must run in-process
+    """
+    if not hasattr(socket, "AF_UNIX") or (argv and argv[0] in LOCAL_COMMANDS):
+        return None
+    try:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(socket_path)
+    except OSError:
+        return None
+
+    outputs = {
+        STDOUT: stdout or sys.stdout.buffer,
+        STDERR: stderr or sys.stderr.buffer,
+    }
+    with connection, connection.makefile("rb") as frames:
+        try:
+            send_message(connection, {
+                "argv": list(argv),
+                "cwd": os.getcwd(),
+                "prog_name": os.path.basename(sys.argv[0]),
+                "settings": command_settings() if settings is None else settings,
+            })
+            header = frames.read(FRAME_HEADER.size)
+        except OSError:
+            return None
+        if len(header) < FRAME_HEADER.size:
+            # Closed without an answer: the daemon was stopping, the command runs in-process
+            return None
+        while True:
+            channel, length = FRAME_HEADER.unpack(header)
+            payload = frames.read(length)
+            if channel == EXIT:
+                return int(payload)
+            if channel == FALLBACK:
+                return None
+            outputs[channel].write(payload)
+            outputs[channel].flush()
+            header = frames.read(FRAME_HEADER.size)
+            if len(header) < FRAME_HEADER.size:
+                # The daemon died mid-command
+                return 1
+
+def send_message(connection, message: dict):
+    connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+def stop_daemon(socket_path: str = DAEMON_SOCKET):
+    """Ask a running daemon to exit, returns False if none is listening."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(socket_path)
+            send_message(connection, {"control": "stop"})
+            connection.makefile("rb").read()
+        return True
+    except OSError:
+        return False
+
+def is_daemon_running(socket_path: str = DAEMON_SOCKET):
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(socket_path)
+            send_message(connection, {"control": "ping"})
+        return True
+    except OSError:
+        return False
+
+
+class SocketWriter(io.RawIOBase):
+    """Binary stream sending what is written to it as frames of a channel."""
+
+    def __init__(self, connection, channel):
+        self.connection = connection
+        self.channel = channel
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if data:
+            self.connection.sendall(FRAME_HEADER.pack(self.channel, len(data)) + bytes(data))
+        return len(data)
+
+
+class DaemonServer:
+    def __init__(self, socket_path: str = DAEMON_SOCKET):
+        """
+        Initialize the DaemonServer class, which runs the commands of its clients one at a time in this process,
+        keeping the imported modules, the engine and its connection pool warm between them.
+
+        :param socket_path: Unix socket to listen on, only the current user can connect to it
+        """
+        self.socket_path = socket_path
+        self.running = False
+        self.server = None
+
+    def serve_forever(self, ready=None):
+        """
+        Accept commands until stopped.
+
+        :param ready: threading.Event set once the socket listens (optional)
+        """
+        from crm.cli.main import cli
+        from crm.database import get_engine
+        # Warm everything up front so that the first command is as fast as the next ones
+        for name in cli.list_commands(None):
+            cli.get_command(None, name)
+        get_engine()
+
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        previous_umask = os.umask(0o177)
+        try:
+            self.server.bind(self.socket_path)
+        finally:
+            os.umask(previous_umask)
+        self.server.listen()
+        self.running = True
+        if ready is not None:
+            ready.set()
+
+        try:
+            while self.running:
+                connection, _ = self.server.accept()
+                with connection:
+                    try:
+                        self.handle(connection, cli)
+                    except OSError:
+                        # The client went away, nothing to answer to
+                        continue
+                    except (ValueError, TypeError, AttributeError):
+                        # Malformed message, the daemon keeps serving the other clients
+                        continue
+        finally:
+            self.close_server()
+
+    def close_server(self):
+        """Stop listening and remove the socket, so that new clients run their commands in-process."""
+        if self.server is None:
+            return
+        self.server.close()
+        self.server = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def handle(self, connection, cli):
+        line = connection.makefile("rb").readline()
+        if not line:
+            return
+        message = json.loads(line)
+        if not isinstance(message, dict):
+            return
+        if message.get("control") == "stop":
+            # Closed before the stop is acknowledged, so no client can reach a dying daemon
+            self.running = False
+            self.close_server()
+            return
+        argv = message.get("argv")
+        if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+            return
+        if message.get("settings") != command_settings():
+            # Pointed at another database or keyring, the client runs the command on its own data
+            connection.sendall(FRAME_HEADER.pack(FALLBACK, 0))
+            return
+        if needs_prompt(cli, argv):
+            # Prompts need the client's terminal, it runs the command itself
+            connection.sendall(FRAME_HEADER.pack(FALLBACK, 0))
+            return
+
+        exit_code = self.run_command(connection, cli, argv, message.get("cwd"), message.get("prog_name") or "crm")
+        connection.sendall(FRAME_HEADER.pack(EXIT, len(str(exit_code))) + str(exit_code).encode())
+
+    def run_command(self, connection, cli, argv, cwd=None, prog_name="crm"):
+        from crm.database import unit_of_work
+        from crm.helpers.telemetry_helper import capture_exception, command_transaction
+
+        stdout = io.TextIOWrapper(io.BufferedWriter(SocketWriter(connection, STDOUT)), encoding="utf-8", line_buffering=True)
+        stderr = io.TextIOWrapper(io.BufferedWriter(SocketWriter(connection, STDERR)), encoding="utf-8", line_buffering=True)
+        previous_cwd, previous_stdin = os.getcwd(), sys.stdin
+        exit_code = 0
+        try:
+            if cwd:
+                os.chdir(cwd)
+            sys.stdin = io.StringIO()
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    with command_transaction(argv), unit_of_work():
+                        cli.main(args=argv, prog_name=prog_name, standalone_mode=True)
+                except SystemExit as e:
+                    exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                except Exception as e:
+                    capture_exception(e)
+                    traceback.print_exc()
+                    exit_code = 1
+                finally:
+                    stdout.flush()
+                    stderr.flush()
+        finally:
+            sys.stdin = previous_stdin
+            os.chdir(previous_cwd)
+        return exit_code
+
+
+def needs_prompt(cli, argv):
+    """Whether the command would prompt for an option missing from its arguments."""
+    import click
+
+    try:
+        ctx = cli.make_context("crm", list(argv), resilient_parsing=True)
+        while isinstance(ctx.command, click.Group):
+            args = ctx.protected_args + ctx.args
+            if not args:
+                return False
+            cmd_name, command, args = ctx.command.resolve_command(ctx, args)
+            if command is None:
+                return False
+            ctx = command.make_context(cmd_name, args, parent=ctx, resilient_parsing=True)
+    except click.ClickException:
+        # Let the daemon report the usage error
+        return False
+
+    return any(
+        isinstance(param, click.Option) and param.prompt and ctx.params.get(param.name) is None
+        for param in ctx.command.params
+    )
@@ -1,9 +1,13 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, Integer, String, DateTime, Boolean, Float
+from sqlalchemy import or_, select, Integer, String, DateTime, Boolean, Float
 from datetime import datetime
 from crm.helpers.format_helper import FormatHelper
+from crm.helpers.search_helper import SearchHelper
 
 class FilterHelper:
+    # Rows fetched per round trip when streaming results
+    STREAM_BATCH_SIZE = 500
+
     def __init__(self, db: Session, model):
         """
         Initialize the FilterHelper class.
@@ -14,16 +18,57 @@ class FilterHelper:
         self.db = db
         self.model = model
         self.format_helper = FormatHelper
+        self.search_helper = SearchHelper(db, model)
 
-    def apply_filter(self, filter_field: str = None, filter_value: str = None):
+    def apply_filter(self, filter_field: str = None, filter_value: str = None, limit: int = None, after_id: int = None, stream: bool = False, columns=None):
         """
-        Apply filtering and sorting logic to the query.
+        Apply filtering, sorting and pagination logic to the query.
 
         :param filter_field: Field to filter by (optional)
         :param filter_value: Value to filter by (optional)
-        :return: Query result after filtering and sorting
+        :param limit: Maximum number of rows to return (optional)
+        :param after_id: Keyset cursor, only rows with a greater id are returned (optional)
+        :param stream: Fetch rows in batches through a server-side cursor instead of all at once
+        :param columns: Names of the only columns to select, rows are then returned as read-only tuples
+            instead of entities (optional)
+        :return: Iterator over the query result after filtering, sorting and pagination
+        """
+        statement = self.build_statement(filter_field, filter_value, limit, after_id, columns)
+
+        # yield_per also turns on stream_results, i.e. server-side cursors where supported
+        if stream:
+            statement = statement.execution_options(yield_per=self.STREAM_BATCH_SIZE)
+
+        if columns:
+            return iter(self.db.execute(statement))
+        return iter(self.db.scalars(statement))
+
+    async def apply_filter_async(self, filter_field: str = None, filter_value: str = None, limit: int = None, after_id: int = None, stream: bool = False, columns=None):
+        """
+        Async counterpart of apply_filter, self.db being an AsyncSession.
+
+        :return: List of the entities or rows, or an async iterator over them when streaming
         """
-        query = self.db.query(self.model)
+        # The full-text index lookup done while building is synchronous, run it on the session's sync side
+        statement = await self.db.run_sync(
+            lambda session: FilterHelper(session, self.model).build_statement(filter_field, filter_value, limit, after_id, columns)
+        )
+        if stream:
+            statement = statement.execution_options(yield_per=self.STREAM_BATCH_SIZE)
+            return await (self.db.stream(statement) if columns else self.db.stream_scalars(statement))
+        result = await (self.db.execute(statement) if columns else self.db.scalars(statement))
+        return result.all()
+
+    def build_statement(self, filter_field: str = None, filter_value: str = None, limit: int = None, after_id: int = None, columns=None):
+        """
+        Build the SELECT statement of apply_filter, so that it can also be run by an AsyncSession.
+
+        :return: SQLAlchemy Select
+        """
+        if columns:
+            query = select(*[getattr(self.model, column) for column in columns])
+        else:
+            query = select(self.model)
 
         if filter_value:
             # Check if filter_field is valid
@@ -63,10 +108,14 @@ class FilterHelper:
             else:
                 # If no field is provided, apply filter across only compatible fields
                 filters = []
-                # String filters
-                for column in self.model.__table__.columns:
-                    if isinstance(column.type, String):
-                        filters.append(getattr(self.model, column.name).ilike(f'%{filter_value}%'))
+                # String filters, through the full-text index when there is one
+                search_filter = self.search_helper.search_filter(filter_value) if self.search_helper.is_indexed() else None
+                if search_filter is not None:
+                    filters.append(search_filter)
+                else:
+                    for column in self.model.__table__.columns:
+                        if isinstance(column.type, String):
+                            filters.append(getattr(self.model, column.name).ilike(f'%{filter_value}%'))
 
                 # Integer filters
                 for column in self.model.__table__.columns:
@@ -102,12 +151,20 @@ class FilterHelper:
                 if filters:
                     query = query.filter(or_(*filters))
 
-        # Sorting if filter_field is provided
-        if filter_field:
+        # Paginated results are walked by id so that the last id is a stable cursor,
+        # otherwise sorting if filter_field is provided
+        if limit is not None or after_id is not None:
+            if after_id is not None:
+                query = query.filter(self.model.id > after_id)
+            query = query.order_by(self.model.id)
+        elif filter_field:
             field = getattr(self.model, filter_field)
             query = query.order_by(field)
 
-        return query.all()
+        if limit is not None:
+            query = query.limit(limit)
+
+        return query
 
     def filter_ready_date(self, date):
         """Format and parse date for filtering."""
@@ -1,5 +1,8 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from bcrypt import hashpw, gensalt
+from config import BCRYPT_ROUNDS
 
 
 class FormatHelper:
@@ -7,6 +10,63 @@ class FormatHelper:
         """Convert 'DD/MM/YYYY-HHhMM' to a Python datetime object."""
         return datetime.strptime(date, "%d/%m/%Y-%Hh%M")
     
-    def hash_password(password: str) -> str:
-        """Hashes the password securely."""
-        return hashpw(password.encode('utf-8'), gensalt()).decode('utf-8')
\ No newline at end of file
+    def hash_password(password: str, rounds: int = None) -> str:
+        """Hashes the password securely, with BCRYPT_ROUNDS unless another cost is given."""
+        return hashpw(password.encode('utf-8'), gensalt(rounds or BCRYPT_ROUNDS)).decode('utf-8')
+
+    def password_rounds(password_hash: str) -> int:
+        """Returns the cost recorded in a bcrypt hash ('$2b$<cost>$<salt and hash>'), None if malformed."""
+        try:
+            return int(password_hash.split("$")[2])
+        except (AttributeError, IndexError, ValueError):
+            return None
+
+    def password_needs_rehash(password_hash: str) -> bool:
+        """Whether a hash was made with another cost than BCRYPT_ROUNDS."""
+        return FormatHelper.password_rounds(password_hash) != BCRYPT_ROUNDS
+
+    def hash_passwords(passwords, workers: int = None, executor: ProcessPoolExecutor = None) -> list:
+        """
+        Hash many passwords in parallel, bcrypt being CPU-bound.
+
+        :param passwords: Iterable of passwords
+        :param workers: Worker processes, defaults to the cores available to this process
+        :param executor: Pool shared by the calls of a run, see password_pool, one being started otherwise
+        :return: List of the hashes, in the order of the passwords
+        """
+        passwords = [*passwords]
+        workers = min(workers or FormatHelper.available_cores(), len(passwords))
+        if workers <= 1:
+            return [FormatHelper.hash_password(password) for password in passwords]
+        chunksize = max(1, len(passwords) // (workers * 4))
+        if executor is not None:
+            return [*executor.map(FormatHelper.hash_password, passwords, chunksize=chunksize)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return [*executor.map(FormatHelper.hash_password, passwords, chunksize=chunksize)]
+
+    def password_pool(workers: int = None) -> ProcessPoolExecutor:
+        """
+        Start the pool hashing the passwords of a whole run, to be shut down once it is over.
+
+        :param workers: Worker processes, defaults to the cores available to this process
+        :return: ProcessPoolExecutor, or None on a single core where passwords are hashed in process
+        """
+        workers = workers or FormatHelper.available_cores()
+        return ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    def available_cores() -> int:
+        if hasattr(os, "sched_getaffinity"):
+            return len(os.sched_getaffinity(0))
+        return os.cpu_count() or 1
+
+    def format_infos(row, labels: dict) -> str:
+        """Render labelled attributes of a model or a row the way the models' infos properties do."""
+        lines = "".join(
+            f"            {label}: {FormatHelper.format_info_value(getattr(row, field))}\n"
+            for field, label in labels.items()
+        )
+        return f"\n{lines}            "
+
+    def format_info_value(value):
+        """Dates are shown in ISO format, other values as they are."""
+        return value.isoformat() if isinstance(value, datetime) else value
@@ -0,0 +1,240 @@
+import csv
+import json
+import os
+import time
+import click
+from sqlalchemy import insert, Integer, Float, Boolean, DateTime
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from crm.models.clients import Client
+from crm.models.collaborators import Collaborator
+from crm.models.contracts import Contract
+from crm.models.events import Event
+from crm.enums.model_type_enum import ModelTypeEnum
+from crm.helpers.validator_helper import ValidatorHelper
+from crm.helpers.format_helper import FormatHelper
+
+
+class ImportHelper:
+    CHUNK_SIZE = 1000
+    FORMATS = ["csv", "jsonl"]
+    MODELS = {
+        ModelTypeEnum.CLIENT: Client,
+        ModelTypeEnum.COLLABORATOR: Collaborator,
+        ModelTypeEnum.CONTRACT: Contract,
+        ModelTypeEnum.EVENT: Event,
+    }
+    # Columns a file may provide for each model type, the others are ignored
+    FIELDS = {
+        ModelTypeEnum.CLIENT: ["first_name", "last_name", "email", "phone", "company_name", "first_contact_date", "last_contact_date"],
+        ModelTypeEnum.COLLABORATOR: ["first_name", "last_name", "email", "password", "role_id"],
+        ModelTypeEnum.CONTRACT: ["costing", "remaining_due_payment", "is_signed", "client_id", "commercial_id"],
+        ModelTypeEnum.EVENT: ["name", "location", "attendees", "notes", "contract_id", "start_date", "end_date", "support_id"],
+    }
+    # Fields never written to the error report, including the hashes set by prepare_chunk hooks
+    SECRET_FIELDS = {"password", "password_hash"}
+    TRUE_VALUES = {"true", "1", "yes", "y"}
+    FALSE_VALUES = {"false", "0", "no", "n"}
+
+    def __init__(self, db: Session, model_type, chunk_size: int = CHUNK_SIZE, report_path: str = None, prepare_chunk=None):
+        """
+        Initialize the ImportHelper class.
+
+        :param db: SQLAlchemy session
+        :param model_type: ModelTypeEnum of the imported rows
+        :param chunk_size: Rows validated and inserted per transaction
+        :param report_path: CSV file receiving the rejected rows, only created if a row is rejected (optional)
+        :param prepare_chunk: Callable receiving the valid (line, data) pairs of a chunk, it may complete
+            their data and returns a {line: error message} dict of rows to reject (optional)
+        """
+        self.db = db
+        self.model_type = model_type
+        self.model = self.MODELS[model_type]
+        self.columns = self.model.__table__.columns
+        self.chunk_size = chunk_size
+        self.report_path = report_path
+        self.prepare_chunk = prepare_chunk
+        self.report_file = None
+        self.report_writer = None
+        self.imported = 0
+        self.rejected = 0
+        self.elapsed = 0
+        self.ignored_fields = set()
+
+    @staticmethod
+    def read_file(path: str, file_format: str = None):
+        """
+        Stream the rows of a CSV (with a header row) or JSON lines file.
+
+        :param path: Path of the file
+        :param file_format: One of FORMATS, guessed from the extension by default
+        :return: Iterator of (line number, data dict, parse error) triples
+        """
+        file_format = file_format or ("jsonl" if os.path.splitext(path)[1].lower() in (".jsonl", ".json", ".ndjson") else "csv")
+        with open(path, newline="", encoding="utf-8-sig") as file:
+            if file_format == "csv":
+                reader = csv.DictReader(file)
+                for data in reader:
+                    # Cells beyond the header are gathered by DictReader under the None key
+                    extra_cells = data.pop(None, None)
+                    if extra_cells:
+                        yield reader.line_num, data, f"Unexpected extra columns: {len(extra_cells)} more cells than the header"
+                    else:
+                        yield reader.line_num, data, None
+            else:
+                for line_number, line in enumerate(file, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        yield line_number, {}, f"Invalid JSON: {e.msg}"
+                        continue
+                    if isinstance(data, dict):
+                        yield line_number, data, None
+                    else:
+                        yield line_number, {}, "Invalid JSON: expected an object"
+
+    def import_file(self, path: str, file_format: str = None):
+        """Import a CSV or JSON lines file, see import_rows."""
+        return self.import_rows(self.read_file(path, file_format))
+
+    def import_rows(self, rows):
+        """
+        Validate and insert rows by chunks, each chunk in its own transaction.
+
+        :param rows: Iterable of (line number, data dict, parse error) triples
+        :return: (imported rows, rejected rows, elapsed seconds) tuple
+        """
+        start = time.perf_counter()
+        chunk = []
+        try:
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) == self.chunk_size:
+                    self.import_chunk(chunk)
+                    chunk = []
+            if chunk:
+                self.import_chunk(chunk)
+        finally:
+            if self.report_file:
+                self.report_file.close()
+            self.elapsed = time.perf_counter() - start
+        return self.imported, self.rejected, self.elapsed
+
+    def echo_summary(self, entity_name: str):
+        """Print the outcome of the import and its throughput."""
+        if self.ignored_fields:
+            click.echo(f"⚠️ Ignored unknown columns: {', '.join(sorted(self.ignored_fields))}")
+        rate = (self.imported + self.rejected) / self.elapsed if self.elapsed else 0
+        click.echo(f"✅ {self.imported} {entity_name} imported in {self.elapsed:.2f}s ({rate:.0f} rows/s).")
+        if self.rejected:
+            click.echo(f"❌ {self.rejected} rows rejected, see {self.report_path or 'the report'} for details.")
+
+    def import_chunk(self, chunk):
+        coerced_rows = []
+        for line, data, error in chunk:
+            if error:
+                self.reject(line, data, [error])
+                continue
+
+            data, errors = self.coerce(data)
+            if errors:
+                self.reject(line, data, errors)
+            else:
+                coerced_rows.append((line, data))
+
+        # The foreign keys of the whole chunk are checked with one query per referenced model
+        validators = ValidatorHelper.validate_batch(
+            self.db, self.model_type, [data for _, data in coerced_rows], check_required_fields=True
+        )
+        valid_rows = []
+        for (line, data), validator in zip(coerced_rows, validators):
+            if validator.is_valid():
+                valid_rows.append((line, data))
+            else:
+                self.reject(line, data, validator.error_messages)
+
+        if valid_rows and self.prepare_chunk:
+            rejections = self.prepare_chunk(valid_rows)
+            for line, data in valid_rows:
+                if line in rejections:
+                    self.reject(line, data, [rejections[line]])
+            valid_rows = [(line, data) for line, data in valid_rows if line not in rejections]
+
+        if not valid_rows:
+            return
+
+        # Rows of an executemany must share their keys, omitted columns keep their default values
+        batches = {}
+        for _, data in valid_rows:
+            batches.setdefault(frozenset(data), []).append(self.insert_values(data))
+        try:
+            for batch in batches.values():
+                self.db.execute(insert(self.model.__table__), batch)
+            self.db.commit()
+            self.imported += len(valid_rows)
+        except SQLAlchemyError:
+            # A constraint failed somewhere in the chunk, insert its rows one by one to isolate the culprits
+            self.db.rollback()
+            for line, data in valid_rows:
+                try:
+                    self.db.execute(insert(self.model.__table__), [self.insert_values(data)])
+                    self.db.commit()
+                    self.imported += 1
+                except SQLAlchemyError as e:
+                    self.db.rollback()
+                    self.reject(line, data, [f"Database error: {getattr(e, 'orig', e)}"])
+
+    def coerce(self, data):
+        """Convert raw file values to the types expected by the validator, empty values being dropped."""
+        fields = self.FIELDS[self.model_type]
+        coerced = {}
+        errors = []
+        for field, value in data.items():
+            if field not in fields:
+                self.ignored_fields.add(field)
+                continue
+            if value is None or (isinstance(value, str) and not value.strip()):
+                continue
+
+            # Fields without a column of their own, like passwords, are kept as strings
+            column_type = self.columns[field].type if field in self.columns else None
+            try:
+                if isinstance(column_type, Boolean):
+                    coerced[field] = self.coerce_bool(value)
+                elif isinstance(column_type, Integer):
+                    coerced[field] = int(value)
+                elif isinstance(column_type, Float):
+                    coerced[field] = float(value)
+                else:
+                    coerced[field] = str(value).strip()
+            except (TypeError, ValueError):
+                errors.append(f"{field}: Expected a {type(column_type).__name__.lower()} value, got '{value}'.")
+        return coerced, errors
+
+    def coerce_bool(self, value):
+        if isinstance(value, bool):
+            return value
+        if str(value).strip().lower() in self.TRUE_VALUES:
+            return True
+        if str(value).strip().lower() in self.FALSE_VALUES:
+            return False
+        raise ValueError(value)
+
+    def insert_values(self, data):
+        return {
+            field: FormatHelper.format_date(value) if isinstance(self.columns[field].type, DateTime) else value
+            for field, value in data.items()
+        }
+
+    def reject(self, line, data, errors):
+        self.rejected += 1
+        if not self.report_path:
+            return
+        if self.report_writer is None:
+            self.report_file = open(self.report_path, "w", newline="", encoding="utf-8")
+            self.report_writer = csv.writer(self.report_file)
+            self.report_writer.writerow(["line", "errors", "data"])
+        data = {field: value for field, value in data.items() if field not in self.SECRET_FIELDS}
+        self.report_writer.writerow([line, "; ".join(errors), json.dumps(data, ensure_ascii=False, default=str)])
@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+from sqlalchemy import inspect, text
+from crm.models.base import Base
+from crm.models.blacklist_tokens import BlacklistToken
+
+
+def migrate_blacklist_tokens(engine):
+    """
+    Rebuild a legacy blacklist table storing raw tokens into the digest-keyed layout.
+
+    Still valid revocations are carried over, expired ones are dropped.
+
+    :param engine: SQLAlchemy engine of the database to migrate
+    :return: True if the table was migrated, False if it was already up to date
+    """
+    inspector = inspect(engine)
+    if BlacklistToken.__tablename__ not in inspector.get_table_names():
+        return False
+
+    columns = {column["name"] for column in inspector.get_columns(BlacklistToken.__tablename__)}
+    if "token_digest" in columns:
+        return False
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    with engine.begin() as conn:
+        tokens = [row[0] for row in conn.execute(text(f"SELECT token FROM {BlacklistToken.__tablename__}"))]
+
+        BlacklistToken.__table__.drop(conn)
+        BlacklistToken.__table__.create(conn)
+
+        rows = []
+        for token in set(tokens):
+            expires_at = BlacklistToken.expiration(token)
+            if expires_at > now:
+                rows.append({"token_digest": BlacklistToken.digest(token), "expires_at": expires_at})
+        if rows:
+            conn.execute(BlacklistToken.__table__.insert(), rows)
+
+    return True
+
+
+def create_missing_indexes(engine):
+    """
+    Create the indexes declared on the models that an existing database lacks.
+
+    An index is skipped when the primary key or an existing index already starts with the same columns,
+    such as the index MySQL creates for each foreign key.
+
+    :param engine: SQLAlchemy engine of the database to migrate
+    :return: Names of the created indexes
+    """
+    created = []
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        existing_tables = set(inspector.get_table_names())
+        for table in Base.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+
+            existing_indexes = inspector.get_indexes(table.name)
+            primary_key = [column.name for column in table.primary_key.columns]
+            for index in sorted(table.indexes, key=lambda i: i.name):
+                columns = [column.name for column in index.columns]
+                if columns == primary_key[:len(columns)]:
+                    continue
+                if any(existing["column_names"][:len(columns)] == columns for existing in existing_indexes):
+                    continue
+                index.create(conn)
+                created.append(index.name)
+    return created
+
+def run_migrations(engine):
+    """
+    Bring an existing database up to date with the models, every step being idempotent.
+
+    :param engine: SQLAlchemy engine of the database to migrate
+    :return: Descriptions of the applied steps
+    """
+    applied = []
+    if migrate_blacklist_tokens(engine):
+        applied.append("revoked tokens table migrated to digest keys")
+    for index_name in create_missing_indexes(engine):
+        applied.append(f"index {index_name} created")
+    return applied
@@ -0,0 +1,139 @@
+import csv
+import gzip
+import io
+import json
+import click
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class OutputHelper:
+    FORMATS = ["text", "table", "jsonl", "csv"]
+    EXPORT_FORMATS = ["csv", "jsonl"]
+    # Rows rendered per write to the output stream
+    BATCH_SIZE = 500
+
+    def __init__(self, render, empty_message: str, limit: int = None, output_format: str = "text", fields: dict = None, stream=None):
+        """
+        Initialize the OutputHelper class.
+
+        :param render: Callable turning a row into the text printed by the text format
+        :param empty_message: Message printed when there is no row
+        :param limit: Requested page size, a continuation cursor is printed when the page is full (optional)
+        :param output_format: One of FORMATS
+        :param fields: Row attributes rendered by the table, jsonl and csv formats, mapped to their table label
+        :param stream: Text stream to write to, defaults to stdout
+        """
+        self.render = render
+        self.empty_message = empty_message
+        self.limit = limit
+        self.output_format = output_format
+        self.fields = fields or {}
+        self.stream = stream
+        self.csv_writer = None
+        self.column_widths = None
+
+    def echo_rows(self, rows):
+        """
+        Print rows as they are fetched, writing them to the output stream by batches.
+
+        :param rows: Iterable of rows having an id
+        :return: Number of rows printed
+        """
+        if self.stream is None:
+            self.stream = click.get_text_stream("stdout")
+
+        count = 0
+        last_id = None
+        batch = []
+        for row in rows:
+            batch.append(row)
+            count += 1
+            last_id = row.id
+            if len(batch) == self.BATCH_SIZE:
+                self.write_batch(batch)
+                batch = []
+        if batch:
+            self.write_batch(batch)
+        self.stream.flush()
+
+        # Status messages go to stderr with machine-readable formats so they never end up in the data
+        is_text = self.output_format == "text"
+        if count == 0:
+            click.echo(self.empty_message, err=not is_text)
+        elif self.limit is not None and count == self.limit:
+            click.echo(f"🔖 More results may follow, continue with --after {last_id}", err=True)
+        return count
+
+    def write_batch(self, batch):
+        if self.output_format == "jsonl":
+            self.stream.write("".join(json.dumps(self.row_data(row), ensure_ascii=False) + "\n" for row in batch))
+        elif self.output_format == "csv":
+            if self.csv_writer is None:
+                self.csv_writer = csv.writer(self.stream, lineterminator="\n")
+                self.csv_writer.writerow(self.fields)
+            self.csv_writer.writerows([self.format_value(getattr(row, field)) for field in self.fields] for row in batch)
+        elif self.output_format == "table":
+            self.write_table(batch)
+        else:
+            self.stream.write("".join(f"{self.render(row)}\n" for row in batch))
+
+    def write_table(self, batch):
+        """Write aligned rows, column widths are set by the header and the first batch."""
+        lines = [[self.format_value(getattr(row, field)) for field in self.fields] for row in batch]
+        if self.column_widths is None:
+            headers = [str(label) for label in self.fields.values()]
+            self.column_widths = [
+                max([len(header)] + [len(line[i]) for line in lines]) for i, header in enumerate(headers)
+            ]
+            lines.insert(0, headers)
+            lines.insert(1, ["-" * width for width in self.column_widths])
+        self.stream.write("".join(
+            "  ".join(value.ljust(width) for value, width in zip(line, self.column_widths)).rstrip() + "\n"
+            for line in lines
+        ))
+
+    def row_data(self, row):
+        """Returns the JSON-serializable fields of a row."""
+        return {
+            field: value.isoformat() if isinstance(value, datetime) else value
+            for field, value in ((field, getattr(row, field)) for field in self.fields)
+        }
+
+    @staticmethod
+    def format_value(value):
+        if value is None:
+            return ""
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return str(value)
+
+    @staticmethod
+    @contextmanager
+    def open_stream(path: str = None, compress: bool = False):
+        """
+        Open the text stream an export is written to.
+
+        :param path: Output file, stdout if missing or "-"
+        :param compress: Gzip the written text
+        :return: Context manager yielding the text stream
+        """
+        to_stdout = path in (None, "-")
+        if not compress:
+            if to_stdout:
+                yield click.get_text_stream("stdout")
+            else:
+                with open(path, "w", newline="", encoding="utf-8") as stream:
+                    yield stream
+            return
+
+        binary = click.get_binary_stream("stdout") if to_stdout else open(path, "wb")
+        try:
+            with gzip.GzipFile(fileobj=binary, mode="wb") as compressed:
+                with io.TextIOWrapper(compressed, encoding="utf-8", newline="") as stream:
+                    yield stream
+        finally:
+            if to_stdout:
+                binary.flush()
+            else:
+                binary.close()
@@ -0,0 +1,168 @@
+import re
+from sqlalchemy import String, inspect, select, text, table, column
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from crm.models.clients import Client
+from crm.models.collaborators import Collaborator
+from crm.models.events import Event
+from crm.helpers.cache_helper import CacheHelper
+
+SEARCHABLE_MODELS = [Client, Collaborator, Event]
+EXCLUDED_COLUMNS = {"password_hash"}
+
+# (database url, table name) -> whether a full-text index exists, expiring so that indexes created or
+# dropped by another process are picked up by long-running ones
+index_cache = CacheHelper("search_indexes")
+
+
+def searchable_columns(model):
+    """Returns the names of the String columns of a model covered by its full-text index."""
+    return [
+        c.name for c in model.__table__.columns
+        if isinstance(c.type, String) and c.name not in EXCLUDED_COLUMNS
+    ]
+
+def fts_table_name(model):
+    return f"{model.__tablename__}_fts"
+
+def fulltext_index_name(model):
+    return f"ix_{model.__tablename__}_fulltext"
+
+
+class SearchHelper:
+    def __init__(self, db: Session, model):
+        """
+        Initialize the SearchHelper class.
+
+        :param db: SQLAlchemy session
+        :param model: SQLAlchemy model
+        """
+        self.db = db
+        self.model = model
+        self.bind = db.get_bind()
+
+    def is_indexed(self):
+        """Check, at most once per REFERENCE_CACHE_TTL, whether the model has a usable full-text index."""
+        return index_cache.get((str(self.bind.url), self.model.__tablename__), self.index_exists)
+
+    def index_exists(self):
+        dialect = self.bind.dialect.name
+        if dialect == "sqlite":
+            return self.db.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": fts_table_name(self.model)}
+            ).first() is not None
+        if dialect == "mysql":
+            indexes = inspect(self.bind).get_indexes(self.model.__tablename__)
+            return any(index["name"] == fulltext_index_name(self.model) for index in indexes)
+        return False
+
+    def search_filter(self, value: str):
+        """
+        Build a filter clause matching rows whose indexed columns contain every word of the value,
+        each word being matched as a prefix.
+
+        :param value: Free-text value to search
+        :return: SQLAlchemy clause, or None if the value has no searchable word
+        """
+        words = re.findall(r"\w+", value)
+        if not words:
+            return None
+
+        if self.bind.dialect.name == "sqlite":
+            fts_name = fts_table_name(self.model)
+            match_query = " AND ".join(f'"{word}"*' for word in words)
+            matching_ids = select(table(fts_name, column("rowid")).c.rowid).where(
+                text(f"{fts_name} MATCH :search_query").bindparams(search_query=match_query)
+            )
+            return self.model.id.in_(matching_ids)
+
+        match_query = " ".join(f"+{word}*" for word in words)
+        columns = ", ".join(searchable_columns(self.model))
+        return text(f"MATCH ({columns}) AGAINST (:search_query IN BOOLEAN MODE)").bindparams(search_query=match_query)
+
+
+def create_search_indexes(engine):
+    """
+    Create the full-text indexes of the searchable models and fill them with the existing rows.
+
+    SQLite gets FTS5 tables kept in sync with their model's table by triggers, MySQL gets FULLTEXT indexes.
+    Other backends are left untouched.
+
+    :param engine: SQLAlchemy engine
+    :return: True if the indexes were created or already existed
+    """
+    dialect = engine.dialect.name
+    if dialect not in ("sqlite", "mysql"):
+        return False
+
+    try:
+        with engine.begin() as conn:
+            for model in SEARCHABLE_MODELS:
+                if dialect == "sqlite":
+                    create_sqlite_fts_table(conn, model)
+                else:
+                    create_mysql_fulltext_index(conn, model)
+    except OperationalError:
+        # SQLite built without FTS5, the search keeps using plain LIKE filters
+        return False
+    finally:
+        index_cache.invalidate()
+    return True
+
+def create_sqlite_fts_table(conn, model):
+    source = model.__tablename__
+    fts_name = fts_table_name(model)
+    columns = searchable_columns(model)
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+
+    exists = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": fts_name}
+    ).first()
+
+    conn.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_name} USING fts5({column_list}, content='{source}', content_rowid='id')"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ai AFTER INSERT ON {source} BEGIN "
+        f"INSERT INTO {fts_name}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ad AFTER DELETE ON {source} BEGIN "
+        f"INSERT INTO {fts_name}({fts_name}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); END"
+    ))
+    conn.execute(text(
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_au AFTER UPDATE ON {source} BEGIN "
+        f"INSERT INTO {fts_name}({fts_name}, rowid, {column_list}) VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts_name}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+    ))
+
+    if not exists:
+        conn.execute(text(f"INSERT INTO {fts_name}({fts_name}) VALUES ('rebuild')"))
+
+def create_mysql_fulltext_index(conn, model):
+    indexes = inspect(conn).get_indexes(model.__tablename__)
+    if any(index["name"] == fulltext_index_name(model) for index in indexes):
+        return
+    columns = ", ".join(searchable_columns(model))
+    conn.execute(text(f"CREATE FULLTEXT INDEX {fulltext_index_name(model)} ON {model.__tablename__} ({columns})"))
+
+def drop_search_indexes(engine):
+    """Drop the full-text indexes, the global search falls back to LIKE filters."""
+    dialect = engine.dialect.name
+    try:
+        with engine.begin() as conn:
+            for model in SEARCHABLE_MODELS:
+                if dialect == "sqlite":
+                    fts_name = fts_table_name(model)
+                    for suffix in ("ai", "ad", "au"):
+                        conn.execute(text(f"DROP TRIGGER IF EXISTS {fts_name}_{suffix}"))
+                    conn.execute(text(f"DROP TABLE IF EXISTS {fts_name}"))
+                elif dialect == "mysql":
+                    indexes = inspect(conn).get_indexes(model.__tablename__)
+                    if any(index["name"] == fulltext_index_name(model) for index in indexes):
+                        conn.execute(text(f"DROP INDEX {fulltext_index_name(model)} ON {model.__tablename__}"))
+    finally:
+        index_cache.invalidate()
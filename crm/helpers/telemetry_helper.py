@@ -0,0 +1,71 @@
+from contextlib import contextmanager
+from crm.enums.telemetry_mode_enum import TelemetryModeEnum
+from config import (
+    SENTRY_URL,
+    TELEMETRY_MODE,
+    TELEMETRY_TRACES_SAMPLE_RATE,
+    TELEMETRY_PROFILES_SAMPLE_RATE,
+    TELEMETRY_FLUSH_TIMEOUT
+)
+
+_sentry = None
+
+
+def get_telemetry_mode():
+    """Returns the configured telemetry mode, falling back to errors-only on unknown values."""
+    try:
+        return TelemetryModeEnum(TELEMETRY_MODE.strip().lower())
+    except ValueError:
+        return TelemetryModeEnum.ERRORS
+
+def init_telemetry():
+    """Initialise Sentry on first need, returns the SDK module or None when telemetry is disabled."""
+    global _sentry
+    mode = get_telemetry_mode()
+    if mode == TelemetryModeEnum.OFF or not SENTRY_URL:
+        return None
+
+    if _sentry is None:
+        import sentry_sdk
+
+        is_tracing = mode == TelemetryModeEnum.TRACES
+        sentry_sdk.init(
+            dsn=SENTRY_URL,
+            send_default_pii=True,
+            # None disables tracing entirely instead of sampling nothing
+            traces_sample_rate=TELEMETRY_TRACES_SAMPLE_RATE if is_tracing else None,
+            profiles_sample_rate=TELEMETRY_PROFILES_SAMPLE_RATE if is_tracing else None,
+            # Bounds the flush done by the SDK at interpreter exit
+            shutdown_timeout=TELEMETRY_FLUSH_TIMEOUT,
+        )
+        _sentry = sentry_sdk
+    return _sentry
+
+def capture_exception(exception):
+    """Report an exception and wait at most TELEMETRY_FLUSH_TIMEOUT for it to be sent."""
+    sentry = init_telemetry()
+    if sentry is None:
+        return
+    sentry.capture_exception(exception)
+    sentry.flush(timeout=TELEMETRY_FLUSH_TIMEOUT)
+
+@contextmanager
+def command_transaction(args):
+    """
+    Trace a CLI invocation in a Sentry transaction when running in traces mode.
+
+    :param args: Command line arguments, only the leading command names are used as transaction name
+    """
+    sentry = init_telemetry() if get_telemetry_mode() == TelemetryModeEnum.TRACES else None
+    if sentry is None:
+        yield
+        return
+
+    command_names = []
+    for arg in args:
+        if arg.startswith("-") or len(command_names) == 2:
+            break
+        command_names.append(arg)
+
+    with sentry.start_transaction(op="cli.command", name=" ".join(["crm", *command_names])):
+        yield
@@ -0,0 +1,58 @@
+from sqlalchemy import LargeBinary, String, TypeDecorator, literal, select, update, or_
+
+
+class CaseSensitiveString(TypeDecorator):
+    """
+    String bound as a binary string on MySQL, where comparing it with a text column ignores the
+    column collation, so that values only differing by case or accents are told apart.
+    """
+    impl = String
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        return dialect.type_descriptor(LargeBinary() if dialect.name == "mysql" else String())
+
+    def process_bind_param(self, value, dialect):
+        if dialect.name == "mysql" and value is not None:
+            return value.encode("utf-8")
+        return value
+
+
+class UpdateHelper:
+    def __init__(self, model, entity_id: int, values: dict):
+        """
+        Initialize the UpdateHelper class, which builds the statements of a partial update.
+
+        :param model: SQLAlchemy model
+        :param entity_id: ID of the updated entity
+        :param values: Dict of the new values, those set to None or not matching a column being left out
+        """
+        self.model = model
+        self.entity_id = entity_id
+        self.changes = {
+            key: value for key, value in values.items()
+            if key in model.__table__.columns and value is not None
+        }
+
+    def differs(self, key, value):
+        """Clause matching a row whose column differs from the value, strings being compared case-sensitively."""
+        column = getattr(self.model, key)
+        if isinstance(column.type, String):
+            value = literal(value, CaseSensitiveString())
+        return or_(column.is_(None), column != value)
+
+    def update_statement(self):
+        """
+        UPDATE of the given columns, whose WHERE clause only matches the row if one of them differs,
+        so that nothing is written when the values are already set.
+        """
+        differs = [self.differs(key, value) for key, value in self.changes.items()]
+        return (
+            update(self.model)
+            .where(self.model.id == self.entity_id, or_(*differs))
+            .values(**self.changes)
+        )
+
+    def exists_statement(self):
+        """SELECT telling apart a missing row from one already holding the values."""
+        return select(self.model.id).where(self.model.id == self.entity_id)
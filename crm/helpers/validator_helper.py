@@ -6,80 +6,216 @@ from crm.models.contracts import Contract
 from crm.models.roles import Role, RoleEnum
 from crm.enums.model_type_enum import ModelTypeEnum
 from crm.enums.foreign_key_type_enum import ForeignKeyTypeEnum
+from crm.helpers.cache_helper import get_role, get_collaborator_entry
 from config import SECRET_KEY, KEYRING_SERVICE
 
 class ValidatorHelper:
-    def __init__(self, context, model_type, data):
+    EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+    PHONE_REGEX = re.compile(r"^(\+?[0-9]{1,4}[\s\-]?)?(\(?[0-9]{1,5}\)?[\s\-]?[0-9]{1,5}[\s\-]?[0-9]{1,5})+$")
+    ADDRESS_REGEX = re.compile(r"^\d+\s+[-\w\s]+,\s+\d+\s+[-\w\s]+,\s+[-\w\s-]+$")
+    PASSWORD_RULES = [
+        (re.compile(r"[A-Z]"), "Password must contain at least one uppercase letter."),
+        (re.compile(r"[a-z]"), "Password must contain at least one lowercase letter."),
+        (re.compile(r"[0-9]"), "Password must contain at least one number."),
+        (re.compile(r"[!@#$%^&*(),.?\":{}|<>]"), "Password must contain at least one special character."),
+    ]
+
+    REQUIRED_FIELDS = {
+        ModelTypeEnum.CLIENT: ["first_name", "last_name", "email", "phone", "company_name"],
+        ModelTypeEnum.COLLABORATOR: ["first_name", "last_name", "email", "password", "role_id"],
+        ModelTypeEnum.CONTRACT: ["costing", "remaining_due_payment", "client_id", "commercial_id"],
+        ModelTypeEnum.EVENT: ["name", "start_date", "end_date", "location", "attendees", "contract_id"],
+    }
+
+    # Checks of each model type as (field, expected type, check method, check arguments),
+    # a field being only checked when it has a value
+    SCHEMAS = {
+        ModelTypeEnum.CLIENT: [
+            ("first_name", str, "validate_string", (0, 30)),
+            ("last_name", str, "validate_string", (0, 30)),
+            ("email", str, "validate_email", ()),
+            ("phone", str, "validate_phone_number", ()),
+            ("company_name", str, "validate_string", (0, 50)),
+            ("first_contact_date", str, "validate_datetime", ()),
+            ("last_contact_date", str, "validate_datetime", ()),
+            ("commercial_id", int, "validate_foreign_id", (ForeignKeyTypeEnum.COMMERCIAL,)),
+        ],
+        ModelTypeEnum.COLLABORATOR: [
+            ("first_name", str, "validate_string", (0, 30)),
+            ("last_name", str, "validate_string", (0, 30)),
+            ("email", str, "validate_email", ()),
+            ("password", str, "validate_password", ()),
+            ("role_id", int, "validate_foreign_id", (ForeignKeyTypeEnum.ROLE,)),
+        ],
+        ModelTypeEnum.CONTRACT: [
+            ("costing", float, "validate_number", ()),
+            ("remaining_due_payment", float, "validate_number", ()),
+            ("is_signed", bool, None, ()),
+            ("client_id", int, "validate_foreign_id", (ForeignKeyTypeEnum.CLIENT,)),
+            ("commercial_id", int, "validate_foreign_id", (ForeignKeyTypeEnum.COMMERCIAL,)),
+        ],
+        ModelTypeEnum.EVENT: [
+            ("name", str, "validate_string", (0, 50)),
+            ("start_date", str, "validate_datetime", ()),
+            ("end_date", str, "validate_datetime", ()),
+            ("location", str, "validate_address", ()),
+            ("attendees", int, "validate_number", ()),
+            ("notes", str, "validate_string", (0, 100000)),
+            ("contract_id", int, "validate_foreign_id", (ForeignKeyTypeEnum.CONTRACT,)),
+            ("support_id", int, "validate_foreign_id", (ForeignKeyTypeEnum.SUPPORT,)),
+        ],
+    }
+    # Relative cost of the checks, the cheapest run first and the database lookups last
+    CHECK_COSTS = {
+        None: 0,
+        "validate_number": 1,
+        "validate_string": 1,
+        "validate_email": 2,
+        "validate_phone_number": 2,
+        "validate_address": 2,
+        "validate_password": 2,
+        "validate_datetime": 3,
+        "validate_foreign_id": 4,
+    }
+    DATABASE_CHECKS = {"validate_foreign_id"}
+
+    FOREIGN_KEY_MODELS = {
+        ForeignKeyTypeEnum.CLIENT: Client,
+        ForeignKeyTypeEnum.COMMERCIAL: Collaborator,
+        ForeignKeyTypeEnum.CONTRACT: Contract,
+        ForeignKeyTypeEnum.ROLE: Role,
+        ForeignKeyTypeEnum.SUPPORT: Collaborator,
+    }
+    FOREIGN_KEY_ROLES = {
+        ForeignKeyTypeEnum.COMMERCIAL: RoleEnum.SALES,
+        ForeignKeyTypeEnum.SUPPORT: RoleEnum.SUPPORT,
+    }
+    # Foreign key fields of each model type, checked by validate_foreign_id
+    FOREIGN_KEY_FIELDS = {
+        model_type: {field: args[0] for field, _, check, args in schema if check == "validate_foreign_id"}
+        for model_type, schema in SCHEMAS.items()
+    }
+    # Columns read by entity_exists_check besides the id
+    FOREIGN_KEY_CHECKED_COLUMNS = {
+        Collaborator: ["role_id"],
+        Contract: ["is_signed"],
+    }
+
+    # model type -> (field checks, database checks), compiled once per process from SCHEMAS
+    _compiled_schemas = {}
+
+    def __init__(self, context, model_type, data, foreign_entities=None):
+        """
+        :param context: SQLAlchemy session
+        :param model_type: ModelTypeEnum of the validated data
+        :param data: Dict of the values to validate
+        :param foreign_entities: {model: {id: row}} lookups prefetched by validate_batch, used instead of
+            querying each foreign key (optional)
+        """
         self.context = context
         self.model_type = model_type
         self.data = data
+        self.foreign_entities = foreign_entities
         self.error_messages = []
-        
-        self.client_required_fields = ["first_name", "last_name", "email", "phone", "company_name"]
-        self.client_valid_fields = self.client_required_fields + ["first_contact_date", "last_contact_date", "commercial_id"]
-        
-        self.collaborator_required_fields = ["first_name", "last_name", "email", "password", "role_id"]
-        self.collaborator_valid_fields = self.collaborator_required_fields
-        
-        self.contract_required_fields = ["costing", "remaining_due_payment", "client_id", "commercial_id"]
-        self.contract_valid_fields = self.contract_required_fields + ["is_signed"]
-        
-        self.event_required_fields = ["name", "start_date", "end_date", "location", "attendees", "contract_id"]
-        self.event_valid_fields = self.event_required_fields + ["notes", "support_id"]
-
-    def shortened_validate_data(self, field_name, type, func, min=None, max=None, foreign_key_type_enum=None):
-        if field_name in self.data and self.data[field_name] and self.type_check(type, field_name, self.data[field_name]):
-            if min is not None and max is not None:
-                func(field_name, self.data[field_name], min, max)
-            elif foreign_key_type_enum is not None:
-                func(field_name, self.data[field_name], foreign_key_type_enum)
-            else:
-                func(field_name, self.data[field_name])
 
-    def validate_data(self):
-        """Validates data based on the model type"""
-        if self.model_type == ModelTypeEnum.CLIENT:
-            self.shortened_validate_data("first_name", str, self.validate_string, 0, 30)
-            self.shortened_validate_data("last_name", str, self.validate_string, 0, 30)
-            self.shortened_validate_data("email", str, self.validate_email)
-            self.shortened_validate_data("phone", str, self.validate_phone_number)
-            self.shortened_validate_data("company_name", str, self.validate_string, 0, 50)
-            self.shortened_validate_data("first_contact_date", str, self.validate_datetime)
-            self.shortened_validate_data("last_contact_date", str, self.validate_datetime)
-            self.shortened_validate_data("commercial_id", int, self.validate_foreign_id, None, None, ForeignKeyTypeEnum.COMMERCIAL)
-
-        elif self.model_type == ModelTypeEnum.COLLABORATOR:
-            self.shortened_validate_data("first_name", str, self.validate_string, 0, 30)
-            self.shortened_validate_data("last_name", str, self.validate_string, 0, 30)
-            self.shortened_validate_data("email", str, self.validate_email)
-            self.shortened_validate_data("password", str, self.validate_password)
-            self.shortened_validate_data("role_id", int, self.validate_foreign_id, None, None, ForeignKeyTypeEnum.ROLE)
-
-        elif self.model_type == ModelTypeEnum.CONTRACT:
-            self.shortened_validate_data("costing", float, self.validate_number, 0)
-            self.shortened_validate_data("remaining_due_payment", float, self.validate_number, 0)
-            if self.data.get("is_signed"):
-                self.type_check(bool, "is_signed", self.data["is_signed"])
-            self.shortened_validate_data("client_id", int, self.validate_foreign_id, None, None, ForeignKeyTypeEnum.CLIENT)
-            self.shortened_validate_data("commercial_id", int, self.validate_foreign_id, None, None, ForeignKeyTypeEnum.COMMERCIAL)
-
-        elif self.model_type == ModelTypeEnum.EVENT:
-            self.shortened_validate_data("name", str, self.validate_string, 0, 50)
-            self.shortened_validate_data("start_date", str, self.validate_datetime)
-            self.shortened_validate_data("end_date", str, self.validate_datetime)
-            self.shortened_validate_data("location", str, self.validate_address)
-            self.shortened_validate_data("attendees", int, self.validate_number, 0)
-            self.shortened_validate_data("notes", str, self.validate_string, 0, 100000)
-            self.shortened_validate_data("contract_id", int, self.validate_foreign_id, None, None, ForeignKeyTypeEnum.CONTRACT)
-            self.shortened_validate_data("support_id", int, self.validate_foreign_id, None, None, ForeignKeyTypeEnum.SUPPORT)
+    @classmethod
+    def compile_schema(cls, model_type):
+        """
+        Turn the schema of a model type into ordered (field, expected type, check function, arguments) rules.
 
-        else:
+        :param model_type: ModelTypeEnum
+        :return: (field checks, database checks) tuple of rule lists, None for an unknown model type
+        """
+        if model_type not in cls._compiled_schemas:
+            if model_type not in cls.SCHEMAS:
+                return None
+            field_rules, database_rules = [], []
+            for field, expected_type, check, args in sorted(cls.SCHEMAS[model_type], key=lambda rule: cls.CHECK_COSTS[rule[2]]):
+                rule = (field, expected_type, getattr(cls, check) if check else None, args)
+                (database_rules if check in cls.DATABASE_CHECKS else field_rules).append(rule)
+            cls._compiled_schemas[model_type] = (field_rules, database_rules)
+        return cls._compiled_schemas[model_type]
+
+    @classmethod
+    def validate_batch(cls, context, model_type, records, check_required_fields=False):
+        """
+        Validate many records at once, the foreign keys of all of them being resolved with
+        one IN query per referenced model.
+
+        :param context: SQLAlchemy session
+        :param model_type: ModelTypeEnum of the records
+        :param records: List of data dicts
+        :param check_required_fields: Also report missing required fields
+        :return: List of validators, in the order of the records
+        """
+        validators = []
+        for data in records:
+            validator = cls(context, model_type, data)
+            if check_required_fields:
+                validator.validate_required_fields()
+            validator.validate_fields()
+            validators.append(validator)
+
+        # Only the records passing every other check have their foreign keys looked up
+        valid_validators = [validator for validator in validators if validator.is_valid()]
+        foreign_entities = cls.prefetch_foreign_entities(context, model_type, [v.data for v in valid_validators])
+        for validator in valid_validators:
+            validator.foreign_entities = foreign_entities
+            validator.validate_foreign_keys()
+        return validators
+
+    @classmethod
+    def prefetch_foreign_entities(cls, context, model_type, records):
+        """Load the id and checked columns of every entity referenced by the records, keyed by model and id."""
+        ids_by_model = {}
+        for field, foreign_key_type_enum in cls.FOREIGN_KEY_FIELDS.get(model_type, {}).items():
+            model = cls.FOREIGN_KEY_MODELS[foreign_key_type_enum]
+            ids_by_model.setdefault(model, set()).update(
+                data[field] for data in records
+                if isinstance(data.get(field), int) and not isinstance(data[field], bool)
+            )
+
+        foreign_entities = {}
+        for model, ids in ids_by_model.items():
+            columns = [model.id] + [getattr(model, column) for column in cls.FOREIGN_KEY_CHECKED_COLUMNS.get(model, [])]
+            rows = context.query(*columns).filter(model.id.in_(ids)) if ids else []
+            foreign_entities[model] = {row.id: row for row in rows}
+        return foreign_entities
+
+    def validate_data(self):
+        """Validates data based on the model type, the database being only queried if the other checks pass"""
+        if self.compile_schema(self.model_type) is None:
             print("Invalid model type passed")
+            return
+        self.validate_fields()
+        if self.is_valid():
+            self.validate_foreign_keys()
+
+    def validate_fields(self):
+        """Runs the checks of the model type's schema that do not need the database"""
+        field_rules, _ = self.compile_schema(self.model_type) or ([], [])
+        self.apply_rules(field_rules)
+
+    def validate_foreign_keys(self):
+        """Runs the checks of the model type's schema looking up the database"""
+        _, database_rules = self.compile_schema(self.model_type) or ([], [])
+        self.apply_rules(database_rules)
+
+    def apply_rules(self, rules):
+        for field, expected_type, check, args in rules:
+            value = self.data.get(field)
+            if value and self.type_check(expected_type, field, value) and check:
+                check(self, field, value, *args)
+
+    def validate_required_fields(self):
+        """Checks every required field of the model type is given"""
+        for field in self.REQUIRED_FIELDS.get(self.model_type, []):
+            if self.data.get(field) is None or self.data.get(field) == "":
+                self.add_error(field, "This field is required.")
 
     def validate_email(self, field, value):
         self.validate_string(field, value, min_length=0, max_length=30)
-        email_regex = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-        if not re.match(email_regex, value):
+        if not self.EMAIL_REGEX.match(value):
             self.add_error(field, "Invalid email format.")
 
     def validate_datetime(self, field, value):
@@ -99,14 +235,9 @@ class ValidatorHelper:
         self.validate_string(field, value, min_length=0, max_length=40)
         if len(value) < 8:
             self.add_error(field, "Password must be at least 8 characters long.")
-        if not re.search(r"[A-Z]", value):
-            self.add_error(field, "Password must contain at least one uppercase letter.")
-        if not re.search(r"[a-z]", value):
-            self.add_error(field, "Password must contain at least one lowercase letter.")
-        if not re.search(r"[0-9]", value):
-            self.add_error(field, "Password must contain at least one number.")
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", value):
-            self.add_error(field, "Password must contain at least one special character.")
+        for regex, message in self.PASSWORD_RULES:
+            if not regex.search(value):
+                self.add_error(field, message)
 
     def validate_number(self, field, value, min_value=0, max_value=None):
         if value < min_value:
@@ -116,14 +247,12 @@ class ValidatorHelper:
 
     def validate_phone_number(self, field, value):
         self.validate_string(field, value, min_length=0, max_length=20)
-        phone_regex = r"^(\+?[0-9]{1,4}[\s\-]?)?(\(?[0-9]{1,5}\)?[\s\-]?[0-9]{1,5}[\s\-]?[0-9]{1,5})+$"
-        if not re.match(phone_regex, value):
+        if not self.PHONE_REGEX.match(value):
             self.add_error(field, "Invalid phone number format. Expected formats include '+44 20 7946 0958' (UK), '+33 1 70 18 99 87' (France), or '(030) 12345678' (Germany)")
 
     def validate_address(self, field, value):
         self.validate_string(field, value, min_length=0, max_length=100)
-        address_regex = r"^\d+\s+[-\w\s]+,\s+\d+\s+[-\w\s]+,\s+[-\w\s-]+$"
-        if not re.match(address_regex, value):
+        if not self.ADDRESS_REGEX.match(value):
             self.add_error(
                 field,
                 "Invalid address format. Expected format: '<Street number> <Street name>, <City postal code>, <Country>'."
@@ -132,29 +261,26 @@ class ValidatorHelper:
     def validate_foreign_id(self, field, value, foreign_key_type_enum):
         """Check if foreign key exists in the database"""
         self.validate_number(field, value, 0)
-        if foreign_key_type_enum == ForeignKeyTypeEnum.CLIENT:
-            self.entity_exists_check(field, value, Client)
-            
-        elif foreign_key_type_enum == ForeignKeyTypeEnum.COMMERCIAL:
-            self.entity_exists_check(field, value, Collaborator, RoleEnum.SALES)
-                        
-        elif foreign_key_type_enum == ForeignKeyTypeEnum.CONTRACT:
-            self.entity_exists_check(field, value, Contract)
-            
-        elif foreign_key_type_enum == ForeignKeyTypeEnum.ROLE:
-            self.entity_exists_check(field, value, Role)
-            
-        elif foreign_key_type_enum == ForeignKeyTypeEnum.SUPPORT:
-            self.entity_exists_check(field, value, Collaborator, RoleEnum.SUPPORT)
-        else:
+        if foreign_key_type_enum not in self.FOREIGN_KEY_MODELS:
             self.add_error(field, "Invalid foreign key")
-            
+            return
+        self.entity_exists_check(
+            field, value, self.FOREIGN_KEY_MODELS[foreign_key_type_enum], self.FOREIGN_KEY_ROLES.get(foreign_key_type_enum)
+        )
+
     def entity_exists_check(self, field, entity_id, model, role_type_enum=None):
-        entity = self.context.get(model, entity_id)
+        if self.foreign_entities is not None and model in self.foreign_entities:
+            entity = self.foreign_entities[model].get(entity_id)
+        elif model is Collaborator:
+            entity = get_collaborator_entry(self.context, entity_id)
+        elif model is Role:
+            entity = get_role(self.context, entity_id)
+        else:
+            entity = self.context.get(model, entity_id)
         if entity:
             if role_type_enum is not None and role_type_enum.value != entity.role_id:
                 self.add_error(field, "The given collaborator is not of the authorized role")
-                
+
             if model is Contract and not entity.is_signed:
                 self.add_error(field, "It is not allowed to create an event for an unsigned contract")
 
@@ -1,3 +1,6 @@
+import hashlib
+import jwt
+from datetime import datetime, timedelta, timezone
 from sqlalchemy import Column, Integer, String, DateTime, func
 from crm.models.base import Base
 
@@ -6,11 +9,27 @@ class BlacklistToken(Base):
     __tablename__ = 'blacklist_tokens'
 
     id = Column(Integer, primary_key=True)
-    token = Column(String(500), unique=True, nullable=False)
+    token_digest = Column(String(64), unique=True, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
     created_at = Column(DateTime, default=func.current_timestamp())
 
-    def __init__(self, token):
-        self.token = token
+    def __init__(self, token, expires_at=None):
+        self.token_digest = self.digest(token)
+        self.expires_at = expires_at or self.expiration(token)
+
+    @staticmethod
+    def digest(token):
+        """Returns the fixed-size SHA-256 hex digest used as revocation key."""
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def expiration(token):
+        """Returns the token's exp claim as a naive UTC datetime, defaulting to a day from now."""
+        try:
+            payload = jwt.decode(token, options={"verify_signature": False, "verify_exp": False})
+            return datetime.fromtimestamp(payload["exp"], timezone.utc).replace(tzinfo=None)
+        except (jwt.InvalidTokenError, KeyError, TypeError, ValueError):
+            return datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(days=1)
 
     def __repr__(self):
-        return f"<BlacklistToken {self.token}>"
+        return f"<BlacklistToken {self.token_digest[:12]}>"
@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from crm.models.base import Base
+from crm.helpers.format_helper import FormatHelper
 from datetime import datetime, timezone
 
 
@@ -17,9 +18,28 @@ class Client(Base):
     first_contact_date = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     last_contact_date = Column(DateTime)
     
-    commercial_id = Column(Integer, ForeignKey('collaborators.id'))
+    commercial_id = Column(Integer, ForeignKey('collaborators.id'), index=True)
 
     commercial = relationship("Collaborator")
+
+    INFOS_LABELS = {
+        "id": "ID",
+        "first_name": "First name",
+        "last_name": "Last name",
+        "email": "Email",
+        "phone": "Phone number",
+        "company_name": "Company name",
+        "first_contact_date": "First contact date",
+        "last_contact_date": "Last contact date",
+        "commercial_id": "Related collaborator ID",
+    }
+    MINIMAL_INFOS_LABELS = {
+        "id": "ID",
+        "first_name": "First name",
+        "last_name": "Last name",
+        "email": "Email",
+        "commercial_id": "Related collaborator ID",
+    }
     
     @property
     def full_name(self):
@@ -28,32 +48,12 @@ class Client(Base):
     @property
     def infos(self):
         """Returns a string representation of the client."""
-        return (
-            f"""
-            ID: {self.id}
-            First name: {self.first_name}
-            Last name: {self.last_name}
-            Email: {self.email}
-            Phone number: {self.phone}
-            Company name: {self.company_name}
-            First contact date: {self.first_contact_date.isoformat() if self.first_contact_date else None}
-            Last contact date: {self.last_contact_date.isoformat() if self.last_contact_date else None}
-            Related collaborator ID: {self.commercial_id}
-            """
-            )
+        return FormatHelper.format_infos(self, self.INFOS_LABELS)
         
     @property
     def minimal_infos(self):
         """Returns a succint string representation of the client."""
-        return (
-            f"""
-            ID: {self.id}
-            First name: {self.first_name}
-            Last name: {self.last_name}
-            Email: {self.email}
-            Related collaborator ID: {self.commercial_id}
-            """
-            )
+        return FormatHelper.format_infos(self, self.MINIMAL_INFOS_LABELS)
     
     def __repr__(self):
         return f"<Client {self.full_name} from {self.company_name}>"
\ No newline at end of file
@@ -1,6 +1,7 @@
 from sqlalchemy import Column, Integer, String, ForeignKey
 from bcrypt import checkpw
 from crm.models.base import Base
+from crm.helpers.format_helper import FormatHelper
 
 class Collaborator(Base):
     __tablename__ = "collaborators"
@@ -13,6 +14,15 @@ class Collaborator(Base):
     
     role_id = Column(Integer, ForeignKey('roles.id'), nullable=False)
 
+    INFOS_LABELS = {
+        "id": "ID",
+        "first_name": "First name",
+        "last_name": "Last name",
+        "email": "Email",
+        "role_id": "Role ID",
+    }
+    MINIMAL_INFOS_LABELS = INFOS_LABELS
+
     @property
     def full_name(self):
         """Returns the full name of the collaborator."""
@@ -21,15 +31,7 @@ class Collaborator(Base):
     @property
     def infos(self):
         """Returns a string representation of the collaborator."""
-        return (
-            f"""
-            ID: {self.id}
-            First name: {self.first_name}
-            Last name: {self.last_name}
-            Email: {self.email}
-            Role ID: {self.role_id}
-            """
-            )
+        return FormatHelper.format_infos(self, self.INFOS_LABELS)
         
     @property
     def minimal_infos(self):
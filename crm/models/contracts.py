@@ -2,6 +2,7 @@ from sqlalchemy import Column, Integer, Boolean, ForeignKey, Float, DateTime
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from crm.models.base import Base
+from crm.helpers.format_helper import FormatHelper
 from datetime import datetime, timezone
 
 
@@ -9,41 +10,40 @@ class Contract(Base):
     __tablename__ = "contracts"
 
     id = Column(Integer, primary_key=True)
-    client_id = Column(Integer, ForeignKey("clients.id"), nullable=False)
-    commercial_id = Column(Integer, ForeignKey("collaborators.id"), nullable=False)
+    client_id = Column(Integer, ForeignKey("clients.id"), nullable=False, index=True)
+    commercial_id = Column(Integer, ForeignKey("collaborators.id"), nullable=False, index=True)
     costing = Column(Float, nullable=False)
     remaining_due_payment = Column(Float, nullable=False)
     creation_date = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    is_signed = Column(Boolean, default=False)
+    is_signed = Column(Boolean, default=False, index=True)
 
     client = relationship("Client")
     commercial = relationship("Collaborator")
+
+    INFOS_LABELS = {
+        "id": "ID",
+        "costing": "Costing",
+        "remaining_due_payment": "Remaining due payment",
+        "creation_date": "Creation date",
+        "is_signed": "Is signed",
+        "client_id": "Related client ID",
+        "commercial_id": "Related commercial ID",
+    }
+    MINIMAL_INFOS_LABELS = {
+        "id": "ID",
+        "client_id": "Related client ID",
+        "commercial_id": "Related commercial ID",
+    }
     
     @property
     def infos(self):
         """Returns a string representation of the contract."""
-        return (
-            f"""
-            ID: {self.id}
-            Costing: {self.costing}
-            Remaining due payment: {self.remaining_due_payment}
-            Creation date: {self.creation_date.isoformat() if self.creation_date else None}
-            Is signed: {self.is_signed}
-            Related client ID: {self.client_id}
-            Related commercial ID: {self.commercial_id}
-            """
-            )
+        return FormatHelper.format_infos(self, self.INFOS_LABELS)
         
     @property
     def minimal_infos(self):
         """Returns a succint string representation of the contract."""
-        return (
-            f"""
-            ID: {self.id}
-            Related client ID: {self.client_id}
-            Related commercial ID: {self.commercial_id}
-            """
-            )
+        return FormatHelper.format_infos(self, self.MINIMAL_INFOS_LABELS)
 
     def __repr__(self):
         return f"<Contract {self.id} for Client {self.client_id}>"
\ No newline at end of file
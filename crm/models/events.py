@@ -1,52 +1,52 @@
 from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime
 from sqlalchemy.orm import relationship
 from crm.models.base import Base
+from crm.helpers.format_helper import FormatHelper
 
 class Event(Base):
     __tablename__ = "events"
     
     id = Column(Integer, primary_key=True)
     name = Column(String(100), nullable=False)
-    start_date = Column(DateTime, nullable=False)
+    start_date = Column(DateTime, nullable=False, index=True)
     end_date = Column(DateTime, nullable=False)
     location = Column(String(255), nullable=False)
     attendees = Column(Integer, nullable=False)
     notes = Column(Text)
     
-    contract_id = Column(Integer, ForeignKey('contracts.id'), nullable=False)
-    support_id = Column(Integer, ForeignKey('collaborators.id'))
+    contract_id = Column(Integer, ForeignKey('contracts.id'), nullable=False, index=True)
+    support_id = Column(Integer, ForeignKey('collaborators.id'), index=True)
 
     contract = relationship("Contract")
     support = relationship("Collaborator")
+
+    INFOS_LABELS = {
+        "id": "ID",
+        "name": "Name",
+        "start_date": "Start date",
+        "end_date": "End date",
+        "location": "Location",
+        "attendees": "Number of attendees",
+        "notes": "Additional notes",
+        "contract_id": "Related contract ID",
+        "support_id": "Related support ID",
+    }
+    MINIMAL_INFOS_LABELS = {
+        "id": "ID",
+        "name": "Name",
+        "end_date": "End date",
+        "support_id": "Related support ID",
+    }
     
     @property
     def infos(self):
         """Returns a string representation of the event."""
-        return (
-            f"""
-            ID: {self.id}
-            Name: {self.name}
-            Start date: {self.start_date.isoformat() if self.start_date else None}
-            End date: {self.end_date.isoformat() if self.end_date else None}
-            Location: {self.location}
-            Number of attendees: {self.attendees}
-            Additional notes: {self.notes}
-            Related contract ID: {self.contract_id}
-            Related support ID: {self.support_id}
-            """
-            )
+        return FormatHelper.format_infos(self, self.INFOS_LABELS)
         
     @property
     def minimal_infos(self):
         """Returns a succint string representation of the event."""
-        return (
-            f"""
-            ID: {self.id}
-            Name: {self.name}
-            End date: {self.end_date.isoformat() if self.end_date else None}
-            Related support ID: {self.support_id}
-            """
-            )
+        return FormatHelper.format_infos(self, self.MINIMAL_INFOS_LABELS)
 
     def __repr__(self):
         return f"<Event {self.name} (Contract ID: {self.contract_id})>"
@@ -0,0 +1,52 @@
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from crm.models.clients import Client
+from crm.models.collaborators import Collaborator
+from crm.models.roles import RoleEnum
+from crm.helpers.filter_helper import FilterHelper
+from crm.helpers.update_helper import UpdateHelper
+
+
+async def create_client(db: AsyncSession, current_collaborator: Collaborator, first_name: str, last_name: str, email: str, phone: str, company_name: str):
+    """Create a new client, assigned to the given collaborator."""
+    client = Client(
+        first_name=first_name,
+        last_name=last_name,
+        email=email,
+        phone=phone,
+        company_name=company_name,
+        commercial_id=current_collaborator.id
+    )
+    db.add(client)
+    await db.commit()
+    return client
+
+async def get_client(db: AsyncSession, client_id: int):
+    """Retrieve a client by ID."""
+    return await db.get(Client, client_id)
+
+async def get_all_clients(db: AsyncSession, current_collaborator: Collaborator, filter_field=None, filter_value=None, limit: int = None, after_id: int = None, stream: bool = False, columns=None):
+    """Retrieve all clients, as a list or an async iterator when streaming. Only Managers may filter them."""
+    if RoleEnum(current_collaborator.role_id) != RoleEnum.MANAGEMENT:
+        filter_field = filter_value = None
+    return await FilterHelper(db, Client).apply_filter_async(filter_field, filter_value, limit, after_id, stream, columns)
+
+async def update_client(db: AsyncSession, client_id: int, **kwargs):
+    """
+    Update the given details of a client in a single UPDATE, skipped if they are already set.
+
+    :return: False if the client does not exist
+    """
+    update_helper = UpdateHelper(Client, client_id, kwargs)
+    if update_helper.changes:
+        result = await db.execute(update_helper.update_statement())
+        await db.commit()
+        if result.rowcount > 0:
+            return True
+    return await db.scalar(update_helper.exists_statement()) is not None
+
+async def delete_client(db: AsyncSession, client_id: int):
+    """Delete a client by ID in a single DELETE, returns False if it does not exist."""
+    result = await db.execute(delete(Client).where(Client.id == client_id))
+    await db.commit()
+    return result.rowcount > 0
@@ -0,0 +1,69 @@
+import asyncio
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from crm.models.collaborators import Collaborator
+from crm.models.roles import Role, RoleEnum
+from crm.helpers.format_helper import FormatHelper
+from crm.helpers.filter_helper import FilterHelper
+from crm.helpers.update_helper import UpdateHelper
+from crm.helpers.cache_helper import collaborator_cache
+
+
+async def create_collaborator(db: AsyncSession, first_name: str, last_name: str, email: str, password: str, role_id: int):
+    """Create a new collaborator, the password being hashed in a thread to keep the event loop responsive."""
+    role = await db.get(Role, role_id)
+    if not role:
+        raise ValueError(f"Role ID {role_id} does not exist!")
+
+    collaborator = Collaborator(
+        first_name=first_name,
+        last_name=last_name,
+        email=email,
+        password_hash=await asyncio.to_thread(FormatHelper.hash_password, password),
+        role_id=role_id
+    )
+    db.add(collaborator)
+    await db.commit()
+    return collaborator
+
+async def get_collaborator(db: AsyncSession, collaborator_id: int):
+    """Retrieve a collaborator by ID."""
+    return await db.get(Collaborator, collaborator_id)
+
+async def get_all_collaborators(db: AsyncSession, current_collaborator: Collaborator, filter_field=None, filter_value=None, limit: int = None, after_id: int = None, stream: bool = False, columns=None):
+    """Retrieve all collaborators, as a list or an async iterator when streaming. Only Managers may filter them."""
+    if RoleEnum(current_collaborator.role_id) != RoleEnum.MANAGEMENT:
+        filter_field = filter_value = None
+    return await FilterHelper(db, Collaborator).apply_filter_async(filter_field, filter_value, limit, after_id, stream, columns)
+
+async def update_collaborator(db: AsyncSession, collaborator_id: int, **kwargs):
+    """
+    Update the given details of a collaborator in a single UPDATE, skipped if they are already set.
+
+    :return: False if the collaborator does not exist
+    """
+    update_helper = UpdateHelper(Collaborator, collaborator_id, kwargs)
+    if update_helper.changes:
+        result = await db.execute(update_helper.update_statement())
+        await db.commit()
+        collaborator_cache.invalidate(collaborator_id)
+        if result.rowcount > 0:
+            return True
+    return await db.scalar(update_helper.exists_statement()) is not None
+
+async def update_password(db: AsyncSession, collaborator_id: int, password: str):
+    """Update a collaborator's password in a single UPDATE, returns False if it does not exist."""
+    if password is None:
+        return await db.scalar(select(Collaborator.id).where(Collaborator.id == collaborator_id)) is not None
+
+    password_hash = await asyncio.to_thread(FormatHelper.hash_password, password)
+    result = await db.execute(update(Collaborator).where(Collaborator.id == collaborator_id).values(password_hash=password_hash))
+    await db.commit()
+    return result.rowcount > 0
+
+async def delete_collaborator(db: AsyncSession, collaborator_id: int):
+    """Delete a collaborator by ID in a single DELETE, returns False if it does not exist."""
+    result = await db.execute(delete(Collaborator).where(Collaborator.id == collaborator_id))
+    await db.commit()
+    collaborator_cache.invalidate(collaborator_id)
+    return result.rowcount > 0
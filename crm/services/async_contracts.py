@@ -0,0 +1,51 @@
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from crm.models.contracts import Contract
+from crm.models.collaborators import Collaborator
+from crm.models.roles import RoleEnum
+from crm.helpers.filter_helper import FilterHelper
+from crm.helpers.update_helper import UpdateHelper
+
+
+async def create_contract(db: AsyncSession, costing: float, remaining_due_payment: float, is_signed: bool, client_id: int, commercial_id: int):
+    """Create a new contract."""
+    contract = Contract(
+        costing=costing,
+        remaining_due_payment=remaining_due_payment,
+        is_signed=is_signed,
+        client_id=client_id,
+        commercial_id=commercial_id
+    )
+    db.add(contract)
+    await db.commit()
+    return contract
+
+async def get_contract(db: AsyncSession, contract_id: int):
+    """Retrieve a contract by ID."""
+    return await db.get(Contract, contract_id)
+
+async def get_all_contracts(db: AsyncSession, current_collaborator: Collaborator, filter_field=None, filter_value=None, limit: int = None, after_id: int = None, stream: bool = False, columns=None):
+    """Retrieve all contracts, as a list or an async iterator when streaming. Only Sales may filter them."""
+    if RoleEnum(current_collaborator.role_id) != RoleEnum.SALES:
+        filter_field = filter_value = None
+    return await FilterHelper(db, Contract).apply_filter_async(filter_field, filter_value, limit, after_id, stream, columns)
+
+async def update_contract(db: AsyncSession, contract_id: int, **kwargs):
+    """
+    Update the given details of a contract in a single UPDATE, skipped if they are already set.
+
+    :return: False if the contract does not exist
+    """
+    update_helper = UpdateHelper(Contract, contract_id, kwargs)
+    if update_helper.changes:
+        result = await db.execute(update_helper.update_statement())
+        await db.commit()
+        if result.rowcount > 0:
+            return True
+    return await db.scalar(update_helper.exists_statement()) is not None
+
+async def delete_contract(db: AsyncSession, contract_id: int):
+    """Delete a contract by ID in a single DELETE, returns False if it does not exist."""
+    result = await db.execute(delete(Contract).where(Contract.id == contract_id))
+    await db.commit()
+    return result.rowcount > 0
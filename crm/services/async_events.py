@@ -0,0 +1,58 @@
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from crm.models.events import Event
+from crm.models.collaborators import Collaborator
+from crm.models.roles import RoleEnum
+from crm.helpers.format_helper import FormatHelper
+from crm.helpers.filter_helper import FilterHelper
+from crm.helpers.update_helper import UpdateHelper
+
+
+async def create_event(db: AsyncSession, name: str, location: str, attendees: str, notes: str, contract_id: str, start_date: str, end_date: str, support_id: str):
+    """Create a new event."""
+    event = Event(
+        name=name,
+        location=location,
+        attendees=attendees,
+        notes=notes,
+        contract_id=contract_id,
+        start_date=FormatHelper.format_date(start_date),
+        end_date=FormatHelper.format_date(end_date),
+        support_id=support_id
+    )
+    db.add(event)
+    await db.commit()
+    return event
+
+async def get_event(db: AsyncSession, event_id: int):
+    """Retrieve an event by ID."""
+    return await db.get(Event, event_id)
+
+async def get_all_events(db: AsyncSession, current_collaborator: Collaborator, filter_field=None, filter_value=None, limit: int = None, after_id: int = None, stream: bool = False, columns=None):
+    """Retrieve all events, as a list or an async iterator when streaming. Only Managers and Support may filter them."""
+    if RoleEnum(current_collaborator.role_id) not in (RoleEnum.MANAGEMENT, RoleEnum.SUPPORT):
+        filter_field = filter_value = None
+    return await FilterHelper(db, Event).apply_filter_async(filter_field, filter_value, limit, after_id, stream, columns)
+
+async def update_event(db: AsyncSession, event_id: int, **kwargs):
+    """
+    Update the given details of an event in a single UPDATE, skipped if they are already set.
+
+    :return: False if the event does not exist
+    """
+    for key in ("start_date", "end_date"):
+        if kwargs.get(key) is not None:
+            kwargs[key] = FormatHelper.format_date(kwargs[key])
+    update_helper = UpdateHelper(Event, event_id, kwargs)
+    if update_helper.changes:
+        result = await db.execute(update_helper.update_statement())
+        await db.commit()
+        if result.rowcount > 0:
+            return True
+    return await db.scalar(update_helper.exists_statement()) is not None
+
+async def delete_event(db: AsyncSession, event_id: int):
+    """Delete an event by ID in a single DELETE, returns False if it does not exist."""
+    result = await db.execute(delete(Event).where(Event.id == event_id))
+    await db.commit()
+    return result.rowcount > 0
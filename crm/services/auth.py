@@ -2,17 +2,20 @@ import keyring
 import bcrypt
 import jwt
 from datetime import datetime, timedelta, timezone
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from crm.models.collaborators import Collaborator
 from crm.models.blacklist_tokens import BlacklistToken
 from config import KEYRING_SERVICE, SECRET_KEY
 from crm.helpers.authorize_helper import encode_auth_token, decode_auth_token
+from crm.helpers.format_helper import FormatHelper
 
 def login_service(db: Session, email: str, password: str):
     """Logs in the user, stores token in keyring, and returns the user"""
     collaborator = db.query(Collaborator).filter_by(email=email).first()
 
     if collaborator and collaborator.check_password(password):
+        rehash_password(db, collaborator, password)
         auth_token = encode_auth_token(collaborator.id)
         if auth_token:
             keyring.set_password(KEYRING_SERVICE, "auth_token", auth_token)
@@ -22,6 +25,19 @@ def login_service(db: Session, email: str, password: str):
     else:
         return None, "❌ Invalid credentials."
 
+def rehash_password(db: Session, collaborator: Collaborator, password: str):
+    """Upgrades the password hash to the configured bcrypt cost, the plain password being known after a login"""
+    if not FormatHelper.password_needs_rehash(collaborator.password_hash):
+        return False
+    try:
+        collaborator.password_hash = FormatHelper.hash_password(password)
+        db.commit()
+        return True
+    except SQLAlchemyError:
+        # The old hash stays valid, the upgrade is retried on the next login
+        db.rollback()
+        return False
+
 def logout_service(db: Session):
     """Logs out the user by blacklisting the token and removing it from keyring"""
     token = keyring.get_password(KEYRING_SERVICE, "auth_token")
@@ -35,11 +51,12 @@ def logout_service(db: Session):
         return f"❌ {decoded_token}"
 
     try:
-        existing_blacklist = db.query(BlacklistToken).filter_by(token=token).first()
+        existing_blacklist = db.query(BlacklistToken.id).filter_by(token_digest=BlacklistToken.digest(token)).first()
         if existing_blacklist:
             keyring.delete_password(KEYRING_SERVICE, "auth_token")
             return "⚠️ Already logged out."
 
+        purge_expired_tokens(db)
         blacklisted_token = BlacklistToken(token=token)
         db.add(blacklisted_token)
         db.commit()
@@ -49,3 +66,8 @@ def logout_service(db: Session):
     except Exception as e:
         db.rollback()
         return f"❌ Error logging out: {str(e)}"
+
+def purge_expired_tokens(db: Session):
+    """Deletes revoked tokens whose expiration has passed, they can no longer be decoded anyway"""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return db.query(BlacklistToken).filter(BlacklistToken.expires_at < now).delete(synchronize_session=False)
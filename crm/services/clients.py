@@ -1,8 +1,12 @@
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from crm.models.clients import Client
 from crm.models.roles import RoleEnum
 from crm.helpers.authorize_helper import get_current_user
 from crm.helpers.filter_helper import FilterHelper
+from crm.helpers.update_helper import UpdateHelper
+from crm.helpers.import_helper import ImportHelper
+from crm.enums.model_type_enum import ModelTypeEnum
 import click
 
 
@@ -19,44 +23,52 @@ def create_client(db: Session, first_name: str, last_name: str, email: str, phon
     )
     db.add(client)
     db.commit()
-    db.refresh(client)
     return client
 
 def get_client(db: Session, client_id: int):
     """Retrieve a client by ID."""
     return db.query(Client).filter(Client.id == client_id).first()
 
-def get_all_clients(db: Session, filter_field, filter_value):
-    """Retrieve all clients."""
+def get_all_clients(db: Session, filter_field, filter_value, limit: int = None, after_id: int = None, stream: bool = False, columns=None):
+    """Retrieve all clients, as an iterator. Only the given columns are loaded if any, as read-only rows."""
     current_collaborator, error = get_current_user()
     if RoleEnum(current_collaborator.role_id) != RoleEnum.MANAGEMENT and (filter_field != None or filter_value != None):
-        click.echo(f"🚨 Only Managers have the right to use the filter option for clients, proceeding without them...")
+        click.echo(f"🚨 Only Managers have the right to use the filter option for clients, proceeding without them...", err=True)
         
     if not error and RoleEnum(current_collaborator.role_id) == RoleEnum.MANAGEMENT:
         filter_helper = FilterHelper(db, Client)
-        return filter_helper.apply_filter(filter_field, filter_value)
-    return db.query(Client).all()
+        return filter_helper.apply_filter(filter_field, filter_value, limit, after_id, stream, columns)
+    return FilterHelper(db, Client).apply_filter(limit=limit, after_id=after_id, stream=stream, columns=columns)
 
 def update_client(db: Session, client_id: int, **kwargs):
-    """Update a client's details."""
-    client = db.query(Client).filter(Client.id == client_id).first()
-    if not client:
-        return None
+    """
+    Update the given details of a client in a single UPDATE, skipped if they are already set.
 
-    for key, value in kwargs.items():
-        if hasattr(client, key) and value is not None:
-            setattr(client, key, value)
+    :return: False if the client does not exist
+    """
+    update_helper = UpdateHelper(Client, client_id, kwargs)
+    if update_helper.changes:
+        result = db.execute(update_helper.update_statement())
+        db.commit()
+        if result.rowcount > 0:
+            return True
+    return db.execute(update_helper.exists_statement()).first() is not None
 
+def delete_client(db: Session, client_id: int):
+    """Delete a client by ID in a single DELETE, returns False if it does not exist."""
+    result = db.execute(delete(Client).where(Client.id == client_id))
     db.commit()
-    db.refresh(client)
-    return client
+    return result.rowcount > 0
 
-def delete_client(db: Session, client_id: int):
-    """Delete a client by ID."""
-    client = db.query(Client).filter(Client.id == client_id).first()
-    if not client:
-        return False
+def import_clients(db: Session, file_path: str, file_format: str = None, chunk_size: int = ImportHelper.CHUNK_SIZE, report_path: str = None):
+    """Import clients from a CSV or JSON lines file, assigned to the current collaborator."""
+    current_collaborator, error = get_current_user()
 
-    db.delete(client)
-    db.commit()
-    return True
+    def assign_commercial(rows):
+        for _, data in rows:
+            data["commercial_id"] = current_collaborator.id
+        return {}
+
+    import_helper = ImportHelper(db, ModelTypeEnum.CLIENT, chunk_size, report_path, assign_commercial)
+    import_helper.import_file(file_path, file_format)
+    return import_helper
@@ -1,15 +1,20 @@
+from sqlalchemy import update, delete
 from sqlalchemy.orm import Session
 from crm.models.collaborators import Collaborator
-from crm.models.roles import Role, RoleEnum
+from crm.models.roles import RoleEnum
 from crm.helpers.format_helper import FormatHelper
 from crm.helpers.authorize_helper import get_current_user
 from crm.helpers.filter_helper import FilterHelper
+from crm.helpers.update_helper import UpdateHelper
+from crm.helpers.cache_helper import get_role, collaborator_cache
+from crm.helpers.import_helper import ImportHelper
+from crm.enums.model_type_enum import ModelTypeEnum
 import click
 
 
 def create_collaborator(db: Session, first_name: str, last_name: str, email: str, password: str, role_id: int):
     """Create a new collaborator."""
-    role = db.query(Role).filter(Role.id == role_id).first()
+    role = get_role(db, role_id)
     if not role:
         raise ValueError(f"Role ID {role_id} does not exist!")
 
@@ -22,57 +27,89 @@ def create_collaborator(db: Session, first_name: str, last_name: str, email: str
     )
     db.add(collaborator)
     db.commit()
-    db.refresh(collaborator)
     return collaborator
 
 def get_collaborator(db: Session, collaborator_id: int):
     """Retrieve a collaborator by ID."""
     return db.query(Collaborator).filter(Collaborator.id == collaborator_id).first()
 
-def get_all_collaborators(db: Session, filter_field, filter_value):
-    """Retrieve all collaborators."""
+def get_all_collaborators(db: Session, filter_field, filter_value, limit: int = None, after_id: int = None, stream: bool = False, columns=None):
+    """Retrieve all collaborators, as an iterator. Only the given columns are loaded if any, as read-only rows."""
     current_collaborator, error = get_current_user()
     if RoleEnum(current_collaborator.role_id) != RoleEnum.MANAGEMENT and (filter_field != None or filter_value != None):
-        click.echo(f"🚨 Only Managers have the right to use the filter option for clients, proceeding without them...")
+        click.echo(f"🚨 Only Managers have the right to use the filter option for clients, proceeding without them...", err=True)
         
     if not error and RoleEnum(current_collaborator.role_id) == RoleEnum.MANAGEMENT:
         filter_helper = FilterHelper(db, Collaborator)
-        return filter_helper.apply_filter(filter_field, filter_value)
-    return db.query(Collaborator).all()
+        return filter_helper.apply_filter(filter_field, filter_value, limit, after_id, stream, columns)
+    return FilterHelper(db, Collaborator).apply_filter(limit=limit, after_id=after_id, stream=stream, columns=columns)
 
 def update_collaborator(db: Session, collaborator_id: int, **kwargs):
-    """Update a collaborator's details."""
-    collaborator = db.query(Collaborator).filter(Collaborator.id == collaborator_id).first()
-    if not collaborator:
-        return None
+    """
+    Update the given details of a collaborator in a single UPDATE, skipped if they are already set.
 
-    for key, value in kwargs.items():
-        if hasattr(collaborator, key) and value is not None:
-            setattr(collaborator, key, value)
-
-    db.commit()
-    db.refresh(collaborator)
-    return collaborator
+    :return: False if the collaborator does not exist
+    """
+    update_helper = UpdateHelper(Collaborator, collaborator_id, kwargs)
+    if update_helper.changes:
+        result = db.execute(update_helper.update_statement())
+        db.commit()
+        collaborator_cache.invalidate(collaborator_id)
+        if result.rowcount > 0:
+            return True
+    return db.execute(update_helper.exists_statement()).first() is not None
 
 def update_password(db: Session, collaborator_id: int, password: str):
-    """Update a collaborator's password."""
-    collaborator = db.query(Collaborator).filter(Collaborator.id == collaborator_id).first()
-    if not collaborator:
-        return None
-
-    if password is not None:
-        setattr(collaborator, "password_hash", FormatHelper.hash_password(password))
+    """Update a collaborator's password in a single UPDATE, returns False if it does not exist."""
+    if password is None:
+        return db.query(Collaborator.id).filter(Collaborator.id == collaborator_id).first() is not None
 
+    result = db.execute(
+        update(Collaborator).where(Collaborator.id == collaborator_id).values(password_hash=FormatHelper.hash_password(password))
+    )
     db.commit()
-    db.refresh(collaborator)
-    return collaborator
+    return result.rowcount > 0
 
 def delete_collaborator(db: Session, collaborator_id: int):
-    """Delete a collaborator by ID."""
-    collaborator = db.query(Collaborator).filter(Collaborator.id == collaborator_id).first()
-    if not collaborator:
-        return False
-
-    db.delete(collaborator)
+    """Delete a collaborator by ID in a single DELETE, returns False if it does not exist."""
+    result = db.execute(delete(Collaborator).where(Collaborator.id == collaborator_id))
     db.commit()
-    return True
+    collaborator_cache.invalidate(collaborator_id)
+    return result.rowcount > 0
+
+def import_collaborators(db: Session, file_path: str, file_format: str = None, chunk_size: int = ImportHelper.CHUNK_SIZE, report_path: str = None):
+    """Import collaborators from a CSV or JSON lines file, the passwords of each chunk being hashed in parallel."""
+    pool = FormatHelper.password_pool()
+
+    def hash_passwords(rows):
+        hashes = FormatHelper.hash_passwords((data.pop("password") for _, data in rows), executor=pool)
+        for (_, data), password_hash in zip(rows, hashes):
+            data["password_hash"] = password_hash
+        return {}
+
+    import_helper = ImportHelper(db, ModelTypeEnum.COLLABORATOR, chunk_size, report_path, hash_passwords)
+    try:
+        import_helper.import_file(file_path, file_format)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return import_helper
+
+def update_passwords(db: Session, passwords: dict):
+    """
+    Reset the passwords of many collaborators, hashed in parallel and written in one transaction.
+
+    :param passwords: {collaborator id: new password} dict
+    :return: IDs of the collaborators not found, nothing being updated for them
+    """
+    existing_ids = {collaborator_id for collaborator_id, in db.query(Collaborator.id).filter(Collaborator.id.in_(passwords))}
+    collaborator_ids = [collaborator_id for collaborator_id in passwords if collaborator_id in existing_ids]
+
+    hashes = FormatHelper.hash_passwords(passwords[collaborator_id] for collaborator_id in collaborator_ids)
+    if collaborator_ids:
+        db.execute(update(Collaborator), [
+            {"id": collaborator_id, "password_hash": password_hash}
+            for collaborator_id, password_hash in zip(collaborator_ids, hashes)
+        ])
+        db.commit()
+    return [collaborator_id for collaborator_id in passwords if collaborator_id not in existing_ids]
@@ -1,8 +1,12 @@
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from crm.models.contracts import Contract
 from crm.models.roles import RoleEnum
 from crm.helpers.authorize_helper import get_current_user
 from crm.helpers.filter_helper import FilterHelper
+from crm.helpers.update_helper import UpdateHelper
+from crm.helpers.import_helper import ImportHelper
+from crm.enums.model_type_enum import ModelTypeEnum
 import click
 
 
@@ -18,44 +22,45 @@ def create_contract(db: Session, costing: float, remaining_due_payment: float, i
     )
     db.add(contract)
     db.commit()
-    db.refresh(contract)
     return contract
 
 def get_contract(db: Session, contract_id: int):
     """Retrieve a contract by ID."""
     return db.query(Contract).filter(Contract.id == contract_id).first()
 
-def get_all_contracts(db: Session, filter_field, filter_value):
-    """Retrieve all contracts."""
+def get_all_contracts(db: Session, filter_field, filter_value, limit: int = None, after_id: int = None, stream: bool = False, columns=None):
+    """Retrieve all contracts, as an iterator. Only the given columns are loaded if any, as read-only rows."""
     current_collaborator, error = get_current_user()
     if RoleEnum(current_collaborator.role_id) != RoleEnum.SALES and (filter_field != None or filter_value != None):
-        click.echo(f"🚨 Only Managers have the right to use the filter option for contracts, proceeding without them...")
+        click.echo(f"🚨 Only Managers have the right to use the filter option for contracts, proceeding without them...", err=True)
         
     if not error and RoleEnum(current_collaborator.role_id) == RoleEnum.SALES:
         filter_helper = FilterHelper(db, Contract)
-        return filter_helper.apply_filter(filter_field, filter_value)
-    return db.query(Contract).all()
+        return filter_helper.apply_filter(filter_field, filter_value, limit, after_id, stream, columns)
+    return FilterHelper(db, Contract).apply_filter(limit=limit, after_id=after_id, stream=stream, columns=columns)
 
 def update_contract(db: Session, contract_id: int, **kwargs):
-    """Update a contract's details."""
-    contract = db.query(Contract).filter(Contract.id == contract_id).first()
-    if not contract:
-        return None
+    """
+    Update the given details of a contract in a single UPDATE, skipped if they are already set.
 
-    for key, value in kwargs.items():
-        if hasattr(contract, key) and value is not None:
-            setattr(contract, key, value)
-
-    db.commit()
-    db.refresh(contract)
-    return contract
+    :return: False if the contract does not exist
+    """
+    update_helper = UpdateHelper(Contract, contract_id, kwargs)
+    if update_helper.changes:
+        result = db.execute(update_helper.update_statement())
+        db.commit()
+        if result.rowcount > 0:
+            return True
+    return db.execute(update_helper.exists_statement()).first() is not None
 
 def delete_contract(db: Session, contract_id: int):
-    """Delete a contract by ID."""
-    contract = db.query(Contract).filter(Contract.id == contract_id).first()
-    if not contract:
-        return False
-
-    db.delete(contract)
+    """Delete a contract by ID in a single DELETE, returns False if it does not exist."""
+    result = db.execute(delete(Contract).where(Contract.id == contract_id))
     db.commit()
-    return True
+    return result.rowcount > 0
+
+def import_contracts(db: Session, file_path: str, file_format: str = None, chunk_size: int = ImportHelper.CHUNK_SIZE, report_path: str = None):
+    """Import contracts from a CSV or JSON lines file."""
+    import_helper = ImportHelper(db, ModelTypeEnum.CONTRACT, chunk_size, report_path)
+    import_helper.import_file(file_path, file_format)
+    return import_helper
@@ -1,9 +1,15 @@
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 from crm.models.events import Event
+from crm.models.contracts import Contract
+from crm.models.clients import Client
 from crm.models.roles import RoleEnum
 from crm.helpers.authorize_helper import get_current_user
 from crm.helpers.format_helper import FormatHelper
 from crm.helpers.filter_helper import FilterHelper
+from crm.helpers.update_helper import UpdateHelper
+from crm.helpers.import_helper import ImportHelper
+from crm.enums.model_type_enum import ModelTypeEnum
 import click
 
 
@@ -22,49 +28,63 @@ def create_event(db: Session, name: str, location: str, attendees: str, notes: s
     
     db.add(event)
     db.commit()
-    db.refresh(event)
     return event
 
 def get_event(db: Session, event_id: int):
     """Retrieve a event by ID."""
     return db.query(Event).filter(Event.id == event_id).first()
 
-def get_all_events(db: Session, filter_field, filter_value):
-    """Retrieve all events."""
+def get_all_events(db: Session, filter_field, filter_value, limit: int = None, after_id: int = None, stream: bool = False, columns=None):
+    """Retrieve all events, as an iterator. Only the given columns are loaded if any, as read-only rows."""
     current_collaborator, error = get_current_user()
     is_of_authorized_roles = RoleEnum(current_collaborator.role_id) == RoleEnum.MANAGEMENT or RoleEnum(current_collaborator.role_id) == RoleEnum.SUPPORT
     if not is_of_authorized_roles and (filter_field != None or filter_value != None):
-        click.echo(f"🚨 Only Managers have the right to use the filter option for events, proceeding without them...")
+        click.echo(f"🚨 Only Managers have the right to use the filter option for events, proceeding without them...", err=True)
         
     if not error and is_of_authorized_roles:
         filter_helper = FilterHelper(db, Event)
-        return filter_helper.apply_filter(filter_field, filter_value)
-    return db.query(Event).all()
+        return filter_helper.apply_filter(filter_field, filter_value, limit, after_id, stream, columns)
+    return FilterHelper(db, Event).apply_filter(limit=limit, after_id=after_id, stream=stream, columns=columns)
 
 def update_event(db: Session, event_id: int, **kwargs):
-    """Update a event's details."""
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
-        return None
+    """
+    Update the given details of an event in a single UPDATE, skipped if they are already set.
 
-    for key, value in kwargs.items():
-        if hasattr(event, key) and value is not None:
-            if key == "start_date" or key == "end_date":
-                print("hein???")
-                setattr(event, key, FormatHelper.format_date(value))
-            else:
-                setattr(event, key, value)
+    :return: False if the event does not exist
+    """
+    for key in ("start_date", "end_date"):
+        if kwargs.get(key) is not None:
+            kwargs[key] = FormatHelper.format_date(kwargs[key])
+    update_helper = UpdateHelper(Event, event_id, kwargs)
+    if update_helper.changes:
+        result = db.execute(update_helper.update_statement())
+        db.commit()
+        if result.rowcount > 0:
+            return True
+    return db.execute(update_helper.exists_statement()).first() is not None
 
+def delete_event(db: Session, event_id: int):
+    """Delete an event by ID in a single DELETE, returns False if it does not exist."""
+    result = db.execute(delete(Event).where(Event.id == event_id))
     db.commit()
-    db.refresh(event)
-    return event
+    return result.rowcount > 0
 
-def delete_event(db: Session, event_id: int):
-    """Delete a event by ID."""
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if not event:
-        return False
+def import_events(db: Session, file_path: str, file_format: str = None, chunk_size: int = ImportHelper.CHUNK_SIZE, report_path: str = None):
+    """Import events from a CSV or JSON lines file, only for contracts of the current collaborator's clients."""
+    current_collaborator, error = get_current_user()
 
-    db.delete(event)
-    db.commit()
-    return True
+    def check_contracts_ownership(rows):
+        contract_ids = {data["contract_id"] for _, data in rows}
+        owned_contract_ids = {
+            contract_id for contract_id, in db.query(Contract.id)
+            .join(Client, Contract.client_id == Client.id)
+            .filter(Contract.id.in_(contract_ids), Client.commercial_id == current_collaborator.id)
+        }
+        return {
+            line: "contract_id: You can only create events for assigned clients."
+            for line, data in rows if data["contract_id"] not in owned_contract_ids
+        }
+
+    import_helper = ImportHelper(db, ModelTypeEnum.EVENT, chunk_size, report_path, check_contracts_ownership)
+    import_helper.import_file(file_path, file_format)
+    return import_helper
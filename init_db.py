@@ -1,9 +1,11 @@
 from crm.database import Base, engine, SessionLocal
 from crm.models.roles import Role
 from crm.models.collaborators import Collaborator
+from crm.helpers.migration_helper import run_migrations
+from crm.helpers.search_helper import create_search_indexes
+from crm.helpers.format_helper import FormatHelper
 from sqlalchemy import text, inspect  # ✅ Fix for SQLAlchemy 2.0+
 import os
-import bcrypt
 
 print("🔹 Step 1: Checking database connection...")
 
@@ -22,6 +24,14 @@ try:
     if "roles" not in existing_tables or "collaborators" not in existing_tables:
         print("❌ ERROR: Required tables were NOT created!")
         exit(1)
+
+    for step in run_migrations(engine):
+        print(f"✅ Migration: {step}")
+
+    if create_search_indexes(engine):
+        print("✅ Full-text search indexes ready!")
+    else:
+        print("⚠️ Full-text search indexes unavailable, searches will scan tables.")
 except Exception as e:
     print(f"❌ ERROR creating tables: {e}")
     exit(1)
@@ -58,7 +68,7 @@ print("📌 Checking users in the database...")
 
 # Get environment variables
 main_manager_email = os.getenv('MAIN_MANAGER_EMAIL')
-main_manager_password = bcrypt.hashpw(os.getenv('MAIN_MANAGER_PASSWORD').encode(), bcrypt.gensalt()).decode()
+main_manager_password = FormatHelper.hash_password(os.getenv('MAIN_MANAGER_PASSWORD'))
 
 if not main_manager_email or not main_manager_password:
     print("⚠️ WARNING: Environment variables for MAIN_MANAGER are missing!")
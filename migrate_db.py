@@ -0,0 +1,14 @@
+from crm.database import engine
+from crm.helpers.migration_helper import run_migrations
+
+print("📌 Migrating database schema...")
+
+try:
+    applied = run_migrations(engine)
+except Exception as e:
+    print(f"❌ ERROR migrating database: {e}")
+    exit(1)
+
+for step in applied:
+    print(f"✅ {step}")
+print("✅ Database is up to date!" if applied else "✅ Nothing to migrate, database is already up to date!")
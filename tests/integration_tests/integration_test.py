@@ -71,7 +71,7 @@ def test_full_integration_flow(cli_runner, test_db):
         assert str(contract_id) in result.output
 
         ## Step 10: Edit contract
-        result = cli_runner.invoke(cli, ["contracts", "edit", str(contract_id)], input="1500.0\n300.0\nTrue\n{}\n{}\n".format(client_id, sales_collaborator_id))
+        result = cli_runner.invoke(cli, ["contracts", "edit", str(contract_id), "--costing", "1500.0", "--remaining-due-payment", "300.0", "--is-signed", "True"])
         assert "✅ Contract" in result.output
 
         ## Step 11: Get all contracts
@@ -85,7 +85,7 @@ def test_full_integration_flow(cli_runner, test_db):
 
         ## Step 13: Login as manager & assign support to event
         cli_runner.invoke(cli, ["auth", "login"], input=f"{test_manager_email}\n{password}\n")
-        result = cli_runner.invoke(cli, ["events", "edit", str(event_id)], input="Test event\n20 Saint-Louis, 1000 Paris, France\n50\nA test event comment\n{}\n01/03/2025-12h00\n02/03/2025-18h00\n{}\n".format(contract_id, support_collaborator_id))
+        result = cli_runner.invoke(cli, ["events", "edit", str(event_id), "--support-id", str(support_collaborator_id)])
         assert "✅ Event" in result.output
 
         ## Step 14: Login as support & view event
@@ -94,7 +94,15 @@ def test_full_integration_flow(cli_runner, test_db):
         assert str(event_id) in result.output
 
         ## Step 15: Edit event details
-        result = cli_runner.invoke(cli, ["events", "edit", str(event_id)], input="Updated Event\n86 Walburge, 250 Bruxelles, Belgium\n100\nUpdated event comment\n{}\n10/10/2026-16h00\n15/11/2027-20h15\n{}\n".format(contract_id, support_collaborator_id))
+        result = cli_runner.invoke(cli, [
+            "events", "edit", str(event_id),
+            "--name", "Updated Event",
+            "--location", "86 Walburge, 250 Bruxelles, Belgium",
+            "--attendees", "100",
+            "--notes", "Updated event comment",
+            "--start-date", "10/10/2026-16h00",
+            "--end-date", "15/11/2027-20h15",
+            ])
         assert "✅ Event" in result.output
 
         ## Step 16: Login as sales & delete event
@@ -1,5 +1,5 @@
 import pytest
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, inspect, event
 from click.testing import CliRunner
 from sqlalchemy.orm import sessionmaker
 from crm.models import Base
@@ -8,12 +8,13 @@ from crm.models.collaborators import Collaborator
 from crm.models.clients import Client
 from crm.models.contracts import Contract
 from crm.models.events import Event
+from crm.helpers.cache_helper import CacheHelper
 import bcrypt
 from datetime import datetime
 
 TEST_DATABASE_URL = "sqlite:///:memory:"
 engine = create_engine(TEST_DATABASE_URL)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 test_manager_email = "testmanager@email.com"
 test_support_email = "testsupport@email.com"
@@ -29,6 +30,8 @@ def test_db():
 
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    # Cached roles and collaborators belong to the previous test's database
+    CacheHelper.reset_all()
 
     db = TestingSessionLocal()
 
@@ -146,3 +149,12 @@ def try_commit(db, model):
 def cli_runner():
     """Returns a Click CLI runner instance"""
     return CliRunner()
+
+@pytest.fixture
+def statements(test_db):
+    """Statements executed while the test runs."""
+    executed = []
+    record = lambda conn, cursor, statement, *args: executed.append(statement)
+    event.listen(test_db.get_bind(), "before_cursor_execute", record)
+    yield executed
+    event.remove(test_db.get_bind(), "before_cursor_execute", record)
@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from crm.database import async_database_url, get_async_session
+from crm.models import Base
+from crm.models.roles import Role
+from crm.models.collaborators import Collaborator
+from crm.services import async_clients, async_collaborators, async_contracts
+from tests.test_context_db import hashed_password
+
+
+def run(coroutine_function, engine):
+    """Run a coroutine function with a fresh AsyncSession on the engine."""
+    async def main():
+        async with get_async_session(engine) as db:
+            return await coroutine_function(db)
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def async_engine(tmp_path):
+    """File database on the aiosqlite driver, with the roles and a manager and a commercial."""
+    engine = create_async_engine(async_database_url(f"sqlite:///{tmp_path / 'async.db'}"))
+
+    async def setup():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with get_async_session(engine) as db:
+            db.add_all([Role(id=1, name="Sales"), Role(id=2, name="Support"), Role(id=3, name="Management")])
+            db.add_all([
+                Collaborator(id=1, first_name="Test", last_name="Manager", email="manager@async.test", password_hash=hashed_password, role_id=3),
+                Collaborator(id=2, first_name="Test", last_name="Commercial", email="commercial@async.test", password_hash=hashed_password, role_id=1),
+            ])
+            await db.commit()
+
+    asyncio.run(setup())
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+def test_async_database_url():
+    assert async_database_url("sqlite:///crm.db").drivername == "sqlite+aiosqlite"
+    assert async_database_url("mysql+pymysql://user:pw@localhost/crm").drivername == "mysql+aiomysql"
+    with pytest.raises(ValueError):
+        async_database_url("oracle://user:pw@localhost/crm")
+
+
+def test_async_client_lifecycle(async_engine):
+    async def scenario(db):
+        commercial = await async_collaborators.get_collaborator(db, 2)
+        client = await async_clients.create_client(db, commercial, "Ada", "Lovelace", "ada@async.test", "0102030405", "Engines")
+        updated = await async_clients.update_client(db, client.id, company_name="Analytical Engines")
+        fetched = await async_clients.get_client(db, client.id)
+        deleted = await async_clients.delete_client(db, client.id)
+        return client, updated, fetched, deleted, await async_clients.get_client(db, client.id)
+
+    client, updated, fetched, deleted, missing = run(scenario, async_engine)
+
+    assert client.commercial_id == 2
+    assert updated is True
+    assert fetched.company_name == "Analytical Engines"
+    assert deleted is True
+    assert missing is None
+
+
+def test_async_filters_follow_roles(async_engine):
+    async def scenario(db):
+        manager = await async_collaborators.get_collaborator(db, 1)
+        commercial = await async_collaborators.get_collaborator(db, 2)
+        for i in range(3):
+            await async_clients.create_client(db, commercial, f"Client{i}", "Async", f"client{i}@async.test", "0102030405", f"Company{i}")
+        filtered = await async_clients.get_all_clients(db, manager, "company_name", "Company1")
+        unfiltered = await async_clients.get_all_clients(db, commercial, "company_name", "Company1")
+        rows = await async_clients.get_all_clients(db, manager, limit=2, columns=("id", "email"))
+        return filtered, unfiltered, rows
+
+    filtered, unfiltered, rows = run(scenario, async_engine)
+
+    assert [client.company_name for client in filtered] == ["Company1"]
+    assert len(unfiltered) == 3
+    assert [row.email for row in rows] == ["client0@async.test", "client1@async.test"]
+
+
+def test_async_streaming(async_engine):
+    async def scenario(db):
+        commercial = await async_collaborators.get_collaborator(db, 2)
+        client = await async_clients.create_client(db, commercial, "Ada", "Lovelace", "ada@async.test", "0102030405", "Engines")
+        await async_contracts.create_contract(db, 500, 100, True, client.id, commercial.id)
+        await async_contracts.create_contract(db, 800, 0, False, client.id, commercial.id)
+        return [contract.costing async for contract in await async_contracts.get_all_contracts(db, commercial, stream=True)]
+
+    assert sorted(run(scenario, async_engine)) == [500, 800]
+
+
+def test_async_concurrent_sessions(async_engine):
+    async def main():
+        async def fetch(collaborator_id):
+            async with get_async_session(async_engine) as db:
+                return await async_collaborators.get_collaborator(db, collaborator_id)
+        return await asyncio.gather(*(fetch(collaborator_id) for collaborator_id in (1, 2, 1, 2)))
+
+    collaborators = asyncio.run(main())
+
+    assert [collaborator.email for collaborator in collaborators] == [
+        "manager@async.test", "commercial@async.test", "manager@async.test", "commercial@async.test"
+    ]
+
+
+def test_async_collaborator_unknown_role(async_engine):
+    async def scenario(db):
+        await async_collaborators.create_collaborator(db, "No", "Role", "norole@async.test", "S3curedP@ssword", 42)
+
+    with pytest.raises(ValueError):
+        run(scenario, async_engine)
@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 import pytest
 import keyring
 import jwt
@@ -6,6 +9,7 @@ from crm.services.auth import login_service, logout_service, SECRET_KEY, KEYRING
 from crm.models.collaborators import Collaborator
 from crm.models.blacklist_tokens import BlacklistToken
 from crm.database import SessionLocal
+from crm.helpers.format_helper import FormatHelper
 from tests.test_context_db import test_db, test_manager_email, password
 from unittest.mock import patch
 
@@ -53,7 +57,7 @@ def test_logout_service(test_db):
         token = keyring.get_password(KEYRING_SERVICE, "auth_token")
         assert token is None, "❌ Token should be removed from keyring after logout!"
 
-        blacklisted_token = test_db.query(BlacklistToken).filter(BlacklistToken.token.isnot(None)).first()
+        blacklisted_token = test_db.query(BlacklistToken).filter(BlacklistToken.token_digest.isnot(None)).first()
         assert blacklisted_token is not None, "❌ Token should be blacklisted after logout!"
 
 
@@ -71,5 +75,52 @@ def test_blacklisted_token_cannot_be_used(test_db):
     test_db.add(blacklisted_token)
     test_db.commit()
 
-    blacklisted = test_db.query(BlacklistToken).filter_by(token=fake_token).first()
+    blacklisted = test_db.query(BlacklistToken).filter_by(token_digest=BlacklistToken.digest(fake_token)).first()
     assert blacklisted is not None, "❌ Token should be blacklisted!"
+    assert len(blacklisted.token_digest) == 64
+    assert blacklisted.expires_at > datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def test_logout_purges_expired_tokens(test_db):
+    """Ensure expired revocations are removed when a new token is blacklisted."""
+    expired_token = jwt.encode(
+        {"sub": "1", "exp": datetime.now(timezone.utc) - timedelta(hours=1)},
+        SECRET_KEY,
+        algorithm="HS256"
+    )
+    test_db.add(BlacklistToken(token=expired_token))
+    test_db.commit()
+
+    with (
+        patch("crm.helpers.authorize_helper.DB", test_db),
+    ):
+        login_service(test_db, test_manager_email, password)
+        error = logout_service(test_db)
+        assert error is None
+
+    assert test_db.query(BlacklistToken).filter_by(token_digest=BlacklistToken.digest(expired_token)).first() is None
+    assert test_db.query(BlacklistToken).count() == 1
+
+def test_login_rehashes_password_with_new_cost(test_db):
+    with patch("keyring.set_password"), patch("crm.helpers.format_helper.BCRYPT_ROUNDS", 5):
+        user, error = login_service(test_db, test_manager_email, password)
+
+    assert error is None
+    assert user.password_hash.startswith("$2b$05$")
+    assert user.check_password(password)
+
+def test_login_keeps_password_hash_with_same_cost(test_db):
+    old_hash = test_db.query(Collaborator).filter_by(email=test_manager_email).one().password_hash
+    with patch("keyring.set_password"), patch("crm.helpers.format_helper.BCRYPT_ROUNDS", FormatHelper.password_rounds(old_hash)):
+        user, error = login_service(test_db, test_manager_email, password)
+
+    assert error is None
+    assert user.password_hash == old_hash
+
+@pytest.mark.parametrize("rounds", ["3", "32"])
+def test_out_of_range_bcrypt_rounds_fail_at_startup(rounds):
+    env = {**os.environ, "BCRYPT_ROUNDS": rounds}
+    result = subprocess.run([sys.executable, "-c", "import config"], capture_output=True, text=True, env=env)
+
+    assert result.returncode != 0
+    assert f"BCRYPT_ROUNDS must be between 4 and 31, got {rounds}" in result.stderr
@@ -6,10 +6,13 @@ from crm.helpers.authorize_helper import (
     get_current_user,
     get_authenticated_collaborator,
     encode_auth_token,
-    decode_auth_token
+    decode_auth_token,
+    role_restricted,
+    current_auth
 )
 from crm.models.collaborators import Collaborator
 from crm.models.blacklist_tokens import BlacklistToken
+from crm.models.roles import RoleEnum
 from config import SECRET_KEY
 
 @pytest.fixture
@@ -130,3 +133,19 @@ def test_decode_auth_token_invalid(mock_context, invalid_token):
         user_id = decode_auth_token(invalid_token)
         
         assert user_id == "Invalid token. Please log in again."
+
+def test_current_user_resolved_once_per_command():
+    """Test the decorators resolve the collaborator once and share it with the command."""
+    collaborator = MagicMock(id=1, role_id=RoleEnum.MANAGEMENT.value)
+
+    @role_restricted([RoleEnum.MANAGEMENT])
+    def command():
+        user, error = get_current_user()
+        return user
+
+    with patch("crm.helpers.authorize_helper.resolve_current_user", return_value=(collaborator, None)) as mock_resolve:
+        assert command() is collaborator
+        assert command() is collaborator
+
+    assert mock_resolve.call_count == 2
+    assert current_auth.get() is None
@@ -0,0 +1,80 @@
+import pytest
+from unittest.mock import patch
+from crm.helpers.cache_helper import CacheHelper, get_role, get_collaborator_entry, collaborator_cache, role_cache
+from crm.helpers.validator_helper import ValidatorHelper
+from crm.helpers.authorize_helper import get_authenticated_collaborator, encode_auth_token
+from crm.enums.model_type_enum import ModelTypeEnum
+from crm.services.collaborators import update_collaborator, delete_collaborator
+from tests.test_context_db import test_db, statements
+
+
+@pytest.fixture
+def cache():
+    """Cache registered for the duration of the test."""
+    yield CacheHelper("test", ttl=60)
+    CacheHelper.caches.pop("test")
+
+
+def test_cache_counts_hits_and_misses(cache):
+    loads = []
+    load = lambda: loads.append(1) or "value"
+
+    assert cache.get("key", load) == "value"
+    assert cache.get("key", load) == "value"
+    assert cache.get("missing", lambda: None) is None
+    assert cache.get("missing", lambda: None) is None
+
+    assert len(loads) == 1
+    assert cache.stats() == {"hits": 1, "misses": 3, "entries": 1}
+    assert CacheHelper.all_stats()["test"] == cache.stats()
+
+
+def test_cache_entries_expire(cache):
+    cache.set("key", "old")
+
+    with patch("crm.helpers.cache_helper.time.monotonic", return_value=float("inf")):
+        assert cache.get("key", lambda: "new") == "new"
+
+    cache.invalidate("key")
+    assert cache.get("key", lambda: "reloaded") == "reloaded"
+
+
+def test_roles_loaded_once(test_db, statements):
+    assert get_role(test_db, 1).name == "Sales"
+    assert get_role(test_db, 3).name == "Management"
+    assert get_role(test_db, 42) is None
+
+    assert len(statements) == 2
+    assert role_cache.stats()["entries"] == 3
+
+
+def test_validation_resolves_collaborators_from_memory(test_db, statements):
+    data = {"name": "Cached", "support_id": 2}
+    ValidatorHelper(test_db, ModelTypeEnum.EVENT, data).validate_data()
+    statements.clear()
+
+    validator = ValidatorHelper(test_db, ModelTypeEnum.EVENT, data)
+    validator.validate_data()
+
+    assert validator.is_valid()
+    assert statements == []
+    assert collaborator_cache.stats()["hits"] == 1
+
+
+def test_authentication_uses_directory(test_db):
+    with patch("crm.helpers.authorize_helper.DB", test_db):
+        first, _ = get_authenticated_collaborator(encode_auth_token(1))
+        second, _ = get_authenticated_collaborator(encode_auth_token(1))
+
+    assert first is second
+    assert (first.id, first.role_id) == (1, 3)
+
+
+def test_collaborator_writes_invalidate_directory(test_db):
+    assert get_collaborator_entry(test_db, 3).role_id == 1
+
+    update_collaborator(test_db, 3, role_id=2)
+    assert get_collaborator_entry(test_db, 3).role_id == 2
+
+    delete_collaborator(test_db, 3)
+    assert get_collaborator_entry(test_db, 3) is None
@@ -1,11 +1,14 @@
 import pytest
+from sqlalchemy import LargeBinary
+from sqlalchemy.dialects import mysql, sqlite
 from sqlalchemy.orm import Session
 from crm.models.clients import Client
 from crm.models.roles import RoleEnum
 from unittest.mock import patch
 from crm.helpers.authorize_helper import get_current_user
+from crm.helpers.update_helper import CaseSensitiveString
 from crm.services.clients import create_client, get_client, get_all_clients, update_client, delete_client
-from tests.test_context_db import test_db
+from tests.test_context_db import test_db, statements
 
 
 @pytest.fixture
@@ -62,26 +65,64 @@ def test_get_all_clients(test_db):
     with (
         patch("crm.services.clients.get_current_user", return_value=(mock_collaborator, None)),
     ):
-        clients = get_all_clients(db=test_db, filter_field=None, filter_value=None)
-
-        assert isinstance(clients, list), "❌ Should return a list"
+        clients = list(get_all_clients(db=test_db, filter_field=None, filter_value=None))
         assert len(clients) > 0, "❌ Should retrieve at least one client"
 
 
 def test_update_client(test_db, sample_client):
     """Test updating a client's details."""
-    updated_client = update_client(
+    updated = update_client(
         db=test_db,
         client_id=sample_client.id,
         phone="111222333",
         company_name="Updated Doe Inc"
     )
 
-    assert updated_client is not None, "❌ Client should exist"
+    assert updated is True, "❌ Client should exist"
+    updated_client = get_client(db=test_db, client_id=sample_client.id)
     assert updated_client.phone == "111222333"
     assert updated_client.company_name == "Updated Doe Inc"
 
 
+def test_writes_skip_refresh(test_db, sample_client, statements):
+    """Test creating a client does not reload it after the commit."""
+    mock_collaborator = type("Collaborator", (object,), {"id": 3})
+
+    with patch("crm.services.clients.get_current_user", return_value=(mock_collaborator, None)):
+        client = create_client(test_db, "Bob", "Martin", "bob.martin@example.com", "123456789", "Martin SA")
+    assert client.id is not None and client.full_name
+    assert [statement.split()[0] for statement in statements] == ["INSERT"]
+
+
+def test_update_and_delete_in_one_statement(test_db, sample_client, statements):
+    """Test updates and deletes by ID run a single statement, a missing client being told apart from an unchanged one."""
+    assert update_client(test_db, sample_client.id, phone="444555666") is True
+    assert delete_client(test_db, sample_client.id) is True
+    assert update_client(test_db, sample_client.id, phone="777888999") is False
+    assert delete_client(test_db, sample_client.id) is False
+
+    assert [statement.split()[0] for statement in statements] == ["UPDATE", "DELETE", "UPDATE", "SELECT", "DELETE"]
+
+
+def test_update_client_case_only_change(test_db, sample_client, statements):
+    """Test a case-only edit is written, the new value being compared case-sensitively with the stored one."""
+    email = sample_client.email.upper()
+    assert update_client(test_db, sample_client.id, email=email) is True
+    assert [statement.split()[0] for statement in statements] == ["UPDATE"]
+
+    test_db.expire_all()
+    assert get_client(test_db, sample_client.id).email == email
+
+
+def test_case_sensitive_string_binds_bytes_on_mysql():
+    """Test values compared with string columns are bound as binary strings on MySQL only."""
+    case_sensitive = CaseSensitiveString()
+
+    assert case_sensitive.process_bind_param("John.Doe", mysql.dialect()) == b"John.Doe"
+    assert isinstance(case_sensitive.load_dialect_impl(mysql.dialect()), LargeBinary)
+    assert case_sensitive.process_bind_param("John.Doe", sqlite.dialect()) == "John.Doe"
+
+
 def test_delete_client(test_db, sample_client):
     """Test deleting a client."""
     result = delete_client(db=test_db, client_id=sample_client.id)
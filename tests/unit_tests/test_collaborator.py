@@ -1,9 +1,12 @@
 import pytest
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import patch
 from crm.models.roles import Role
 from crm.models.collaborators import Collaborator
-from tests.test_context_db import test_db, test_manager_email
-from crm.services.collaborators import create_collaborator, get_collaborator, get_all_collaborators, update_collaborator, delete_collaborator
+from tests.test_context_db import test_db, test_manager_email, cli_runner
+from crm.services.collaborators import create_collaborator, get_collaborator, get_all_collaborators, update_collaborator, delete_collaborator, import_collaborators, update_passwords
+from crm.helpers.format_helper import FormatHelper
+from crm.cli.main import cli
 import bcrypt
 
 def test_create_collaborator(test_db):
@@ -17,7 +20,7 @@ def test_get_all_collaborator(test_db):
     with (
         patch("crm.services.collaborators.get_current_user", return_value=(mock_collaborator, None)),
     ):
-        collabs = get_all_collaborators(test_db, filter_field=None, filter_value=None)
+        collabs = list(get_all_collaborators(test_db, filter_field=None, filter_value=None))
         assert collabs is not None
         assert len(collabs) == 3
 
@@ -27,10 +30,90 @@ def test_get_collaborator(test_db):
     assert collab.email == test_manager_email
 
 def test_update_collaborator(test_db):
-    updated = update_collaborator(test_db, 1, first_name="Jane")
-    assert updated is not None
-    assert updated.first_name == "Jane"
+    assert update_collaborator(test_db, 1, first_name="Jane") is True
+    assert get_collaborator(test_db, 1).first_name == "Jane"
+    assert update_collaborator(test_db, 999, first_name="Jane") is False
 
 def test_delete_collaborator(test_db):
     assert delete_collaborator(test_db, 1) is True
-    assert get_collaborator(test_db, 1) is None
\ No newline at end of file
+    assert get_collaborator(test_db, 1) is None
+
+def test_hash_passwords_in_parallel():
+    passwords = ["First-P4ssword", "Second-P4ssword", "Third-P4ssword"]
+    hashes = FormatHelper.hash_passwords(passwords, workers=2)
+    assert [bcrypt.checkpw(p.encode(), h.encode()) for p, h in zip(passwords, hashes)] == [True, True, True]
+
+def test_import_collaborators(test_db, tmp_path):
+    file_path = tmp_path / "collaborators.csv"
+    file_path.write_text(
+        "first_name,last_name,email,password,role_id\n"
+        "Ada,Lovelace,ada@email.com,An4lytical!,2\n"
+        "Weak,Password,weak@email.com,weak,1\n"
+    )
+    report_path = tmp_path / "errors.csv"
+
+    import_helper = import_collaborators(test_db, str(file_path), report_path=str(report_path))
+
+    assert (import_helper.imported, import_helper.rejected) == (1, 1)
+    ada = test_db.query(Collaborator).filter_by(email="ada@email.com").one()
+    assert ada.check_password("An4lytical!")
+    assert "weak@email.com" in report_path.read_text()
+    assert "weak," not in report_path.read_text()
+
+def test_import_collaborators_shares_one_pool(test_db, tmp_path):
+    file_path = tmp_path / "collaborators.csv"
+    file_path.write_text(
+        "first_name,last_name,email,password,role_id\n"
+        "Ada,Lovelace,ada@email.com,An4lytical!,2\n"
+        "Alan,Turing,alan@email.com,En1gma-C0de!,2\n"
+        "Grace,Hopper,grace@email.com,C0bol-Rules!,2\n"
+        "Linus,Torvalds,linus@email.com,K3rnel-Tux!,2\n"
+    )
+
+    with (
+        patch.object(FormatHelper, "available_cores", return_value=2),
+        patch("crm.helpers.format_helper.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool,
+    ):
+        import_helper = import_collaborators(test_db, str(file_path), chunk_size=2)
+
+    assert import_helper.imported == 4
+    assert pool.call_count == 1
+
+def test_import_collaborators_report_hides_hashes(test_db, tmp_path):
+    file_path = tmp_path / "collaborators.csv"
+    file_path.write_text(
+        "first_name,last_name,email,password,role_id\n"
+        f"Dup,Licate,{test_manager_email},Dupl1cate!,2\n"
+    )
+    report_path = tmp_path / "errors.csv"
+
+    import_helper = import_collaborators(test_db, str(file_path), report_path=str(report_path))
+
+    assert (import_helper.imported, import_helper.rejected) == (0, 1)
+    report = report_path.read_text()
+    assert test_manager_email in report
+    assert "password_hash" not in report
+    assert "$2b$" not in report
+
+def test_update_passwords(test_db):
+    missing_ids = update_passwords(test_db, {1: "N3w-Password", 2: "0ther-Password", 99: "Unkn0wn-Password"})
+    assert missing_ids == [99]
+    test_db.expire_all()
+    assert get_collaborator(test_db, 1).check_password("N3w-Password")
+    assert get_collaborator(test_db, 2).check_password("0ther-Password")
+
+def test_reset_passwords_command(test_db, cli_runner, tmp_path):
+    file_path = tmp_path / "passwords.jsonl"
+    file_path.write_text('{"id": 2, "password": "R3set-P@ssword"}\n{"id": 3, "password": "short"}\n')
+    mock_collaborator = type("Collaborator", (object,), {"id": 1, "role_id": 3})
+    with (
+        patch("crm.cli.collaborators.DB", test_db),
+        patch("crm.helpers.authorize_helper.get_current_user", return_value=(mock_collaborator, None)),
+    ):
+        result = cli_runner.invoke(cli, ["collaborators", "reset-passwords", str(file_path)])
+
+    assert result.exit_code == 0, result.output
+    assert "❌ Line 2 skipped" in result.output
+    assert "✅ 1 passwords updated successfully!" in result.output
+    test_db.expire_all()
+    assert get_collaborator(test_db, 2).check_password("R3set-P@ssword")
@@ -60,24 +60,24 @@ def test_get_all_contracts(test_db):
     with (
         patch("crm.services.contracts.get_current_user", return_value=(mock_collaborator, None)),
     ):
-        contracts = get_all_contracts(db=test_db, filter_field=None, filter_value=None)
-
-    assert isinstance(contracts, list), "❌ Should return a list"
+        contracts = list(get_all_contracts(db=test_db, filter_field=None, filter_value=None))
     assert len(contracts) > 0, "❌ At least one contract should be present"
 
 
 def test_update_contract(test_db, sample_contract):
     """Test updating a contract's details."""
-    updated_contract = update_contract(
+    updated = update_contract(
         db=test_db,
         contract_id=sample_contract.id,
         remaining_due_payment=0.00,
         is_signed=True
     )
 
-    assert updated_contract is not None, "❌ Contract should exist"
+    assert updated is True, "❌ Contract should exist"
+    updated_contract = get_contract(db=test_db, contract_id=sample_contract.id)
     assert updated_contract.remaining_due_payment == 0.00
     assert updated_contract.is_signed is True
+    assert update_contract(db=test_db, contract_id=999, is_signed=False) is False
 
 
 def test_delete_contract(test_db, sample_contract):
@@ -0,0 +1,100 @@
+import io
+import os
+import socket
+import threading
+import pytest
+from crm.helpers.daemon_helper import DaemonServer, command_settings, forward_command, stop_daemon, is_daemon_running
+
+
+@pytest.fixture
+def daemon_socket(tmp_path):
+    """Run a daemon in a background thread for the duration of the test."""
+    socket_path = str(tmp_path / "crm.sock")
+    ready = threading.Event()
+    thread = threading.Thread(target=DaemonServer(socket_path).serve_forever, args=(ready,), daemon=True)
+    thread.start()
+    assert ready.wait(10)
+    yield socket_path
+    stop_daemon(socket_path)
+    thread.join(10)
+
+
+def test_forward_without_daemon(tmp_path):
+    assert forward_command(["--help"], str(tmp_path / "missing.sock")) is None
+
+
+def test_forward_streams_output(daemon_socket):
+    stdout, stderr = io.BytesIO(), io.BytesIO()
+
+    exit_code = forward_command(["clients", "--help"], daemon_socket, stdout, stderr)
+
+    assert exit_code == 0
+    assert "Manage Clients" in stdout.getvalue().decode()
+
+
+def test_forward_reports_usage_errors(daemon_socket):
+    stdout, stderr = io.BytesIO(), io.BytesIO()
+
+    exit_code = forward_command(["clients", "unknown"], daemon_socket, stdout, stderr)
+
+    assert exit_code == 2
+    assert "No such command" in stderr.getvalue().decode()
+
+
+def test_prompting_command_falls_back(daemon_socket):
+    stdout = io.BytesIO()
+
+    assert forward_command(["auth", "login"], daemon_socket, stdout) is None
+    assert stdout.getvalue() == b""
+
+
+@pytest.mark.parametrize("setting", ["DATABASE_URL", "KEYRING_SERVICE"])
+def test_other_settings_fall_back(daemon_socket, setting):
+    stdout, stderr = io.BytesIO(), io.BytesIO()
+    settings = {**command_settings(), setting: "other"}
+
+    assert forward_command(["clients", "--help"], daemon_socket, stdout, stderr, settings) is None
+    assert stdout.getvalue() == b""
+
+
+def test_stop_daemon(daemon_socket):
+    assert is_daemon_running(daemon_socket)
+    assert stop_daemon(daemon_socket)
+    assert forward_command(["--help"], daemon_socket) is None
+
+
+@pytest.mark.parametrize("message", [b"not json\n", b"[1]\n", b'{"argv": 1}\n'])
+def test_malformed_message_keeps_daemon_running(daemon_socket, message):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(daemon_socket)
+        connection.sendall(message)
+        assert connection.makefile("rb").read() == b""
+
+    stdout = io.BytesIO()
+    assert forward_command(["clients", "--help"], daemon_socket, stdout) == 0
+    assert "Manage Clients" in stdout.getvalue().decode()
+
+
+def test_stopped_daemon_stops_listening_first(daemon_socket):
+    assert stop_daemon(daemon_socket)
+    assert not os.path.exists(daemon_socket)
+    assert not is_daemon_running(daemon_socket)
+
+
+def test_unanswered_command_runs_in_process(tmp_path):
+    """A daemon closing the connection without any frame, as a stopping one does, is no daemon."""
+    socket_path = str(tmp_path / "closing.sock")
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+
+    def close_unanswered():
+        connection, _ = server.accept()
+        connection.makefile("rb").readline()
+        connection.close()
+
+    thread = threading.Thread(target=close_unanswered, daemon=True)
+    thread.start()
+    assert forward_command(["clients", "list"], socket_path) is None
+    thread.join(10)
+    server.close()
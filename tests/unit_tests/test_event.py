@@ -1,10 +1,12 @@
 import pytest
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy.orm import Session
 from crm.models.events import Event
 from crm.models.contracts import Contract
 from crm.helpers.format_helper import FormatHelper
 from crm.services.events import create_event, get_event, get_all_events, update_event, delete_event
-from tests.test_context_db import test_db, test_manager_email
+from crm.cli.main import cli
+from tests.test_context_db import test_db, test_manager_email, statements, cli_runner
 from unittest.mock import patch
 
 
@@ -70,22 +72,21 @@ def test_get_all_events(test_db):
     with (
         patch("crm.services.events.get_current_user", return_value=(mock_collaborator, None)),
     ):
-        events = get_all_events(db=test_db, filter_field=None, filter_value=None)
-
-        assert isinstance(events, list), "❌ Should return a list"
+        events = list(get_all_events(db=test_db, filter_field=None, filter_value=None))
         assert len(events) > 0, "❌ At least one event should be present"
 
 
 def test_update_event(test_db, sample_event):
     """Test updating an event's details."""
-    updated_event = update_event(
+    updated = update_event(
         db=test_db,
         event_id=sample_event.id,
         location="Bruxelles",
         attendees=200
     )
 
-    assert updated_event is not None, "❌ Event should exist"
+    assert updated is True, "❌ Event should exist"
+    updated_event = get_event(db=test_db, event_id=sample_event.id)
     assert updated_event.location == "Bruxelles"
     assert updated_event.attendees == 200
 
@@ -96,3 +97,52 @@ def test_delete_event(test_db, sample_event):
 
     assert result is True, "❌ Event should be deleted"
     assert get_event(db=test_db, event_id=sample_event.id) is None, "❌ Event should not exist after deletion"
+    assert delete_event(db=test_db, event_id=sample_event.id) is False
+
+
+def test_get_all_events_projection(test_db, sample_event):
+    """Test listing only some columns returns read-only rows without loading entities."""
+    mock_collaborator = type("Collaborator", (object,), {"id": 3, "role_id": 3})
+    test_db.expunge_all()
+    with (
+        patch("crm.services.events.get_current_user", return_value=(mock_collaborator, None)),
+    ):
+        events = list(get_all_events(db=test_db, filter_field=None, filter_value=None, columns=tuple(Event.MINIMAL_INFOS_LABELS)))
+
+    assert len(events) > 0, "❌ At least one event should be present"
+    assert set(events[0]._fields) == set(Event.MINIMAL_INFOS_LABELS)
+    assert not hasattr(events[0], "notes"), "❌ Notes should not be loaded"
+    assert len(test_db.identity_map) == 0, "❌ No entity should be loaded"
+
+
+def test_update_event_skips_unchanged_values(test_db, sample_event, statements):
+    """Test an update giving the current values writes no row and still finds the event."""
+    updated = []
+    record = lambda conn, cursor, statement, parameters, context, executemany: updated.append(cursor.rowcount)
+    sqlalchemy_event.listen(test_db.get_bind(), "after_cursor_execute", record)
+    try:
+        assert update_event(db=test_db, event_id=sample_event.id, location=sample_event.location) is True
+        assert update_event(db=test_db, event_id=999, location="Lyon") is False
+    finally:
+        sqlalchemy_event.remove(test_db.get_bind(), "after_cursor_execute", record)
+
+    assert [statement.split()[0] for statement in statements] == ["UPDATE", "SELECT", "UPDATE", "SELECT"]
+    assert updated[0] == 0
+
+
+def test_edit_event_writes_given_options_only(test_db, cli_runner, sample_event):
+    """Test editing an event only validates and writes the given options, without prompting."""
+    mock_collaborator = type("Collaborator", (object,), {"id": 1, "role_id": 3})
+    location, notes = sample_event.location, sample_event.notes
+    with (
+        patch("crm.cli.events.DB", test_db),
+        patch("crm.helpers.authorize_helper.get_current_user", return_value=(mock_collaborator, None)),
+    ):
+        result = cli_runner.invoke(cli, ["events", "edit", str(sample_event.id), "--support-id", "2"])
+        nothing = cli_runner.invoke(cli, ["events", "edit", str(sample_event.id)])
+
+    assert f"✅ Event {sample_event.id} updated successfully!" in result.output
+    assert "Nothing to update" in nothing.output
+    test_db.expire_all()
+    event = get_event(db=test_db, event_id=sample_event.id)
+    assert (event.support_id, event.location, event.notes) == (2, location, notes)
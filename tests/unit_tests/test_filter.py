@@ -1,7 +1,12 @@
+import csv
+import gzip
+import io
+import json
 import pytest
 from sqlalchemy.orm import Session
 from crm.models.clients import Client
 from unittest.mock import patch
+from click.testing import CliRunner
 from crm.services.clients import create_client, get_client, get_all_clients
 from tests.test_context_db import test_db, cli_runner
 from crm.cli.main import cli
@@ -108,3 +113,113 @@ def test_filter_value_only(cli_runner, sample_client, test_db, patch_batch):
 
     assert result.exit_code == 0, f"Command failed with exit code {result.exit_code}"
     assert "First name: John" in result.output
+
+
+def test_list_limit_prints_cursor(cli_runner, sample_client, test_db, patch_batch):
+    """Test a limited listing stops at the page size and prints the next cursor."""
+    first_ids = [c.id for c in test_db.query(Client).order_by(Client.id).limit(2)]
+
+    result = cli_runner.invoke(cli, ["clients", "list", "--limit", "2"])
+
+    assert result.exit_code == 0, f"Command failed with exit code {result.exit_code}"
+    assert result.output.count("Email:") == 2
+    assert f"--after {first_ids[-1]}" in result.output
+
+
+def test_list_after_cursor(cli_runner, sample_client, test_db, patch_batch):
+    """Test the cursor only lists clients with a greater ID."""
+    last_ids = [c.id for c in test_db.query(Client).order_by(Client.id.desc()).limit(2)]
+
+    result = cli_runner.invoke(cli, ["clients", "list", "--after", str(last_ids[-1]), "--limit", "2"])
+
+    assert result.exit_code == 0, f"Command failed with exit code {result.exit_code}"
+    assert result.output.count("Email:") == 1
+    assert f"ID: {last_ids[0]}" in result.output
+    assert "--after" not in result.output
+
+
+def test_list_stream(cli_runner, sample_client, test_db, patch_batch):
+    """Test streaming lists every client."""
+    result = cli_runner.invoke(cli, ["clients", "list", "--stream"])
+
+    assert result.exit_code == 0, f"Command failed with exit code {result.exit_code}"
+    assert result.output.count("Email:") == test_db.query(Client).count()
+
+
+def test_list_jsonl_format(cli_runner, sample_client, test_db, patch_batch):
+    """Test listing clients as JSON lines."""
+    result = cli_runner.invoke(cli, ["clients", "list", "--format", "jsonl"])
+
+    assert result.exit_code == 0, f"Command failed with exit code {result.exit_code}"
+    rows = [json.loads(line) for line in result.output.splitlines()]
+    assert len(rows) == test_db.query(Client).count()
+    assert {"id", "first_name", "last_name", "email", "commercial_id"} == set(rows[0])
+    assert "john.doe@example.com" in [row["email"] for row in rows]
+
+
+def test_list_csv_format(cli_runner, sample_client, test_db, patch_batch):
+    """Test listing clients as CSV with a header row."""
+    result = cli_runner.invoke(cli, ["clients", "list", "--filter-field", "email", "--filter-value", "john.doe", "--format", "csv"])
+
+    assert result.exit_code == 0, f"Command failed with exit code {result.exit_code}"
+    rows = list(csv.DictReader(io.StringIO(result.output)))
+    assert len(rows) == 1
+    assert rows[0]["email"] == "john.doe@example.com"
+
+
+def test_list_table_format(cli_runner, sample_client, test_db, patch_batch):
+    """Test listing clients as an aligned table."""
+    result = cli_runner.invoke(cli, ["clients", "list", "--format", "table"])
+
+    assert result.exit_code == 0, f"Command failed with exit code {result.exit_code}"
+    lines = result.output.splitlines()
+    assert lines[0].startswith("ID")
+    assert "Related collaborator ID" in lines[0]
+    assert len(lines) == test_db.query(Client).count() + 2
+
+
+def test_view_jsonl_format(cli_runner, sample_client, test_db, patch_batch):
+    """Test viewing a client as JSON, with its full details."""
+    sales_collaborator = type("Collaborator", (object,), {"id": 3, "role_id": 1})
+    with (
+        patch("crm.helpers.authorize_helper.get_current_user", return_value=(sales_collaborator, None)),
+        patch("crm.helpers.authorize_helper.relationship_check_switch", return_value=None),
+    ):
+        result = cli_runner.invoke(cli, ["clients", "view", str(sample_client.id), "--format", "jsonl"])
+
+    assert result.exit_code == 0, f"Command failed with exit code {result.exit_code}"
+    row = json.loads(result.output)
+    assert row["id"] == sample_client.id
+    assert row["company_name"] == "Ben Inc"
+
+
+def test_export_csv_to_stdout(sample_client, test_db, patch_batch):
+    runner = CliRunner(mix_stderr=False)
+    result = runner.invoke(cli, ["clients", "export", "--filter-field", "company_name", "--filter-value", "Inc"])
+
+    assert result.exit_code == 0, result.stderr
+    rows = list(csv.DictReader(io.StringIO(result.stdout)))
+    assert [row["email"] for row in rows] == ["Bene@example.com", "john.doe@example.com", "Marce@example.com", "danydoe@example.com"]
+    assert set(rows[0]) == set(Client.INFOS_LABELS)
+    assert "✅ 4 clients exported." in result.stderr
+
+
+def test_export_gzip_jsonl_file(sample_client, test_db, patch_batch, tmp_path):
+    output_path = tmp_path / "clients.jsonl.gz"
+    result = CliRunner(mix_stderr=False).invoke(cli, ["clients", "export", "--format", "jsonl", "--gzip", "--output", str(output_path)])
+
+    assert result.exit_code == 0, result.stderr
+    assert result.stdout == ""
+    with gzip.open(output_path, "rt") as file:
+        rows = [json.loads(line) for line in file]
+    assert len(rows) == 5
+    assert rows[1]["first_name"] == "John"
+
+
+def test_export_gzip_stdout(sample_client, test_db, patch_batch):
+    result = CliRunner(mix_stderr=False).invoke(cli, ["clients", "export", "--gzip"])
+
+    assert result.exit_code == 0, result.stderr
+    lines = gzip.decompress(result.stdout_bytes).decode().splitlines()
+    assert lines[0] == ",".join(Client.INFOS_LABELS)
+    assert len(lines) == 6
@@ -0,0 +1,149 @@
+import csv
+import json
+import pytest
+from unittest.mock import patch
+from crm.models.clients import Client
+from crm.models.contracts import Contract
+from crm.models.events import Event
+from crm.enums.model_type_enum import ModelTypeEnum
+from crm.helpers.import_helper import ImportHelper
+from crm.services.clients import import_clients
+from crm.services.contracts import import_contracts
+from crm.services.events import import_events
+from tests.test_context_db import test_db, cli_runner
+from crm.cli.main import cli
+
+
+@pytest.fixture
+def commercial(test_db):
+    mock_collaborator = type("Collaborator", (object,), {"id": 3, "role_id": 1})
+    with (
+        patch("crm.cli.clients.DB", test_db),
+        patch("crm.cli.events.DB", test_db),
+        patch("crm.services.clients.get_current_user", return_value=(mock_collaborator, None)),
+        patch("crm.services.events.get_current_user", return_value=(mock_collaborator, None)),
+        patch("crm.helpers.authorize_helper.get_current_user", return_value=(mock_collaborator, None)),
+    ):
+        yield mock_collaborator
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=rows[0].keys())
+        writer.writeheader()
+        writer.writerows(rows)
+    return str(path)
+
+
+def client_row(i, **overrides):
+    row = {"first_name": "Import", "last_name": f"Client {i}", "email": f"import{i}@example.com",
+           "phone": "0102030405", "company_name": f"Company {i}", "first_contact_date": "", "last_contact_date": ""}
+    row.update(overrides)
+    return row
+
+
+def test_import_clients_csv(test_db, commercial, tmp_path):
+    file_path = write_csv(tmp_path / "clients.csv", [
+        client_row(1),
+        client_row(2, email="not an email"),
+        client_row(3, first_contact_date="01/02/2025-10h30"),
+        client_row(4, last_name=""),
+    ])
+    report_path = str(tmp_path / "errors.csv")
+
+    import_helper = import_clients(test_db, file_path, report_path=report_path)
+
+    assert (import_helper.imported, import_helper.rejected) == (2, 2)
+    imported = test_db.query(Client).filter(Client.email.like("import%")).order_by(Client.id).all()
+    assert [c.email for c in imported] == ["import1@example.com", "import3@example.com"]
+    assert all(c.commercial_id == commercial.id for c in imported)
+    assert imported[1].first_contact_date.hour == 10
+
+    with open(report_path, newline="") as file:
+        report = list(csv.DictReader(file))
+    assert [row["line"] for row in report] == ["3", "5"]
+    assert "email: Invalid email format." in report[0]["errors"]
+    assert "last_name: This field is required." in report[1]["errors"]
+
+
+def test_import_contracts_jsonl_by_chunks(test_db, tmp_path):
+    file_path = tmp_path / "contracts.jsonl"
+    lines = [json.dumps({"costing": 100 + i, "remaining_due_payment": 50, "is_signed": "yes",
+                         "client_id": 1, "commercial_id": 3, "origin": "legacy"}) for i in range(5)]
+    lines.insert(2, "{not json")
+    lines.append(json.dumps({"costing": 10, "remaining_due_payment": 5, "client_id": 999, "commercial_id": 3}))
+    file_path.write_text("\n".join(lines) + "\n")
+
+    import_helper = import_contracts(test_db, str(file_path), chunk_size=2)
+
+    assert (import_helper.imported, import_helper.rejected) == (5, 2)
+    assert import_helper.ignored_fields == {"origin"}
+    assert test_db.query(Contract).filter(Contract.costing.between(100, 104)).count() == 5
+    assert all(c.is_signed for c in test_db.query(Contract).filter(Contract.costing.between(100, 104)))
+
+
+def test_import_events_rejects_foreign_contracts(test_db, commercial, tmp_path):
+    other_contract = Contract(client_id=1, commercial_id=3, costing=10, remaining_due_payment=0, is_signed=True)
+    test_db.add(other_contract)
+    test_db.commit()
+    test_db.query(Client).filter_by(id=1).update({"commercial_id": None})
+    test_db.add(Client(first_name="Own", last_name="Client", email="own@example.com", phone="0102030405",
+                       company_name="Own", commercial_id=3))
+    test_db.commit()
+    own_client = test_db.query(Client).filter_by(email="own@example.com").one()
+    own_contract = Contract(client_id=own_client.id, commercial_id=3, costing=10, remaining_due_payment=0, is_signed=True)
+    test_db.add(own_contract)
+    test_db.commit()
+
+    event = {"name": "Imported", "location": "1 Main street, 75000 Paris, France", "attendees": "20",
+             "start_date": "01/06/2025-09h00", "end_date": "01/06/2025-18h00"}
+    file_path = write_csv(tmp_path / "events.csv", [
+        {**event, "contract_id": own_contract.id},
+        {**event, "contract_id": other_contract.id},
+    ])
+
+    import_helper = import_events(test_db, file_path, report_path=str(tmp_path / "errors.csv"))
+
+    assert (import_helper.imported, import_helper.rejected) == (1, 1)
+    assert test_db.query(Event).filter_by(name="Imported").one().contract_id == own_contract.id
+
+
+def test_import_isolates_database_errors(test_db, tmp_path):
+    data = {"first_name": "Dup", "last_name": "Client", "email": "dup@example.com",
+            "phone": "0102030405", "company_name": "Dup", "commercial_id": "3"}
+    rows = [(2, dict(data), None), (3, dict(data), None), (4, {**data, "email": "other@example.com"}, None)]
+    report_path = tmp_path / "errors.csv"
+    import_helper = ImportHelper(test_db, ModelTypeEnum.CLIENT, report_path=str(report_path))
+
+    imported, rejected, elapsed = import_helper.import_rows(rows)
+
+    assert (imported, rejected) == (2, 1)
+    assert elapsed >= 0
+    assert test_db.query(Client).filter(Client.email.in_(["dup@example.com", "other@example.com"])).count() == 2
+    assert "Database error" in report_path.read_text()
+
+
+def test_import_command(test_db, commercial, cli_runner, tmp_path):
+    file_path = write_csv(tmp_path / "clients.csv", [client_row(1), client_row(2, phone="phone")])
+
+    result = cli_runner.invoke(cli, ["clients", "import", file_path])
+
+    assert result.exit_code == 0, result.output
+    assert "✅ 1 clients imported" in result.output
+    assert "❌ 1 rows rejected" in result.output
+    assert (tmp_path / "clients.csv.errors.csv").exists()
+
+
+def test_import_rejects_ragged_csv_rows(test_db, commercial, cli_runner, tmp_path):
+    file_path = write_csv(tmp_path / "clients.csv", [client_row(1), client_row(2)])
+    with open(file_path, "a", newline="") as file:
+        file.write("Ragged,Row,ragged@example.com,0102030405,Ragged Inc,,,extra,cells\n")
+
+    result = cli_runner.invoke(cli, ["clients", "import", file_path])
+
+    assert result.exit_code == 0, result.output
+    assert "✅ 2 clients imported" in result.output
+    assert "❌ 1 rows rejected" in result.output
+    assert "Ignored unknown columns" not in result.output
+    report = (tmp_path / "clients.csv.errors.csv").read_text()
+    assert "Unexpected extra columns: 2 more cells than the header" in report
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+from crm.cli.main import cli
+from tests.test_context_db import cli_runner
+
+
+def test_help_lists_lazy_subcommands(cli_runner):
+    """Test the root help lists every subcommand from its declared help."""
+    result = cli_runner.invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name in ["auth", "collaborators", "clients", "contracts", "events"]:
+        assert name in result.output
+    assert "Manage Clients" in result.output
+
+
+def test_subcommand_loaded_on_invoke(cli_runner):
+    """Test a subcommand's module is imported when it is invoked."""
+    result = cli_runner.invoke(cli, ["events", "--help"])
+
+    assert result.exit_code == 0
+    assert "Manage Events" in result.output
+    assert "crm.cli.events" in sys.modules
+
+
+def test_root_help_skips_database(tmp_path):
+    """Test the root help, run as the CLI entry point, imports neither SQLAlchemy nor the models."""
+    script = (
+        "import runpy, sys\n"
+        "sys.argv = ['crm', '--help']\n"
+        "try:\n"
+        "    runpy.run_path('crm/cli/main.py', run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('sqlalchemy' in sys.modules, 'crm.models' in sys.modules)\n"
+    )
+    env = {**os.environ, "DAEMON_SOCKET": str(tmp_path / "missing.sock")}
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, check=True)
+
+    assert "Manage Clients" in result.stdout
+    assert result.stdout.splitlines()[-1] == "False False"
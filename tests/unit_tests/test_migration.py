@@ -0,0 +1,48 @@
+import jwt
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine, inspect, text
+from crm.models import Base
+from crm.models.blacklist_tokens import BlacklistToken
+from crm.helpers.migration_helper import migrate_blacklist_tokens, create_missing_indexes, run_migrations
+from config import SECRET_KEY
+
+
+def test_create_missing_indexes():
+    """Test indexes missing from an existing database are created once."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_events_support_id"))
+        conn.execute(text("DROP INDEX ix_contracts_client_id"))
+
+    assert create_missing_indexes(engine) == ["ix_contracts_client_id", "ix_events_support_id"]
+    assert create_missing_indexes(engine) == []
+
+    index_names = {index["name"] for index in inspect(engine).get_indexes("events")}
+    assert "ix_events_support_id" in index_names
+
+
+def test_migrate_legacy_blacklist_tokens():
+    """Test a raw-token blacklist table is rebuilt keeping only still valid revocations."""
+    engine = create_engine("sqlite:///:memory:")
+    valid_token = jwt.encode({"sub": "1", "exp": datetime.now(timezone.utc) + timedelta(hours=1)}, SECRET_KEY, algorithm="HS256")
+    expired_token = jwt.encode({"sub": "1", "exp": datetime.now(timezone.utc) - timedelta(hours=1)}, SECRET_KEY, algorithm="HS256")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE blacklist_tokens (id INTEGER PRIMARY KEY, token VARCHAR(500) UNIQUE NOT NULL, created_at DATETIME)"))
+        for token in (valid_token, expired_token):
+            conn.execute(text("INSERT INTO blacklist_tokens (token) VALUES (:token)"), {"token": token})
+
+    assert migrate_blacklist_tokens(engine) is True
+    assert migrate_blacklist_tokens(engine) is False
+
+    with engine.connect() as conn:
+        digests = [row[0] for row in conn.execute(text("SELECT token_digest FROM blacklist_tokens"))]
+    assert digests == [BlacklistToken.digest(valid_token)]
+
+
+def test_run_migrations_on_up_to_date_database():
+    """Test migrating a database created from the models does nothing."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+
+    assert run_migrations(engine) == []
@@ -0,0 +1,91 @@
+import time
+import pytest
+from unittest.mock import patch
+from config import REFERENCE_CACHE_TTL
+from crm.models.clients import Client
+from crm.models.collaborators import Collaborator
+from crm.helpers.filter_helper import FilterHelper
+from crm.helpers.search_helper import SearchHelper, SEARCHABLE_MODELS, create_search_indexes, create_sqlite_fts_table, drop_search_indexes
+from tests.test_context_db import test_db, engine
+
+
+@pytest.fixture
+def search_index(test_db):
+    """Create the full-text indexes over the test database."""
+    assert create_search_indexes(engine) is True
+    yield
+    drop_search_indexes(engine)
+
+
+def add_client(db, first_name, last_name, email, company_name):
+    client = Client(
+        first_name=first_name,
+        last_name=last_name,
+        email=email,
+        phone="0102030405",
+        company_name=company_name,
+        commercial_id=3
+    )
+    db.add(client)
+    db.commit()
+    return client
+
+
+def test_global_search_uses_index(test_db, search_index):
+    """Test the global search goes through the full-text index and finds existing rows."""
+    add_client(test_db, "John", "Doe", "john.doe@example.com", "Doe Inc")
+
+    helper = FilterHelper(test_db, Client)
+    assert helper.search_helper.is_indexed()
+
+    results = list(helper.apply_filter(None, "Doe"))
+    assert [c.email for c in results] == ["john.doe@example.com"]
+
+    results = list(helper.apply_filter(None, "Test Comp"))
+    assert [c.email for c in results] == ["testclient@email.com"]
+
+
+def test_index_follows_updates_and_deletes(test_db, search_index):
+    """Test the index is kept in sync with the table."""
+    client = add_client(test_db, "Marc", "Miley", "marc@example.com", "Marc Inc")
+    helper = FilterHelper(test_db, Client)
+
+    client.last_name = "Smith"
+    test_db.commit()
+    assert list(helper.apply_filter(None, "Miley")) == []
+    assert [c.id for c in helper.apply_filter(None, "Smith")] == [client.id]
+
+    test_db.delete(client)
+    test_db.commit()
+    assert list(helper.apply_filter(None, "Smith")) == []
+
+
+def test_password_hash_not_indexed(test_db, search_index):
+    """Test password hashes are left out of the collaborators index."""
+    helper = FilterHelper(test_db, Collaborator)
+
+    assert list(helper.apply_filter(None, "2b")) == []
+
+
+def test_falls_back_without_index(test_db):
+    """Test the global search keeps working without a full-text index."""
+    assert not SearchHelper(test_db, Client).is_indexed()
+
+    results = list(FilterHelper(test_db, Client).apply_filter(None, "est Comp"))
+    assert [c.email for c in results] == ["testclient@email.com"]
+
+
+def test_index_lookup_expires(test_db):
+    """Test an index created by another process is used once the cached lookup expires."""
+    helper = SearchHelper(test_db, Client)
+    assert not helper.is_indexed()
+
+    with engine.begin() as conn:
+        for model in SEARCHABLE_MODELS:
+            create_sqlite_fts_table(conn, model)
+    try:
+        assert not helper.is_indexed()
+        with patch("crm.helpers.cache_helper.time.monotonic", return_value=time.monotonic() + REFERENCE_CACHE_TTL + 1):
+            assert helper.is_indexed()
+    finally:
+        drop_search_indexes(engine)
@@ -0,0 +1,69 @@
+import click
+import pytest
+from unittest.mock import patch
+from crm.cli.main import cli
+from crm.cli.shell import ShellCompleter
+from tests.test_context_db import test_db, cli_runner
+
+
+@pytest.fixture
+def history_file(tmp_path):
+    with patch("crm.cli.shell.SHELL_HISTORY_FILE", str(tmp_path / "history")):
+        yield
+
+
+def test_shell_runs_commands_until_exit(cli_runner, history_file):
+    result = cli_runner.invoke(cli, ["shell"], input="help clients\nclients unknown\nexit\nevents --help\n")
+
+    assert result.exit_code == 0, result.output
+    assert "Manage Clients" in result.output
+    assert "No such command 'unknown'" in result.output
+    assert "Manage Events" not in result.output
+
+
+def test_shell_resolves_collaborator_per_command(cli_runner, history_file, test_db):
+    mock_collaborator = type("Collaborator", (object,), {"id": 3, "role_id": 3})
+    with (
+        patch("crm.cli.clients.DB", test_db),
+        patch("crm.cli.shell.resolve_current_user", return_value=(mock_collaborator, None)) as resolve,
+        patch("crm.helpers.authorize_helper.resolve_current_user") as command_resolve,
+    ):
+        result = cli_runner.invoke(cli, ["shell"], input="clients list\nclients list --format csv\n")
+
+    assert result.exit_code == 0, result.output
+    assert result.output.count("testclient@email.com") == 2
+    assert resolve.call_count == 2
+    command_resolve.assert_not_called()
+
+
+def test_shell_stops_on_expired_token(cli_runner, history_file, test_db):
+    mock_collaborator = type("Collaborator", (object,), {"id": 3, "role_id": 3})
+    expired = (None, "❌ Token is invalid or expired.")
+    with (
+        patch("crm.cli.clients.DB", test_db),
+        patch("crm.cli.shell.resolve_current_user", side_effect=[(mock_collaborator, None), expired]),
+        patch("crm.helpers.authorize_helper.resolve_current_user", return_value=expired),
+    ):
+        result = cli_runner.invoke(cli, ["shell"], input="clients list\nclients list\n")
+
+    assert result.exit_code == 0, result.output
+    assert result.output.count("testclient@email.com") == 1
+    assert "❌ Token is invalid or expired." in result.output
+
+
+def test_completions():
+    ctx = click.Context(cli)
+    completer = ShellCompleter(cli, ctx)
+
+    assert completer.completions("", "cl") == ["clients"]
+    assert "exit" in completer.completions("", "")
+    assert completer.completions("clients ", "li") == ["list"]
+    assert completer.completions("clients list ", "--l") == ["--limit"]
+
+
+def test_shell_reports_cache_counters(cli_runner, history_file):
+    result = cli_runner.invoke(cli, ["shell"], input="cache\n")
+
+    assert result.exit_code == 0, result.output
+    assert "📊 roles:" in result.output
+    assert "📊 collaborators:" in result.output
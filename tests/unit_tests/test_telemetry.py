@@ -0,0 +1,67 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from crm.helpers import telemetry_helper
+from crm.helpers.telemetry_helper import get_telemetry_mode, init_telemetry, capture_exception, command_transaction
+from crm.enums.telemetry_mode_enum import TelemetryModeEnum
+
+
+@pytest.fixture(autouse=True)
+def reset_telemetry():
+    """Reset the lazily initialised SDK between tests."""
+    telemetry_helper._sentry = None
+    yield
+    telemetry_helper._sentry = None
+
+
+def test_unknown_mode_falls_back_to_errors():
+    """Test an unknown TELEMETRY_MODE value falls back to errors-only."""
+    with patch("crm.helpers.telemetry_helper.TELEMETRY_MODE", "verbose"):
+        assert get_telemetry_mode() == TelemetryModeEnum.ERRORS
+
+
+def test_off_mode_never_initialises():
+    """Test telemetry stays uninitialised when turned off."""
+    with (
+        patch("crm.helpers.telemetry_helper.TELEMETRY_MODE", "off"),
+        patch("crm.helpers.telemetry_helper.SENTRY_URL", "https://key@sentry.example/1"),
+        patch("sentry_sdk.init") as mock_init,
+    ):
+        assert init_telemetry() is None
+        capture_exception(ValueError("boom"))
+        mock_init.assert_not_called()
+
+
+def test_errors_mode_disables_tracing_and_bounds_flush():
+    """Test errors-only mode initialises without tracing and flushes with a timeout."""
+    with (
+        patch("crm.helpers.telemetry_helper.TELEMETRY_MODE", "errors"),
+        patch("crm.helpers.telemetry_helper.SENTRY_URL", "https://key@sentry.example/1"),
+        patch("crm.helpers.telemetry_helper.TELEMETRY_FLUSH_TIMEOUT", 0.5),
+        patch("sentry_sdk.init") as mock_init,
+        patch("sentry_sdk.capture_exception") as mock_capture,
+        patch("sentry_sdk.flush") as mock_flush,
+    ):
+        with command_transaction(["clients", "list"]):
+            pass
+        mock_init.assert_not_called()
+
+        capture_exception(ValueError("boom"))
+
+        assert mock_init.call_args.kwargs["traces_sample_rate"] is None
+        assert mock_init.call_args.kwargs["shutdown_timeout"] == 0.5
+        mock_capture.assert_called_once()
+        mock_flush.assert_called_once_with(timeout=0.5)
+
+
+def test_traces_mode_names_transaction_after_command():
+    """Test traces mode wraps the command in a transaction named after it."""
+    with (
+        patch("crm.helpers.telemetry_helper.TELEMETRY_MODE", "traces"),
+        patch("crm.helpers.telemetry_helper.SENTRY_URL", "https://key@sentry.example/1"),
+        patch("sentry_sdk.init"),
+        patch("sentry_sdk.start_transaction", return_value=MagicMock()) as mock_transaction,
+    ):
+        with command_transaction(["clients", "view", "12", "--format", "jsonl"]):
+            pass
+
+        assert mock_transaction.call_args.kwargs["name"] == "crm clients view"
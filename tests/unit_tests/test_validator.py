@@ -0,0 +1,69 @@
+from crm.models.contracts import Contract
+from crm.enums.model_type_enum import ModelTypeEnum
+from crm.helpers.validator_helper import ValidatorHelper
+from tests.test_context_db import test_db, statements
+
+
+def event_data(contract_id, support_id):
+    return {"name": "Batch", "start_date": "01/06/2025-09h00", "end_date": "01/06/2025-18h00",
+            "location": "1 Main street, 75000 Paris, France", "attendees": 10,
+            "contract_id": contract_id, "support_id": support_id}
+
+
+def test_validate_batch_queries_once_per_model(test_db, statements):
+    unsigned_contract = Contract(client_id=1, commercial_id=3, costing=10, remaining_due_payment=0, is_signed=False)
+    test_db.add(unsigned_contract)
+    test_db.commit()
+    unsigned_contract_id = unsigned_contract.id
+    records = [event_data(1, 2) for _ in range(50)] + [
+        event_data(999, 2),
+        event_data(1, 3),
+        event_data(unsigned_contract_id, 2),
+    ]
+
+    statements.clear()
+    validators = ValidatorHelper.validate_batch(test_db, ModelTypeEnum.EVENT, records)
+
+    assert len(statements) == 2
+    assert all(v.is_valid() for v in validators[:50])
+    assert validators[50].error_messages == ["contract_id: No such entry registered in the database"]
+    assert validators[51].error_messages == ["support_id: The given collaborator is not of the authorized role"]
+    assert validators[52].error_messages == ["contract_id: It is not allowed to create an event for an unsigned contract"]
+
+
+def test_validate_batch_matches_single_validation(test_db):
+    records = [
+        {"costing": 10.0, "remaining_due_payment": 5.0, "client_id": 1, "commercial_id": 3},
+        {"costing": 10.0, "remaining_due_payment": 5.0, "client_id": 42, "commercial_id": 1},
+        {"costing": 10.0, "client_id": "1", "commercial_id": 3},
+    ]
+
+    validators = ValidatorHelper.validate_batch(test_db, ModelTypeEnum.CONTRACT, records, check_required_fields=True)
+
+    for data, validator in zip(records, validators):
+        single = ValidatorHelper(test_db, ModelTypeEnum.CONTRACT, data)
+        single.validate_required_fields()
+        single.validate_data()
+        assert validator.error_messages == single.error_messages
+    assert not validators[1].is_valid()
+
+
+def test_invalid_record_skips_database_checks(test_db, statements):
+    data = {"first_name": "Jane", "last_name": "Doe", "email": "not an email", "phone": "0102030405",
+            "company_name": "Doe", "commercial_id": 999}
+
+    validator = ValidatorHelper(test_db, ModelTypeEnum.CLIENT, data)
+    validator.validate_data()
+
+    assert validator.error_messages == ["email: Invalid email format."]
+    assert statements == []
+
+
+def test_schema_compiled_once(test_db):
+    first = ValidatorHelper.compile_schema(ModelTypeEnum.EVENT)
+    ValidatorHelper(test_db, ModelTypeEnum.EVENT, event_data(1, 2)).validate_data()
+
+    field_rules, database_rules = ValidatorHelper.compile_schema(ModelTypeEnum.EVENT)
+    assert ValidatorHelper.compile_schema(ModelTypeEnum.EVENT) is first
+    assert [rule[0] for rule in database_rules] == ["contract_id", "support_id"]
+    assert field_rules[-1][0] in ("start_date", "end_date")